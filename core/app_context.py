@@ -7,11 +7,198 @@ settings, and common operations without tight coupling to the main window.
 
 import logging
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Callable, List, Optional, Tuple
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_STRUCTURE_FIELD_RE = re.compile(r'(\{customer\}|\{job_folder\}|\{po_number\})')
+
+
+@lru_cache(maxsize=16)
+def _split_structure(structure: str) -> Tuple[str, ...]:
+    """Split a folder structure template into alternating literal / placeholder parts."""
+    return tuple(_STRUCTURE_FIELD_RE.split(structure))
+
+
+@lru_cache(maxsize=16)
+def _job_folder_layout(structure: str) -> Tuple[str, ...]:
+    """
+    Parse where job folders sit under a customer folder in a structure template.
+
+    Returns one of:
+        ('direct', suffix) - customer/{job_folder}/suffix
+        ('po', pre_po, post_po, suffix) - job folders grouped under PO folders
+        ('nested', prefix, suffix) - customer/prefix/{job_folder}/suffix
+        ('none',) - no usable {job_folder} placeholder
+    """
+    after_customer = structure.split('{customer}/', 1)[-1] if '{customer}/' in structure else structure
+    if after_customer.startswith('{job_folder}/'):
+        return ('direct', after_customer.replace('{job_folder}/', '', 1))
+    parts = after_customer.split('{job_folder}')
+    if len(parts) != 2:
+        return ('none',)
+    prefix = parts[0].strip('/')
+    suffix = parts[1].strip('/')
+    if '{po_number}' in prefix:
+        po_parts = prefix.split('{po_number}')
+        pre_po = po_parts[0].strip('/')
+        post_po = po_parts[1].strip('/') if len(po_parts) > 1 else ''
+        return ('po', pre_po, post_po, suffix)
+    return ('nested', prefix, suffix)
+
+
+# Subdirectory names per directory, invalidated by the directory's own mtime
+# (creating, removing or renaming an entry inside it bumps the mtime)
+_subdir_cache: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+# Listings whose directory changed more recently than this are not cached:
+# coarse timestamps (FAT, some network shares) could hide a second change
+# made within the same tick
+_MTIME_SETTLE_NS = 2_000_000_000
+
+# Customer folders scanned concurrently by map_job_folders; listing a share
+# is latency-bound, and the scans release the GIL while waiting on it
+_SCAN_WORKERS = 8
+
+
+def list_subdirs(path: str) -> Tuple[str, ...]:
+    """
+    Return the names of the subdirectories of a directory (unsorted).
+
+    Repeat calls are answered from a cache while the directory's mtime is
+    unchanged, so refreshing customer lists doesn't re-read the share.
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _subdir_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with os.scandir(path) as it:
+        names = tuple(e.name for e in it if e.is_dir())
+    if time.time_ns() - mtime > _MTIME_SETTLE_NS:
+        _subdir_cache[path] = (mtime, names)
+    return names
+
+
+# Job folders per customer directory for the 'direct' layout, keyed by
+# (customer_path, suffix) and invalidated by the customer directory's mtime.
+# Every subdirectory is kept with its own mtime too: creating, removing or
+# renaming the suffix folder inside one doesn't touch the customer directory
+_job_dir_cache: Dict[Tuple[str, str], Tuple[int, Tuple[Tuple[str, str], ...], Tuple[Tuple[str, int], ...]]] = {}
+
+
+def _dirs_unchanged(dir_mtimes: Iterable[Tuple[str, int]]) -> bool:
+    """Whether each (path, mtime_ns) pair still matches the directory on disk"""
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes)
+    except OSError:
+        return False
+
+
+def settled_mtime(path: str) -> Optional[int]:
+    """
+    Return a directory's mtime_ns to check later with dirs_unchanged.
+
+    Take it before reading the directory. Returns None if the directory
+    can't be stat'ed or changed within the settle window, since a listing
+    made then can't be trusted to stay valid while the mtime holds.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return mtime if time.time_ns() - mtime > _MTIME_SETTLE_NS else None
+
+
+def dirs_unchanged(dir_mtimes: Iterable[Tuple[str, Optional[int]]]) -> bool:
+    """Whether each (path, settled_mtime) pair was settled and still matches the directory on disk"""
+    dir_mtimes = tuple(dir_mtimes)
+    return all(mtime is not None for _, mtime in dir_mtimes) and _dirs_unchanged(dir_mtimes)
+
+
+def _list_job_dirs(parent: str, suffix: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Return the job folders directly under parent, cached by mtime.
+
+    Same result as _scan_job_dirs, but repeat calls are answered from a
+    cache while parent and its subdirectories are unchanged, so back-to-back duplicate checks and tree loads don't
+    re-read the share.
+
+    Raises:
+        OSError: If parent cannot be read
+    """
+    mtime = os.stat(parent).st_mtime_ns
+    key = (parent, suffix)
+    cached = _job_dir_cache.get(key)
+    if cached is not None and cached[0] == mtime and _dirs_unchanged(cached[2]):
+        return cached[1]
+
+    jobs = []
+    subdir_mtimes = []
+    with os.scandir(parent) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            if suffix:
+                # Stat before checking for the suffix, so a change made
+                # in between shows up as a newer mtime on the next call
+                subdir_mtimes.append((entry.path, entry.stat().st_mtime_ns))
+                expected_docs_path = os.path.join(entry.path, suffix)
+                if os.path.exists(expected_docs_path):
+                    jobs.append((entry.name, expected_docs_path))
+            else:
+                jobs.append((entry.name, entry.path))
+    result = tuple(jobs)
+    newest = max([mtime] + [subdir_mtime for _, subdir_mtime in subdir_mtimes])
+    if time.time_ns() - newest > _MTIME_SETTLE_NS:
+        _job_dir_cache[key] = (mtime, result, tuple(subdir_mtimes))
+    return result
+
+
+def forget_job_dirs(path: str) -> None:
+    """Drop cached job folder listings for path and the directories above it"""
+    path = os.path.normpath(path)
+    for key in list(_job_dir_cache):
+        parent = os.path.normpath(key[0])
+        if path == parent or path.startswith(parent.rstrip(os.sep) + os.sep):
+            _job_dir_cache.pop(key, None)
+
+
+def _scan_job_dirs(parent: str, suffix: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield the job folders directly under parent (unsorted).
+
+    Uses os.scandir so the directory check comes from the listing itself
+    rather than a stat per entry.
+
+    Args:
+        parent: Directory holding the job folders
+        suffix: Subpath each job folder must contain; empty accepts every
+            subdirectory
+
+    Yields:
+        (job_name, job_docs_path) tuples
+
+    Raises:
+        OSError: If parent cannot be read
+    """
+    with os.scandir(parent) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            if suffix:
+                expected_docs_path = os.path.join(entry.path, suffix)
+                if os.path.exists(expected_docs_path):
+                    yield entry.name, expected_docs_path
+            else:
+                yield entry.name, entry.path
+
 
 class AppContext:
     """
@@ -66,6 +253,9 @@ class AppContext:
         self._add_to_history = add_to_history_callback
         self._main_window = main_window
         self._print_provider = None
+        self._history_job_index: Dict[str, Dict[str, Any]] = {}
+        self._history_job_index_key: Optional[Tuple[int, int, int]] = None
+        self._scan_pool: Optional[ThreadPoolExecutor] = None
 
     @property
     def settings(self) -> Dict[str, Any]:
@@ -146,6 +336,58 @@ class AppContext:
         """
         return self._get_customer_list()
 
+    def list_subdirs(self, path: str) -> Tuple[str, ...]:
+        """
+        Get the subdirectory names of a directory, cached by its mtime.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            Tuple of subdirectory names (unsorted)
+
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        return list_subdirs(path)
+
+    def settled_mtime(self, path: str) -> Optional[int]:
+        """
+        Get a directory's mtime for a later dirs_unchanged check.
+
+        Args:
+            path: Directory about to be read
+
+        Returns:
+            The mtime in nanoseconds, or None if it can't be stat'ed or
+            changed too recently to be relied on
+        """
+        return settled_mtime(path)
+
+    def dirs_unchanged(self, dir_mtimes: Iterable[Tuple[str, Optional[int]]]) -> bool:
+        """
+        Check whether directories are unchanged since settled_mtime was taken.
+
+        Args:
+            dir_mtimes: (path, settled_mtime) pairs
+
+        Returns:
+            True if every mtime was settled and still matches the disk
+        """
+        return dirs_unchanged(dir_mtimes)
+
+    def forget_job_folders(self, path: str):
+        """
+        Drop cached job folder listings that a new folder at path belongs to.
+
+        Called after creating a job, so duplicate checks and the job tree
+        don't have to wait for the customer folder's mtime to settle.
+
+        Args:
+            path: The new job folder (or anything inside it)
+        """
+        forget_job_dirs(path)
+
     def add_to_history(self, entry_type: str, data: Dict[str, Any]):
         """
         Add an entry to the application history.
@@ -156,6 +398,29 @@ class AppContext:
         """
         self._add_to_history(entry_type, data)
 
+    def find_history_job(self, job_number: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the newest recent_jobs entry for a job number.
+
+        The job-number index is rebuilt only when the recent_jobs list has
+        changed (replaced, grown, or had a new entry inserted at the front).
+
+        Args:
+            job_number: Job number to look up (case-insensitive)
+
+        Returns:
+            The history entry, or None if the job isn't in recent history
+        """
+        recent_jobs = self._history.get('recent_jobs', [])
+        key = (id(recent_jobs), len(recent_jobs), id(recent_jobs[0]) if recent_jobs else 0)
+        if key != self._history_job_index_key:
+            index: Dict[str, Dict[str, Any]] = {}
+            for job in recent_jobs:
+                index.setdefault(job.get('job_number', '').lower(), job)
+            self._history_job_index = index
+            self._history_job_index_key = key
+        return self._history_job_index.get(job_number.lower())
+
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
         Get a setting value with optional default.
@@ -217,12 +482,11 @@ class AppContext:
         """
         structure = self._settings.get('job_folder_structure', '{customer}/{po_number}/{job_folder}')
 
-        # Replace placeholders
-        path_str = (
-            structure
-            .replace('{customer}', customer)
-            .replace('{job_folder}', job_folder_name)
-            .replace('{po_number}', po_number)
+        # Fill placeholders from the template parsed once per structure string
+        values = {'{customer}': customer, '{job_folder}': job_folder_name, '{po_number}': po_number}
+        path_str = ''.join(
+            values[part] if i % 2 else part
+            for i, part in enumerate(_split_structure(structure))
         )
 
         # Clean up any double slashes from empty placeholders
@@ -230,10 +494,6 @@ class AppContext:
         # Remove leading/trailing slashes
         path_str = path_str.strip('/')
 
-        # Replace PO number placeholder if present
-        if '{po_number}' in path_str:
-            path_str = path_str.replace('{po_number}', po_number if po_number else '')
-
         return Path(base_dir) / path_str
 
     def find_job_folders(self, customer_path: str, *, errors: Optional[List[OSError]] = None) -> List[Tuple[str, str]]:
@@ -246,78 +506,130 @@ class AppContext:
         Returns:
             List of (job_name, job_docs_path) tuples
         """
+        jobs = list(self.iter_job_folders(customer_path, errors=errors))
+        logger.debug("find_job_folders: returning %d jobs from %s", len(jobs), customer_path)
+        return jobs
+
+    def iter_job_folders(
+            self, customer_path: str, *, errors: Optional[List[OSError]] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Yield the job folders in a customer directory as they are listed.
+
+        Like find_job_folders, but callers that filter the jobs or stop at
+        the first match don't hold (or wait for) the whole listing.
+
+        Args:
+            customer_path: Path to customer directory
+            errors: If given, OSErrors hit while listing are appended here
+                (they are otherwise only logged)
+
+        Yields:
+            (job_name, job_docs_path) tuples
+        """
         structure = self._settings.get('job_folder_structure', '{customer}/{job_folder}/job documents')
-        logger.debug("find_job_folders: customer=%s structure=%s", customer_path, structure)
+        logger.debug("iter_job_folders: customer=%s structure=%s", customer_path, structure)
 
-        after_customer = structure.split('{customer}/', 1)[-1] if '{customer}/' in structure else structure
-        jobs = []
+        layout = _job_folder_layout(structure)
+        kind = layout[0]
 
-        if after_customer.startswith('{job_folder}/'):
-            suffix = after_customer.replace('{job_folder}/', '', 1)
+        if kind == 'direct':
+            _, suffix = layout
             try:
-                for item in os.listdir(customer_path):
-                    item_path = os.path.join(customer_path, item)
-                    if os.path.isdir(item_path):
-                        expected_docs_path = os.path.join(item_path, suffix)
-                        if os.path.exists(expected_docs_path):
-                            jobs.append((item, expected_docs_path))
+                yield from _list_job_dirs(customer_path, suffix)
             except OSError as e:
-                logger.debug("find_job_folders: OSError %s", e)
+                logger.debug("iter_job_folders: OSError %s", e)
                 if errors is not None:
                     errors.append(e)
-        else:
-            parts = after_customer.split('{job_folder}')
-            if len(parts) == 2:
-                prefix = parts[0].strip('/')
-                suffix = parts[1].strip('/')
-
-                if '{po_number}' in prefix:
-                    po_parts = prefix.split('{po_number}')
-                    pre_po = po_parts[0].strip('/')
-                    post_po = po_parts[1].strip('/') if len(po_parts) > 1 else ''
-                    base_path = os.path.join(customer_path, pre_po) if pre_po else customer_path
-                    if os.path.exists(base_path):
-                        try:
-                            for po_dir in sorted(os.listdir(base_path)):
-                                po_path = os.path.join(base_path, po_dir)
-                                if not os.path.isdir(po_path):
-                                    continue
-                                sub_path = os.path.join(po_path, post_po) if post_po else po_path
-                                if not os.path.exists(sub_path):
-                                    continue
-                                for item in sorted(os.listdir(sub_path)):
-                                    item_path = os.path.join(sub_path, item)
-                                    if os.path.isdir(item_path):
-                                        if suffix:
-                                            expected_docs_path = os.path.join(item_path, suffix)
-                                            if os.path.exists(expected_docs_path):
-                                                jobs.append((item, expected_docs_path))
-                                        else:
-                                            jobs.append((item, item_path))
-                        except OSError as e:
-                            logger.debug("find_job_folders: OSError enumerating PO dirs: %s", e)
-                            if errors is not None:
-                                errors.append(e)
-                else:
-                    prefix_path = os.path.join(customer_path, prefix) if prefix else customer_path
-                    if os.path.exists(prefix_path):
-                        try:
-                            for item in os.listdir(prefix_path):
-                                item_path = os.path.join(prefix_path, item)
-                                if os.path.isdir(item_path):
-                                    if suffix:
-                                        expected_docs_path = os.path.join(item_path, suffix)
-                                        if os.path.exists(expected_docs_path):
-                                            jobs.append((item, expected_docs_path))
-                                    else:
-                                        jobs.append((item, item_path))
-                        except OSError as e:
-                            logger.debug("find_job_folders: OSError: %s", e)
-                            if errors is not None:
-                                errors.append(e)
+        elif kind == 'po':
+            _, pre_po, post_po, suffix = layout
+            base_path = os.path.join(customer_path, pre_po) if pre_po else customer_path
+            if os.path.exists(base_path):
+                try:
+                    with os.scandir(base_path) as it:
+                        po_paths = sorted(e.path for e in it if e.is_dir())
+                    for po_path in po_paths:
+                        sub_path = os.path.join(po_path, post_po) if post_po else po_path
+                        if not os.path.exists(sub_path):
+                            continue
+                        yield from sorted(_scan_job_dirs(sub_path, suffix))
+                except OSError as e:
+                    logger.debug("iter_job_folders: OSError enumerating PO dirs: %s", e)
+                    if errors is not None:
+                        errors.append(e)
+        elif kind == 'nested':
+            _, prefix, suffix = layout
+            prefix_path = os.path.join(customer_path, prefix) if prefix else customer_path
+            if os.path.exists(prefix_path):
+                try:
+                    yield from _scan_job_dirs(prefix_path, suffix)
+                except OSError as e:
+                    logger.debug("iter_job_folders: OSError: %s", e)
+                    if errors is not None:
+                        errors.append(e)
+
+    def shutdown(self):
+        """
+        Stop the map_job_folders scan threads; called on close once modules are cleaned up.
 
-        logger.debug("find_job_folders: returning %d jobs from %s", len(jobs), customer_path)
-        return jobs
+        Queued scans are cancelled rather than run. A later map_job_folders
+        call starts a new pool.
+        """
+        pool, self._scan_pool = self._scan_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def map_job_folders(self, customer_paths: Iterable[str]) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Run find_job_folders over several customer directories concurrently.
+
+        Results are yielded in the order of customer_paths. Closing the
+        iterator early (e.g. breaking out of the loop) cancels scans that
+        haven't started yet.
+
+        Args:
+            customer_paths: Customer directories to scan
+
+        Returns:
+            Iterator of (job_name, job_docs_path) lists, one per path
+        """
+        if self._scan_pool is None:
+            self._scan_pool = ThreadPoolExecutor(
+                max_workers=_SCAN_WORKERS, thread_name_prefix='job-scan'
+            )
+        futures = [self._scan_pool.submit(self.find_job_folders, path) for path in customer_paths]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def scan_existing_jobs(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Index every job folder under the standard and ITAR customer files dirs.
+
+        One crawl answers any number of duplicate-job checks, instead of
+        walking every customer folder once per job number.
+
+        Returns:
+            Dict mapping lower-cased job number (the folder name up to the
+            first underscore) to (customer, job_name); the first folder
+            found wins
+        """
+        existing: Dict[str, Tuple[str, str]] = {}
+        for dir_key in ('customer_files_dir', 'itar_customer_files_dir'):
+            cf_dir = self._settings.get(dir_key, '')
+            if not cf_dir or not os.path.exists(cf_dir):
+                continue
+            try:
+                customers = list_subdirs(cf_dir)
+            except OSError:
+                continue
+            customer_paths = [os.path.join(cf_dir, customer) for customer in customers]
+            for customer, jobs in zip(customers, self.map_job_folders(customer_paths)):
+                for job_name, _job_docs_path in jobs:
+                    existing.setdefault(job_name.split('_', 1)[0].lower(), (customer, job_name))
+        return existing
 
     def find_quote_folders(self, customer_path: str) -> List[Tuple[str, str]]:
         """
@@ -167,8 +167,10 @@ class BaseModule(ABC):
         Only files whose extension matches the configured blueprint extensions are checked —
         non-drawing files (.msg, .docx, etc.) are always documents and need no prompt.
         """
-        from shared.utils import classify_document
-        bp_exts = [e.lower() for e in self.app_context.get_setting('blueprint_extensions', ['.pdf', '.dwg', '.dxf'])]
+        from shared.utils import blueprint_extension_set, classify_document
+        bp_exts = blueprint_extension_set(
+            self.app_context.get_setting('blueprint_extensions', ['.pdf', '.dwg', '.dxf'])
+        )
         for path in list(newly_added):
             if Path(path).suffix.lower() not in bp_exts:
                 continue
@@ -12,12 +12,13 @@ import re
 import sqlite3
 import time
 from contextlib import closing
-from datetime import datetime
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_LEADING_DIGITS_RE = re.compile(r'^(\d+)')
+
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS jobs (
     id          INTEGER PRIMARY KEY,
@@ -146,6 +147,12 @@ def _like_prefix(path: str) -> str:
     return path.replace('!', '!!').replace('%', '!%').replace('_', '!_') + os.sep + '%'
 
 
+def leading_job_number(name: str) -> str:
+    """Return the run of digits a folder name starts with, or '' if it doesn't start with one."""
+    m = _LEADING_DIGITS_RE.match(name)
+    return m.group(1) if m else ''
+
+
 def _parse_job_folder(dir_name: str) -> Tuple[str, str, List[str]]:
     """Extract (job_number, description, drawings) from a folder name.
 
@@ -153,7 +160,7 @@ def _parse_job_folder(dir_name: str) -> Tuple[str, str, List[str]]:
     that start with a job number but use spaces, dashes, or no separator
     (e.g. '12345 Bracket Assembly', '12345-Shaft').
     """
-    m = re.match(r'^(\d+)', dir_name)
+    m = _LEADING_DIGITS_RE.match(dir_name)
     if not m:
         return '', dir_name, []
     job_number = m.group(1)
@@ -162,17 +169,15 @@ def _parse_job_folder(dir_name: str) -> Tuple[str, str, List[str]]:
     if not remainder:
         return job_number, '', []
 
-    if '_' in remainder:
-        parts = remainder.split('_')
-        if '-' in parts[-1]:
-            drawings = [d.strip() for d in parts[-1].split('-') if d.strip()]
-            desc = ' '.join(parts[:-1])
-        else:
-            drawings = []
-            desc = ' '.join(parts)
+    # rpartition splits off the drawings segment without building a list of
+    # every underscore-separated part; replace() then joins the description
+    head, sep, tail = remainder.rpartition('_')
+    if sep and '-' in tail:
+        drawings = [d for d in map(str.strip, tail.split('-')) if d]
+        desc = head.replace('_', ' ')
     else:
         drawings = []
-        desc = remainder
+        desc = remainder.replace('_', ' ')
 
     return job_number, desc, drawings
 
@@ -661,7 +666,7 @@ class SearchIndex:
             prefix = row['prefix']
             display_customer = f"[ITAR] {row['customer']}" if prefix == 'ITAR' else row['customer']
             results.append({
-                'date': datetime.fromtimestamp(row['mtime']),
+                'mtime': row['mtime'],
                 'customer': display_customer,
                 'job_number': row['job_number'],
                 'description': row['description'],
@@ -692,7 +697,7 @@ class SearchIndex:
             else:
                 display_customer = customer or ''
             results.append({
-                'date': datetime.fromtimestamp(row['mtime']),
+                'mtime': row['mtime'],
                 'customer': display_customer,
                 'job_number': row['name_no_ext'],
                 'description': row['rel_path'] if row['rel_path'] != '.' else '',
@@ -9,17 +9,33 @@ Provides a UI for configuring application settings including:
 - Experimental features
 """
 
+import re
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QGroupBox, QLabel, QLineEdit, QPushButton, QCheckBox,
     QRadioButton, QButtonGroup, QComboBox, QScrollArea,
-    QWidget, QFrame, QDialogButtonBox, QFileDialog,
+    QWidget, QFrame, QDialogButtonBox,
     QStyleFactory
 )
 
 from shared.utils import get_os_type, get_os_text
+from shared.widgets import get_existing_directory
+
+# Extensions may be separated by commas and/or whitespace
+_EXT_SPLIT_RE = re.compile(r'[,\s]+')
+
+# Style plugins don't change while the app runs; enumerate them once
+_AVAILABLE_STYLES: Optional[List[str]] = None
+
+
+def _available_styles() -> List[str]:
+    global _AVAILABLE_STYLES
+    if _AVAILABLE_STYLES is None:
+        _AVAILABLE_STYLES = QStyleFactory.keys()
+    return _AVAILABLE_STYLES
 
 
 class SettingsDialog(QDialog):
@@ -30,15 +46,24 @@ class SettingsDialog(QDialog):
                  save_callback: Optional[Callable[..., Any]] = None,
                  active_keys: Optional[set] = None):
         super().__init__(parent)
-        self.settings = settings.copy()
+        # Edited in place, and only by save() once the user accepts, so
+        # there's no need to copy the caller's dict up front
+        self.settings = settings
         self._active_keys = active_keys  # keys present in DEFAULT_SETTINGS; None means show all
         self.available_modules = available_modules or []  # List of (module_name, display_name) tuples
         self.module_checkboxes = {}  # Store module checkboxes
+        self._dir_edits = []  # (QLineEdit, setting_key) pairs built by _dir_row
         self._save_callback = save_callback  # Called to persist settings to disk mid-dialog
         self.setWindowTitle("Settings")
         self.setMinimumWidth(600)
         self.resize(630, 500)
         self.setup_ui()
+        self._load_values()
+
+    def reload(self, settings: Dict[str, Any]):
+        """Reset every field from settings so the dialog can be shown again."""
+        self.settings = settings
+        self._load_values()
 
     # ------------------------------------------------------------------
     def _active(self, key: str) -> bool:
@@ -51,11 +76,12 @@ class SettingsDialog(QDialog):
         h = QHBoxLayout(row)
         h.setContentsMargins(0, 2, 0, 2)
         h.addWidget(QLabel(label_text))
-        edit = QLineEdit(self.settings.get(setting_key, ''))
+        edit = QLineEdit()
         setattr(self, attr_name, edit)
+        self._dir_edits.append((edit, setting_key))
         h.addWidget(edit, 1)
         btn = QPushButton("Browse...")
-        btn.clicked.connect(lambda checked=False, e=edit: self.browse_dir(e))
+        btn.clicked.connect(partial(self.browse_dir, edit))
         h.addWidget(btn)
         row.setVisible(self._active(setting_key))
         parent_layout.addWidget(row)
@@ -101,13 +127,6 @@ class SettingsDialog(QDialog):
         self.link_type_group.addButton(self.hard_radio, 0)
         self.link_type_group.addButton(self.symbolic_radio, 1)
         self.link_type_group.addButton(self.copy_radio, 2)
-        link_type = self.settings.get('link_type', 'hard')
-        if link_type == 'hard':
-            self.hard_radio.setChecked(True)
-        elif link_type == 'symbolic':
-            self.symbolic_radio.setChecked(True)
-        else:
-            self.copy_radio.setChecked(True)
         link_layout.addWidget(self.hard_radio)
         link_layout.addWidget(self.symbolic_radio)
         link_layout.addWidget(self.copy_radio)
@@ -127,9 +146,7 @@ class SettingsDialog(QDialog):
         ext_group = QGroupBox("Blueprint File Types")
         ext_layout = QVBoxLayout(ext_group)
         ext_layout.addWidget(QLabel("Files with these extensions go to blueprints folder:"))
-        self.extensions_edit = QLineEdit(
-            ', '.join(self.settings.get('blueprint_extensions', ['.pdf', '.dwg', '.dxf']))
-        )
+        self.extensions_edit = QLineEdit()
         ext_layout.addWidget(self.extensions_edit)
         ext_layout.addWidget(QLabel("(comma-separated, e.g., .pdf, .dwg, .dxf)"))
         ext_group.setVisible(self._active('blueprint_extensions'))
@@ -140,34 +157,28 @@ class SettingsDialog(QDialog):
         options_layout = QVBoxLayout(options_group)
 
         self.allow_duplicates_check = QCheckBox("Allow duplicate job numbers (not recommended)")
-        self.allow_duplicates_check.setChecked(self.settings.get('allow_duplicate_jobs', False))
         self.allow_duplicates_check.setVisible(self._active('allow_duplicate_jobs'))
         options_layout.addWidget(self.allow_duplicates_check)
 
         self.skip_images_check = QCheckBox("Skip image attachments (.jpg, .png, etc.) when extracting emails")
-        self.skip_images_check.setChecked(self.settings.get('skip_image_attachments', True))
         self.skip_images_check.setToolTip("Skips inline signature images when extracting email attachments.")
         self.skip_images_check.setVisible(self._active('skip_image_attachments'))
         options_layout.addWidget(self.skip_images_check)
 
+        self.native_dialogs_check = QCheckBox("Use native file dialogs")
+        self.native_dialogs_check.setToolTip(
+            "Uses the operating system's file picker, which opens large folders faster.\n"
+            "Turn off if file dialogs misbehave on your desktop."
+        )
+        self.native_dialogs_check.setVisible(self._active('native_file_dialogs'))
+        options_layout.addWidget(self.native_dialogs_check)
+
         default_tab_row = QWidget()
         default_tab_h = QHBoxLayout(default_tab_row)
         default_tab_h.setContentsMargins(0, 0, 0, 0)
         default_tab_h.addWidget(QLabel("Default opening tab:"))
         self.default_tab_combo = QComboBox()
-        disabled = self.settings.get('disabled_modules', [])
         self._tab_display_names = []
-        for module_name, display_name in self.available_modules:
-            if module_name not in disabled:
-                self.default_tab_combo.addItem(display_name)
-                self._tab_display_names.append(display_name)
-        if self.default_tab_combo.count() == 0:
-            self.default_tab_combo.addItem("(no modules enabled)")
-            self.default_tab_combo.setEnabled(False)
-        else:
-            current_default = self.settings.get('default_tab', '')
-            if isinstance(current_default, str) and current_default in self._tab_display_names:
-                self.default_tab_combo.setCurrentIndex(self._tab_display_names.index(current_default))
         default_tab_h.addWidget(self.default_tab_combo)
         default_tab_h.addStretch()
         default_tab_row.setVisible(self._active('default_tab'))
@@ -176,6 +187,7 @@ class SettingsDialog(QDialog):
         options_group.setVisible(
             self._active('allow_duplicate_jobs') or
             self._active('skip_image_attachments') or
+            self._active('native_file_dialogs') or
             self._active('default_tab')
         )
         scroll_layout.addWidget(options_group)
@@ -185,10 +197,8 @@ class SettingsDialog(QDialog):
             modules_group = QGroupBox("Modules")
             modules_layout = QVBoxLayout(modules_group)
             modules_layout.addWidget(QLabel("Enable or disable modules (requires restart):"))
-            disabled_modules = self.settings.get('disabled_modules', [])
             for module_name, display_name in sorted(self.available_modules, key=lambda x: x[1]):
                 checkbox = QCheckBox(display_name)
-                checkbox.setChecked(module_name not in disabled_modules)
                 self.module_checkboxes[module_name] = checkbox
                 modules_layout.addWidget(checkbox)
             scroll_layout.addWidget(modules_group)
@@ -198,11 +208,7 @@ class SettingsDialog(QDialog):
         appearance_layout = QGridLayout(appearance_group)
         appearance_layout.addWidget(QLabel("UI Style:"), 0, 0)
         self.style_combo = QComboBox()
-        available_styles = QStyleFactory.keys()
-        self.style_combo.addItems(available_styles)
-        current_style = self.settings.get('ui_style', 'Fusion')
-        if current_style in available_styles:
-            self.style_combo.setCurrentText(current_style)
+        self.style_combo.addItems(_available_styles())
         appearance_layout.addWidget(self.style_combo, 0, 1)
         appearance_layout.addWidget(QLabel("(restart required)"), 0, 2)
         appearance_group.setVisible(self._active('ui_style'))
@@ -212,11 +218,11 @@ class SettingsDialog(QDialog):
         remote_group = QGroupBox("Remote Sync")
         remote_layout = QGridLayout(remote_group)
         remote_layout.addWidget(QLabel("Remote Server Path:"), 0, 0)
-        self.remote_server_edit = QLineEdit(self.settings.get('remote_server_path', ''))
+        self.remote_server_edit = QLineEdit()
         self.remote_server_edit.setPlaceholderText(r"\\server\share\jobdocs or /mnt/share/jobdocs")
         remote_layout.addWidget(self.remote_server_edit, 0, 1)
         remote_browse_btn = QPushButton("Browse...")
-        remote_browse_btn.clicked.connect(lambda: self.browse_dir(self.remote_server_edit))
+        remote_browse_btn.clicked.connect(partial(self.browse_dir, self.remote_server_edit))
         remote_layout.addWidget(remote_browse_btn, 0, 2)
         remote_info = QLabel("Settings and history will sync to/from remote server on startup/shutdown")
         remote_info.setWordWrap(True)
@@ -246,9 +252,7 @@ class SettingsDialog(QDialog):
         _js_vbox.addWidget(QLabel("Available placeholders: {customer}, {job_folder}, {po_number}"))
         _js_vbox.addWidget(QLabel(f"Default: {path_example}"))
         _js_vbox.addWidget(QLabel(f"Legacy: {legacy_example}"))
-        self.job_structure_edit = QLineEdit(
-            self.settings.get('job_folder_structure', '{customer}/{job_folder}/job documents')
-        )
+        self.job_structure_edit = QLineEdit()
         _js_vbox.addWidget(self.job_structure_edit)
         _job_struct_block.setVisible(self._active('job_folder_structure'))
         advanced_content_layout.addWidget(_job_struct_block)
@@ -257,18 +261,16 @@ class SettingsDialog(QDialog):
         _q_vbox = QVBoxLayout(_quote_block)
         _q_vbox.setContentsMargins(0, 0, 0, 0)
         _q_vbox.addWidget(QLabel("Quote Folder Path:"))
-        self.quote_folder_edit = QLineEdit(self.settings.get('quote_folder_path', 'Quotes'))
+        self.quote_folder_edit = QLineEdit()
         _q_vbox.addWidget(self.quote_folder_edit)
         _quote_block.setVisible(self._active('quote_folder_path'))
         advanced_content_layout.addWidget(_quote_block)
 
         self.legacy_mode_check = QCheckBox("Enable legacy mode (shows 'Search All Folders' option)")
-        self.legacy_mode_check.setChecked(self.settings.get('legacy_mode', True))
         self.legacy_mode_check.setVisible(self._active('legacy_mode'))
         advanced_content_layout.addWidget(self.legacy_mode_check)
 
         self.experimental_check = QCheckBox("Enable experimental features (Reporting)")
-        self.experimental_check.setChecked(self.settings.get('experimental_features', False))
         self.experimental_check.setToolTip("Enables experimental features. Requires restart.")
         self.experimental_check.setVisible(self._active('experimental_features'))
         advanced_content_layout.addWidget(self.experimental_check)
@@ -293,59 +295,117 @@ class SettingsDialog(QDialog):
         button_box.rejected.connect(self.reject)
         main_layout.addWidget(button_box)
 
+    def _load_values(self):
+        """Populate the widgets built by setup_ui from self.settings."""
+        settings = self.settings
+        for edit, setting_key in self._dir_edits:
+            edit.setText(settings.get(setting_key, ''))
+
+        link_type = settings.get('link_type', 'hard')
+        if link_type == 'hard':
+            self.hard_radio.setChecked(True)
+        elif link_type == 'symbolic':
+            self.symbolic_radio.setChecked(True)
+        else:
+            self.copy_radio.setChecked(True)
+
+        self.extensions_edit.setText(
+            ', '.join(sorted(settings.get('blueprint_extensions', ['.pdf', '.dwg', '.dxf'])))
+        )
+        self.allow_duplicates_check.setChecked(settings.get('allow_duplicate_jobs', False))
+        self.skip_images_check.setChecked(settings.get('skip_image_attachments', True))
+        self.native_dialogs_check.setChecked(settings.get('native_file_dialogs', True))
+
+        self.default_tab_combo.clear()
+        disabled = settings.get('disabled_modules', [])
+        self._tab_display_names = [
+            display_name for module_name, display_name in self.available_modules
+            if module_name not in disabled
+        ]
+        self.default_tab_combo.addItems(self._tab_display_names)
+        if self.default_tab_combo.count() == 0:
+            self.default_tab_combo.addItem("(no modules enabled)")
+            self.default_tab_combo.setEnabled(False)
+        else:
+            self.default_tab_combo.setEnabled(True)
+            current_default = settings.get('default_tab', '')
+            if isinstance(current_default, str) and current_default in self._tab_display_names:
+                self.default_tab_combo.setCurrentIndex(self._tab_display_names.index(current_default))
+
+        for module_name, checkbox in self.module_checkboxes.items():
+            checkbox.setChecked(module_name not in disabled)
+
+        current_style = settings.get('ui_style', 'Fusion')
+        if self.style_combo.findText(current_style) >= 0:
+            self.style_combo.setCurrentText(current_style)
+
+        self.remote_server_edit.setText(settings.get('remote_server_path', ''))
+        self.job_structure_edit.setText(
+            settings.get('job_folder_structure', '{customer}/{job_folder}/job documents')
+        )
+        self.quote_folder_edit.setText(settings.get('quote_folder_path', 'Quotes'))
+        self.legacy_mode_check.setChecked(settings.get('legacy_mode', True))
+        self.experimental_check.setChecked(settings.get('experimental_features', False))
+        self.advanced_group.setChecked(False)
+
     def browse_dir(self, line_edit: QLineEdit):
-        dir_path = QFileDialog.getExistingDirectory(self, "Select Directory")
+        dir_path = get_existing_directory(self, "Select Directory")
         if dir_path:
             line_edit.setText(dir_path)
 
     def save(self):
+        settings = self.settings
         if self._active('blueprints_dir'):
-            self.settings['blueprints_dir'] = self.blueprints_edit.text()
+            settings['blueprints_dir'] = self.blueprints_edit.text()
         if self._active('customer_files_dir'):
-            self.settings['customer_files_dir'] = self.customer_files_edit.text()
+            settings['customer_files_dir'] = self.customer_files_edit.text()
         if self._active('itar_blueprints_dir'):
-            self.settings['itar_blueprints_dir'] = self.itar_blueprints_edit.text()
+            settings['itar_blueprints_dir'] = self.itar_blueprints_edit.text()
         if self._active('itar_customer_files_dir'):
-            self.settings['itar_customer_files_dir'] = self.itar_customer_files_edit.text()
+            settings['itar_customer_files_dir'] = self.itar_customer_files_edit.text()
 
         if self._active('link_type'):
             if self.hard_radio.isChecked():
-                self.settings['link_type'] = 'hard'
+                settings['link_type'] = 'hard'
             elif self.symbolic_radio.isChecked():
-                self.settings['link_type'] = 'symbolic'
+                settings['link_type'] = 'symbolic'
             else:
-                self.settings['link_type'] = 'copy'
+                settings['link_type'] = 'copy'
 
         if self._active('blueprint_extensions'):
-            extensions = [ext.strip().lower() for ext in self.extensions_edit.text().split(',') if ext.strip()]
-            extensions = [ext if ext.startswith('.') else f'.{ext}' for ext in extensions]
-            self.settings['blueprint_extensions'] = extensions
+            settings['blueprint_extensions'] = frozenset(
+                (ext if ext.startswith('.') else f'.{ext}').lower()
+                for ext in _EXT_SPLIT_RE.split(self.extensions_edit.text())
+                if ext
+            )
 
         if self._active('job_folder_structure'):
-            self.settings['job_folder_structure'] = self.job_structure_edit.text().strip()
+            settings['job_folder_structure'] = self.job_structure_edit.text().strip()
         if self._active('quote_folder_path'):
-            self.settings['quote_folder_path'] = self.quote_folder_edit.text().strip()
+            settings['quote_folder_path'] = self.quote_folder_edit.text().strip()
         if self._active('legacy_mode'):
-            self.settings['legacy_mode'] = self.legacy_mode_check.isChecked()
+            settings['legacy_mode'] = self.legacy_mode_check.isChecked()
         if self._active('allow_duplicate_jobs'):
-            self.settings['allow_duplicate_jobs'] = self.allow_duplicates_check.isChecked()
+            settings['allow_duplicate_jobs'] = self.allow_duplicates_check.isChecked()
         if self._active('skip_image_attachments'):
-            self.settings['skip_image_attachments'] = self.skip_images_check.isChecked()
+            settings['skip_image_attachments'] = self.skip_images_check.isChecked()
+        if self._active('native_file_dialogs'):
+            settings['native_file_dialogs'] = self.native_dialogs_check.isChecked()
         if self._active('ui_style'):
-            self.settings['ui_style'] = self.style_combo.currentText()
+            settings['ui_style'] = self.style_combo.currentText()
         if self._active('default_tab'):
             idx = self.default_tab_combo.currentIndex()
             if 0 <= idx < len(self._tab_display_names):
-                self.settings['default_tab'] = self._tab_display_names[idx]
+                settings['default_tab'] = self._tab_display_names[idx]
         if self._active('experimental_features'):
-            self.settings['experimental_features'] = self.experimental_check.isChecked()
+            settings['experimental_features'] = self.experimental_check.isChecked()
         if self._active('disabled_modules'):
             disabled_modules = []
             for module_name, checkbox in self.module_checkboxes.items():
                 if not checkbox.isChecked():
                     disabled_modules.append(module_name)
-            self.settings['disabled_modules'] = disabled_modules
+            settings['disabled_modules'] = disabled_modules
         if self._active('remote_server_path'):
-            self.settings['remote_server_path'] = self.remote_server_edit.text().strip()
+            settings['remote_server_path'] = self.remote_server_edit.text().strip()
 
         self.accept()
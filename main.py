@@ -5,6 +5,7 @@ JobDocs - Modular Blueprint and Job Management System
 Main application entry point using the modular plugin architecture.
 """
 
+import copy
 import io
 import logging
 import os
@@ -13,16 +14,13 @@ import subprocess
 import sys
 import json
 import tempfile
-import urllib.error
-import urllib.request
-import zipfile
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
 from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QTabWidget, QMessageBox, QDialog,
+    QApplication, QMainWindow, QTabWidget, QMessageBox, QDialog, QWidget,
     QInputDialog, QLineEdit, QProgressDialog,
     QVBoxLayout, QLabel, QCheckBox, QDialogButtonBox,
 )
@@ -30,8 +28,8 @@ from PyQt6.QtWidgets import (
 logger = logging.getLogger(__name__)
 
 from core.module_loader import ModuleLoader
-from core.app_context import AppContext
-from shared.utils import get_config_dir, get_os_text
+from core.app_context import AppContext, list_subdirs
+from shared.utils import get_config_dir, get_os_text, load_json, dump_json
 from shared.remote_sync import RemoteSyncManager
 
 
@@ -74,6 +72,11 @@ class _UpdateChecker(QThread):
     up_to_date = pyqtSignal()
 
     def run(self):
+        # urllib.request pulls in http.client and ssl; importing it here keeps
+        # that off the startup path
+        import urllib.error
+        import urllib.request
+
         try:
             url = f"https://api.github.com/repos/{_GITHUB_REPO}/releases/latest"
             req = urllib.request.Request(
@@ -110,6 +113,8 @@ class _UpdateDownloader(QThread):
         self._dest_path = dest_path
 
     def run(self):
+        import urllib.request
+
         try:
             if not self._asset_url.startswith("https://"):
                 self.error.emit("Invalid asset URL scheme")
@@ -405,6 +410,40 @@ def _flatpak_dns_fix() -> None:
 _flatpak_dns_fix()
 
 
+_MAX_RECENT_JOBS = 100
+
+
+def _write_json_snapshots(snapshots, remote_sync: RemoteSyncManager) -> List[str]:
+    """Write (label, local_path, remote_name, data, compact) snapshots; return error messages."""
+    errors = []
+    for label, local_path, remote_name, data, compact in snapshots:
+        try:
+            # Save locally first
+            dump_json(local_path, data, compact=compact)
+
+            # Sync to remote if configured
+            if remote_sync.is_enabled():
+                remote_sync.save_json_to_remote(remote_name, data, compact=compact)
+        except IOError as e:
+            errors.append(f"Failed to save {label}: {e}")
+    return errors
+
+
+class _JsonSaveWorker(QThread):
+    """Background writer for debounced settings/history saves."""
+
+    error = pyqtSignal(str)
+
+    def __init__(self, snapshots, remote_sync: RemoteSyncManager):
+        super().__init__()
+        self._snapshots = snapshots
+        self._remote_sync = remote_sync
+
+    def run(self):
+        for message in _write_json_snapshots(self._snapshots, self._remote_sync):
+            self.error.emit(message)
+
+
 class _PluginInstallWorker(QThread):
     """Background worker that downloads and extracts a GitHub plugin."""
 
@@ -469,6 +508,10 @@ class _PluginInstallWorker(QThread):
             return f"\n\nDependency installation failed: {exc}"
 
     def run(self):
+        import urllib.error
+        import urllib.request
+        import zipfile
+
         owner, repo = self._owner, self._repo
         plugins_dir = self._plugins_dir
 
@@ -603,6 +646,7 @@ class JobDocsMainWindow(QMainWindow):
         'report_template_path': '',  # Path to Excel template for Report Fixer
         'suppress_bp_link_notification': False,  # Suppress "linked to blueprints" confirmation dialog
         'skip_image_attachments': True,
+        'native_file_dialogs': True,  # False forces Qt's built-in file dialog
     }
 
     def __init__(self):
@@ -614,15 +658,45 @@ class JobDocsMainWindow(QMainWindow):
         self.history_file = self.config_dir / 'history.json'
 
         # Load settings first (needed for remote sync setup)
-        self.settings = self.load_settings()
+        self.settings = settings = self.load_settings()
 
         # Initialize remote sync manager
-        remote_path = self.settings.get('remote_server_path', '')
+        remote_path = settings.get('remote_server_path', '')
         self.remote_sync = RemoteSyncManager(remote_path)
 
         self.history = self.load_history()
         self.modules = []  # Store loaded modules
 
+        # Merged customer list, reused while every directory listing is unchanged
+        self._customer_list: List[str] = []
+        self._customer_list_key: tuple = ()
+
+        # Saves are coalesced and written off the UI thread
+        self._pending_saves: set = set()
+        self._save_worker = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_saves)
+        # Last snapshot handed to the writer per file; a flush whose data
+        # still equals it is skipped. Seeded from disk only for local-only
+        # setups so a stale remote still gets pushed on the first save.
+        self._saved_snapshots: Dict[str, Any] = {}
+        if not self.remote_sync.is_enabled():
+            if os.path.exists(self.settings_file):
+                self._saved_snapshots['settings'] = copy.deepcopy(settings)
+            if os.path.exists(self.history_file):
+                self._saved_snapshots['history'] = copy.deepcopy(self.history)
+
+        # Status bar updates from log_message are coalesced to at most one per tick
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_status_message)
+        self._pending_tabs: Dict[int, Any] = {}  # tab index -> module whose widget isn't built yet
+        self._settings_dialog = None  # built on first open, then reused
+
         # Setup UI
         self.setWindowTitle("JobDocs")
         self.resize(700, 600)
@@ -634,7 +708,7 @@ class JobDocsMainWindow(QMainWindow):
 
         # Create app context for modules
         self.app_context = AppContext(
-            settings=self.settings,
+            settings=settings,
             history=self.history,
             config_dir=self.config_dir,
             save_settings_callback=self.save_settings,
@@ -657,11 +731,12 @@ class JobDocsMainWindow(QMainWindow):
         self.apply_ui_style()
 
         # Apply email attachment settings
-        from shared.widgets import DropZone
-        DropZone.set_skip_image_attachments(self.settings.get('skip_image_attachments', True))
+        from shared.widgets import DropZone, set_native_file_dialogs
+        DropZone.set_skip_image_attachments(settings.get('skip_image_attachments', True))
+        set_native_file_dialogs(settings.get('native_file_dialogs', True))
 
         # Set default tab (stored as display name string; fall back to integer for old settings)
-        default_tab = self.settings.get('default_tab', 0)
+        default_tab = settings.get('default_tab', 0)
         if isinstance(default_tab, str):
             for i in range(self.tabs.count()):
                 if self.tabs.tabText(i) == default_tab:
@@ -671,7 +746,10 @@ class JobDocsMainWindow(QMainWindow):
                 print(f"[JobDocs] Warning: saved default tab '{default_tab}' not found; using first tab", flush=True)
         elif isinstance(default_tab, int) and 0 <= default_tab < self.tabs.count():
             self.tabs.setCurrentIndex(default_tab)
+        # setCurrentIndex doesn't signal when the default is already current
+        self._ensure_tab_built(self.tabs.currentIndex())
 
+        self._pending_status = None  # "Ready" supersedes the startup log messages
         self.statusBar().showMessage("Ready")  # pyright: ignore[reportOptionalMemberAccess]
 
     # ==================== Settings & History ====================
@@ -679,13 +757,15 @@ class JobDocsMainWindow(QMainWindow):
     def load_settings(self) -> Dict[str, Any]:
         """Load settings from file, trying remote server first if configured"""
         # First try to load from local to get remote_server_path
+        # A missing file surfaces from the read itself, saving a separate
+        # exists() stat on every startup
         local_settings = None
-        if self.settings_file.exists():
-            try:
-                with open(self.settings_file, 'r') as f:
-                    local_settings = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load local settings: {e}")
+        try:
+            local_settings = load_json(self.settings_file)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not load local settings: {e}")
 
         # If we have a remote path configured, try loading from remote (remote is source of truth)
         if local_settings and local_settings.get('remote_server_path'):
@@ -693,23 +773,28 @@ class JobDocsMainWindow(QMainWindow):
             remote_settings = remote_sync.load_json_from_remote('settings.json')
             if remote_settings:
                 # Remote settings loaded successfully - use them
-                merged = self.DEFAULT_SETTINGS.copy()
-                merged.update(remote_settings)
+                merged = self._merge_settings(remote_settings)
                 # Save to local to keep in sync
                 try:
-                    with open(self.settings_file, 'w') as f:
-                        json.dump(merged, f, indent=2)
+                    dump_json(self.settings_file, merged)
                 except IOError:
                     pass
                 return merged
 
         # Fall back to local settings
         if local_settings:
-            merged = self.DEFAULT_SETTINGS.copy()
-            merged.update(local_settings)
-            return merged
+            return self._merge_settings(local_settings)
 
-        return self.DEFAULT_SETTINGS.copy()
+        return self._merge_settings({})
+
+    def _merge_settings(self, loaded: Dict[str, Any]) -> Dict[str, Any]:
+        """Overlay loaded settings on the defaults and normalize derived values"""
+        merged = {**self.DEFAULT_SETTINGS, **loaded}
+        # Lower-cased frozenset for O(1) membership checks; written back out as a sorted list
+        merged['blueprint_extensions'] = frozenset(
+            e.lower() for e in merged['blueprint_extensions']
+        )
+        return merged
 
     def _partial_save_settings(self, partial: Dict[str, Any]):
         """Merge partial settings dict and persist to disk (used by mid-dialog callbacks)."""
@@ -717,18 +802,9 @@ class JobDocsMainWindow(QMainWindow):
         self.save_settings()
 
     def save_settings(self):
-        """Save settings to file and sync to remote server if configured"""
-        try:
-            # Save locally first
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
-
-            # Sync to remote if configured
-            if self.remote_sync.is_enabled():
-                self.remote_sync.save_json_to_remote('settings.json', self.settings)
-
-        except IOError as e:
-            self.show_error_dialog("Error", f"Failed to save settings: {e}")
+        """Schedule a save of settings to file (and remote server if configured)"""
+        self._pending_saves.add('settings')
+        self._save_timer.start()
 
     def load_history(self) -> Dict[str, Any]:
         """Load history from file, trying remote server first if configured"""
@@ -738,35 +814,72 @@ class JobDocsMainWindow(QMainWindow):
             if remote_history:
                 # Save to local to keep in sync
                 try:
-                    with open(self.history_file, 'w') as f:
-                        json.dump(remote_history, f, indent=2)
+                    dump_json(self.history_file, remote_history)
                 except IOError:
                     pass
                 return remote_history
 
         # Fall back to local history
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load history: {e}")
+        try:
+            return load_json(self.history_file)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not load history: {e}")
 
         return {'customers': {}, 'recent_jobs': []}
 
     def save_history(self):
-        """Save history to file and sync to remote server if configured"""
-        try:
-            # Save locally first
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=2)
+        """Schedule a save of history to file (and remote server if configured)"""
+        self._pending_saves.add('history')
+        self._save_timer.start()
 
-            # Sync to remote if configured
-            if self.remote_sync.is_enabled():
-                self.remote_sync.save_json_to_remote('history.json', self.history)
+    def _flush_saves(self, background: bool = True):
+        """Write pending settings/history saves.
 
-        except IOError as e:
-            self.show_error_dialog("Error", f"Failed to save history: {e}")
+        Snapshots are taken on the UI thread so the worker never sees a dict
+        that is being mutated. A background flush that finds the previous
+        write still running retries on the next timer tick.
+        """
+        if self._save_worker is not None and self._save_worker.isRunning():
+            if background:
+                self._save_timer.start()
+                return
+            self._save_worker.wait()
+
+        snapshots = []
+        if 'settings' in self._pending_saves:
+            snapshots.append(('settings', self.settings_file, 'settings.json',
+                              copy.deepcopy(self.settings), False))
+        if 'history' in self._pending_saves:
+            # History is rewritten on every job, so keep it bounded and compact;
+            # indent it only when debug logging is on
+            history = copy.deepcopy(self.history)
+            recent_jobs = history.get('recent_jobs')
+            if recent_jobs and len(recent_jobs) > _MAX_RECENT_JOBS:
+                history['recent_jobs'] = recent_jobs[:_MAX_RECENT_JOBS]
+            snapshots.append(('history', self.history_file, 'history.json', history,
+                              not logger.isEnabledFor(logging.DEBUG)))
+        self._pending_saves.clear()
+        # Only files whose contents actually changed are dirty
+        snapshots = [s for s in snapshots if self._saved_snapshots.get(s[0]) != s[3]]
+        for snapshot in snapshots:
+            self._saved_snapshots[snapshot[0]] = snapshot[3]
+        if not snapshots:
+            return
+
+        if background:
+            self._save_worker = _JsonSaveWorker(snapshots, self.remote_sync)
+            self._save_worker.error.connect(self._on_save_error)
+            self._save_worker.start()
+        else:
+            for message in _write_json_snapshots(snapshots, self.remote_sync):
+                self._on_save_error(message)
+
+    def _on_save_error(self, message: str):
+        """Report a failed write and forget what was saved so the next flush retries"""
+        self._saved_snapshots.clear()
+        self.show_error_dialog("Error", message)
 
     # ==================== Window Icon ====================
 
@@ -823,8 +936,9 @@ class JobDocsMainWindow(QMainWindow):
 
         try:
             # Load modules with experimental flag and disabled modules list
-            experimental_enabled = self.settings.get('experimental_features', False)
-            disabled_modules = self.settings.get('disabled_modules', [])
+            settings = self.settings
+            experimental_enabled = settings.get('experimental_features', False)
+            disabled_modules = settings.get('disabled_modules', [])
             self.modules = loader.load_all_modules(self.app_context, experimental_enabled, disabled_modules)
 
             if not self.modules:
@@ -835,19 +949,21 @@ class JobDocsMainWindow(QMainWindow):
                 )
                 return
 
-            # Add each module as a tab (skip non-tab modules)
+            # Add each module as a placeholder tab (skip non-tab modules); the
+            # real widget is built the first time its tab is shown
             for module in self.modules:
                 if not module.is_tab_module():
                     continue
                 try:
-                    widget = module.get_widget()
                     name = module.get_name()
-                    self.tabs.addTab(widget, name)
+                    index = self.tabs.addTab(QWidget(), name)
+                    self._pending_tabs[index] = module
                     self.log_message(f"Loaded module: {name}")
                 except Exception as e:
                     self.log_message(f"ERROR: Failed to load module {module.__class__.__name__}: {e}")
                     import traceback
                     traceback.print_exc()
+            self.tabs.currentChanged.connect(self._ensure_tab_built)
 
             self.statusBar().showMessage(  # pyright: ignore[reportOptionalMemberAccess]
                 f"Loaded {len(self.modules)} module(s)"
@@ -868,6 +984,33 @@ class JobDocsMainWindow(QMainWindow):
             import traceback
             traceback.print_exc()
 
+    def _ensure_tab_built(self, index: int):
+        """Swap a placeholder tab for its module's real widget on first show"""
+        module = self._pending_tabs.get(index)
+        if module is None:
+            return
+        try:
+            widget = module.get_widget()
+        except (OSError, AttributeError) as e:
+            # A missing .ui file or widget name; the tab stays pending, so
+            # showing it again retries the build
+            logger.exception("Failed to build %s tab", module.get_name())
+            self.log_message(f"ERROR: Failed to build {module.get_name()} tab: {e}")
+            return
+        del self._pending_tabs[index]
+
+        placeholder = self.tabs.widget(index)
+        name = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, name)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        if placeholder is not None:
+            placeholder.deleteLater()
+
+        self._populate_module_customer_lists(module)
+
     def _start_search_indexer(self):
         for module in self.modules:
             if hasattr(module, 'start_indexer'):
@@ -943,11 +1086,19 @@ class JobDocsMainWindow(QMainWindow):
                 # If we can't load it, just use the module name
                 available_modules.append((module_name, module_name))
 
-        dialog = SettingsDialog(
-            self.settings, self, available_modules,
-            save_callback=self._partial_save_settings,
-            active_keys=set(self.DEFAULT_SETTINGS)
-        )
+        # Reuse the dialog's widgets unless the module list changed (plugin install/uninstall)
+        dialog = self._settings_dialog
+        if dialog is None or dialog.available_modules != available_modules:
+            dialog = SettingsDialog(
+                self.settings, self, available_modules,
+                save_callback=self._partial_save_settings,
+                active_keys=set(self.DEFAULT_SETTINGS)
+            )
+            if self._settings_dialog is not None:
+                self._settings_dialog.deleteLater()
+            self._settings_dialog = dialog
+        else:
+            dialog.reload(self.settings)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.settings = dialog.settings
 
@@ -957,8 +1108,9 @@ class JobDocsMainWindow(QMainWindow):
 
             self.save_settings()
             self.populate_customer_lists()
-            from shared.widgets import DropZone
+            from shared.widgets import DropZone, set_native_file_dialogs
             DropZone.set_skip_image_attachments(self.settings.get('skip_image_attachments', True))
+            set_native_file_dialogs(self.settings.get('native_file_dialogs', True))
             QMessageBox.information(self, "Settings", "Settings saved. Please restart for all changes to take effect.")
 
     def install_plugin(self):
@@ -1337,8 +1489,9 @@ near-instant even across thousands of jobs.</p>""",
             # Wizard already updated app_context.settings and saved — sync main window
             self.settings = self.app_context.settings
             self.apply_ui_style()
-            from shared.widgets import DropZone
+            from shared.widgets import DropZone, set_native_file_dialogs
             DropZone.set_skip_image_attachments(self.settings.get('skip_image_attachments', True))
+            set_native_file_dialogs(self.settings.get('native_file_dialogs', True))
 
     # ==================== UI Helpers ====================
 
@@ -1350,7 +1503,16 @@ near-instant even across thousands of jobs.</p>""",
     def log_message(self, message: str):
         """Log a message to console and status bar"""
         print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-        self.statusBar().showMessage(message, 3000)  # pyright: ignore[reportOptionalMemberAccess]
+        # Bursts of messages (module loading, bulk creation) only repaint the
+        # status bar once per timer tick, showing the latest message
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status_message(self):
+        if self._pending_status is not None:
+            self.statusBar().showMessage(self._pending_status, 3000)  # pyright: ignore[reportOptionalMemberAccess]
+            self._pending_status = None
 
     def show_error_dialog(self, title: str, message: str):
         """Show error dialog"""
@@ -1364,31 +1526,39 @@ near-instant even across thousands of jobs.</p>""",
 
     def get_customer_list(self) -> List[str]:
         """Get list of customers from customer files directory"""
-        customers = set()
+        listings = []
         for dir_key in ['customer_files_dir', 'itar_customer_files_dir']:
             dir_path = self.settings.get(dir_key, '')
-            if dir_path and Path(dir_path).exists():
-                try:
-                    for d in Path(dir_path).iterdir():
-                        if d.is_dir():
-                            customers.add(d.name)
-                except OSError:
-                    pass
-        return sorted(customers)
+            if not dir_path:
+                continue
+            try:
+                listings.append((dir_path, list_subdirs(dir_path)))
+            except OSError:
+                pass
+        # list_subdirs hands back the same cached tuple while a directory is
+        # unchanged, so this comparison is cheap and skips the merge and sort
+        listings = tuple(listings)
+        if listings != self._customer_list_key:
+            customers = set()
+            for _, names in listings:
+                customers.update(names)
+            self._customer_list = sorted(customers)
+            self._customer_list_key = listings
+        return list(self._customer_list)
 
     def add_to_history(self, entry_type: str, data: Dict[str, Any]):
         """Add an entry to history"""
         if entry_type == 'job':
-            recent_jobs = self.history.get('recent_jobs', [])
+            recent_jobs = self.history.setdefault('recent_jobs', [])
 
             # Add timestamp
             data['date'] = datetime.now().isoformat()
 
-            # Add to front of list
+            # Add to front of list (stored newest-first, so views never reverse it)
             recent_jobs.insert(0, data)
 
-            # Keep only last 100 entries
-            self.history['recent_jobs'] = recent_jobs[:100]
+            # Keep only the most recent entries
+            del recent_jobs[_MAX_RECENT_JOBS:]
 
             # Update customer history
             customer = data.get('customer', '')
@@ -1401,20 +1571,26 @@ near-instant even across thousands of jobs.</p>""",
 
     def populate_customer_lists(self):
         """Refresh customer lists in all modules (called after settings change)"""
-        # Call populate methods on all loaded modules that have them
+        # Call populate methods on all loaded modules that have them; tabs
+        # that haven't been built yet are populated when first shown
+        pending = list(self._pending_tabs.values())
         for module in self.modules:
-            # Check for populate_*_customer_list methods
-            for method_name in dir(module):
-                if method_name.startswith('populate_') and method_name.endswith('_customer_list'):
-                    method = getattr(module, method_name, None)
-                    if callable(method):
-                        try:
-                            method()
-                        except Exception as e:
-                            self.log_message(f"Error refreshing {module.get_name()} customer list: {e}")
+            if module not in pending:
+                self._populate_module_customer_lists(module)
 
         self.log_message("Customer lists refreshed")
 
+    def _populate_module_customer_lists(self, module):
+        """Call a module's populate_*_customer_list methods"""
+        for method_name in dir(module):
+            if method_name.startswith('populate_') and method_name.endswith('_customer_list'):
+                method = getattr(module, method_name, None)
+                if callable(method):
+                    try:
+                        method()
+                    except Exception as e:
+                        self.log_message(f"Error refreshing {module.get_name()} customer list: {e}")
+
     def refresh_history(self):
         """Refresh history displays in all modules"""
         # Hook for modules to refresh history displays
@@ -1433,10 +1609,14 @@ near-instant even across thousands of jobs.</p>""",
             except Exception as e:
                 print(f"Error cleaning up module {module.get_name()}: {e}")
 
-        # Save any pending settings/history
+        # Modules have stopped their workers, so nothing is using the scan pool
+        self.app_context.shutdown()
+
+        # Save any pending settings/history before the event loop stops
         try:
-            self.save_settings()
-            self.save_history()
+            self._save_timer.stop()
+            self._pending_saves.update(('settings', 'history'))
+            self._flush_saves(background=False)
         except Exception as e:
             print(f"Error saving on exit: {e}")
 
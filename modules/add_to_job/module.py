@@ -7,18 +7,20 @@ Supports filtering by ITAR status and flexible destination options.
 
 import os
 import sys
-import shutil
+from functools import partial
 from pathlib import Path
 from typing import List
 from PyQt6.QtWidgets import (
-    QWidget, QTreeWidgetItem, QButtonGroup
+    QWidget, QButtonGroup
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6 import uic
 
 from core.base_module import BaseModule
-from shared.widgets import DropZone
-from shared.utils import create_file_link
+from shared.widgets import (
+    DropZone, add_lazy_tree_item, expand_lazy_tree_item, add_file_list_items
+)
+from shared.utils import create_file_link, fast_copy
 
 
 class JobTreeWorker(QThread):
@@ -29,12 +31,13 @@ class JobTreeWorker(QThread):
     # Signal emitted when loading is complete
     finished = pyqtSignal()
 
-    def __init__(self, dirs_to_search, selected_customer, show_all_customers, app_context):
+    def __init__(self, dirs_to_search, selected_customer, show_all_customers, app_context, search_term=''):
         super().__init__()
         self.dirs_to_search = dirs_to_search
         self.selected_customer = selected_customer
         self.show_all_customers = show_all_customers
         self.app_context = app_context
+        self.search_term = search_term  # lower-cased; empty loads every job
         self._is_cancelled = False
 
     def cancel(self):
@@ -49,23 +52,23 @@ class JobTreeWorker(QThread):
 
             try:
                 if self.show_all_customers:
-                    customers = [d for d in os.listdir(cf_dir) if os.path.isdir(os.path.join(cf_dir, d))]
+                    customers = self.app_context.list_subdirs(cf_dir)
                 else:
                     customers = (
                         [self.selected_customer]
                         if os.path.isdir(os.path.join(cf_dir, self.selected_customer)) else []
                     )
 
-                for customer in sorted(customers):
+                customers = sorted(customers)
+                customer_paths = [os.path.join(cf_dir, customer) for customer in customers]
+                scans = self.app_context.map_job_folders(customer_paths)
+                for customer, customer_path, jobs in zip(customers, customer_paths, scans):
                     if self._is_cancelled:
                         break
 
-                    customer_path = os.path.join(cf_dir, customer)
-                    if not os.path.exists(customer_path):
-                        continue
-
                     display_name = f"[{prefix}] {customer}" if prefix else customer
-                    jobs = self.app_context.find_job_folders(customer_path)
+                    if self.search_term and self.search_term not in customer.lower():
+                        jobs = [job for job in jobs if self.search_term in job[0].lower()]
 
                     # Only emit if customer has jobs
                     if jobs:
@@ -85,6 +88,8 @@ class AddToJobModule(BaseModule):
         self.add_files: List[str] = []
         self._widget = None
         self._worker = None  # Background thread worker
+        self._search_results = 0  # Jobs matched by the running tree search
+        self._tree_refresh_timer = None  # Debounces filter-driven tree reloads
         # Widget references
         self.add_customer_combo = None
         self.add_search_edit = None
@@ -165,13 +170,20 @@ class AddToJobModule(BaseModule):
         widget.mainSplitter.setSizes([450, 450])
 
         # Connect signals
-        self.add_customer_combo.currentTextChanged.connect(self.refresh_job_tree)
-        self.add_all_radio.toggled.connect(self.refresh_job_tree)
-        self.add_standard_radio.toggled.connect(self.refresh_job_tree)
-        self.add_itar_radio.toggled.connect(self.refresh_job_tree)
+        # Filter changes arrive in bursts (combo repopulation, paired radio
+        # toggles), so coalesce them into a single background scan
+        self._tree_refresh_timer = QTimer(widget)
+        self._tree_refresh_timer.setSingleShot(True)
+        self._tree_refresh_timer.setInterval(200)
+        self._tree_refresh_timer.timeout.connect(self.refresh_job_tree)
+        self.add_customer_combo.currentTextChanged.connect(self._schedule_tree_refresh)
+        self.add_all_radio.toggled.connect(self._schedule_tree_refresh)
+        self.add_standard_radio.toggled.connect(self._schedule_tree_refresh)
+        self.add_itar_radio.toggled.connect(self._schedule_tree_refresh)
         self.add_search_edit.returnPressed.connect(self.search_jobs)
         widget.search_btn.clicked.connect(self.search_jobs)
         widget.clear_search_btn.clicked.connect(self.clear_job_search)
+        self.job_tree.itemExpanded.connect(expand_lazy_tree_item)
         self.job_tree.itemSelectionChanged.connect(self.on_job_tree_select)
         self.add_drop_zone.files_dropped.connect(lambda files: self.handle_add_files(files))
         widget.remove_add_btn.clicked.connect(self.remove_add_file)
@@ -199,30 +211,29 @@ class AddToJobModule(BaseModule):
         customers = set()
         for dir_key in ['customer_files_dir', 'itar_customer_files_dir']:
             dir_path = self.app_context.get_setting(dir_key, '')
-            if dir_path and os.path.exists(dir_path):
+            if dir_path:
                 try:
-                    for d in os.listdir(dir_path):
-                        if os.path.isdir(os.path.join(dir_path, d)):
-                            customers.add(d)
+                    customers.update(self.app_context.list_subdirs(dir_path))
                 except OSError:
                     pass
 
+        # Repopulate silently; the tree reload below is the only reaction needed
+        self.add_customer_combo.blockSignals(True)
         self.add_customer_combo.clear()
-        self.add_customer_combo.addItem("(All Customers)")
-        self.add_customer_combo.addItems(sorted(customers))
+        self.add_customer_combo.addItems(["(All Customers)"] + sorted(customers))
+        self.add_customer_combo.blockSignals(False)
 
-        self.refresh_job_tree()
+        self._schedule_tree_refresh()
 
     # ==================== Job Tree Management ====================
 
+    def _schedule_tree_refresh(self, *_):
+        """Reload the job tree once the filter controls settle"""
+        self._tree_refresh_timer.start()
+
     def refresh_job_tree(self):
         """Refresh the job tree with current filter settings (async with background thread)"""
-        # Cancel any existing worker
-        if self._worker and self._worker.isRunning():
-            self._worker.cancel()
-            self._worker.wait()
-
-        self.job_tree.clear()
+        self._tree_refresh_timer.stop()
         self.add_status_label.setText("Loading jobs...")
 
         selected_customer = self.add_customer_combo.currentText()
@@ -242,26 +253,44 @@ class AddToJobModule(BaseModule):
             if itar_cf_dir and os.path.exists(itar_cf_dir):
                 dirs_to_search.append(('ITAR', itar_cf_dir))
 
-        # Start background worker
-        self._worker = JobTreeWorker(dirs_to_search, selected_customer, show_all_customers, self.app_context)
-        self._worker.customer_loaded.connect(self._on_customer_loaded)
-        self._worker.finished.connect(self._on_loading_finished)
-        self._worker.start()
+        self._start_tree_worker(dirs_to_search, selected_customer, show_all_customers)
 
-    def _on_customer_loaded(self, display_name: str, customer_path: str, jobs: list):
-        """Slot called when a customer with jobs is loaded"""
-        customer_item = QTreeWidgetItem([display_name])
-        customer_item.setData(0, Qt.ItemDataRole.UserRole, customer_path)
+    def _start_tree_worker(self, dirs_to_search, selected_customer, show_all_customers, search_term=''):
+        """Clear the job tree and (re)fill it from a background worker"""
+        # Cancel any existing worker
+        if self._worker and self._worker.isRunning():
+            self._worker.cancel()
+            self._worker.wait()
 
-        for job_name, job_docs_path in sorted(jobs):
-            job_item = QTreeWidgetItem([job_name])
-            job_item.setData(0, Qt.ItemDataRole.UserRole, job_docs_path)
-            customer_item.addChild(job_item)
+        self.job_tree.clear()
+        self._search_results = 0
 
-        self.job_tree.addTopLevelItem(customer_item)
+        self._worker = JobTreeWorker(
+            dirs_to_search, selected_customer, show_all_customers, self.app_context, search_term
+        )
+        self._worker.customer_loaded.connect(partial(self._on_customer_loaded, self._worker))
+        self._worker.finished.connect(partial(self._on_loading_finished, self._worker))
+        self._worker.start()
 
-    def _on_loading_finished(self):
+    def _on_customer_loaded(self, worker, display_name: str, customer_path: str, jobs: list):
+        """Slot called when a customer with jobs is loaded"""
+        if worker is not self._worker:
+            return  # Queued by a worker that has since been replaced
+        # Job items are only created when the customer is expanded
+        item = add_lazy_tree_item(self.job_tree, display_name, customer_path, jobs)
+        if self._worker.search_term:
+            self._search_results += len(jobs)
+            item.setExpanded(True)
+
+    def _on_loading_finished(self, worker):
         """Slot called when loading is complete"""
+        if worker is not self._worker:
+            return
+        if self._worker.search_term:
+            results = self._search_results
+            self.add_status_label.setText("")
+            self.selected_job_label.setText(f"Found {results} job(s)" if results else "No matches")
+            return
         total_items = self.job_tree.topLevelItemCount()
         self.add_status_label.setText(f"Loaded {total_items} customer(s) with jobs")
 
@@ -273,43 +302,9 @@ class AddToJobModule(BaseModule):
             self.refresh_job_tree()
             return
 
-        self.job_tree.clear()
         dirs_to_search = self._get_customer_files_dirs()
-        results = 0
-
-        for prefix, cf_dir in dirs_to_search:
-            try:
-                customers = [d for d in os.listdir(cf_dir) if os.path.isdir(os.path.join(cf_dir, d))]
-
-                for customer in sorted(customers):
-                    customer_path = os.path.join(cf_dir, customer)
-                    if not os.path.exists(customer_path):
-                        continue
-
-                    matching_jobs = []
-                    jobs = self.app_context.find_job_folders(customer_path)
-                    for job_name, job_docs_path in jobs:
-                        if search_term in job_name.lower() or search_term in customer.lower():
-                            matching_jobs.append((job_name, job_docs_path))
-
-                    if matching_jobs:
-                        display_name = f"[{prefix}] {customer}" if prefix else customer
-                        customer_item = QTreeWidgetItem([display_name])
-                        customer_item.setData(0, Qt.ItemDataRole.UserRole, customer_path)
-
-                        for job, job_path in sorted(matching_jobs):
-                            job_item = QTreeWidgetItem([job])
-                            job_item.setData(0, Qt.ItemDataRole.UserRole, job_path)
-                            customer_item.addChild(job_item)
-                            results += 1
-
-                        self.job_tree.addTopLevelItem(customer_item)
-                        customer_item.setExpanded(True)
-
-            except OSError:
-                pass
-
-        self.selected_job_label.setText(f"Found {results} job(s)" if results else "No matches")
+        self.add_status_label.setText("Searching jobs...")
+        self._start_tree_worker(dirs_to_search, '', True, search_term)
 
     def clear_job_search(self):
         """Clear search and refresh tree"""
@@ -346,10 +341,7 @@ class AddToJobModule(BaseModule):
 
     def handle_add_files(self, files: List[str]):
         """Add files to the add files list"""
-        for f in files:
-            if f not in self.add_files:
-                self.add_files.append(f)
-                self.add_files_list.addItem(os.path.basename(f))
+        add_file_list_items(self.add_files_list, files, self.add_files)
 
     def remove_add_file(self):
         """Remove selected file from add files list"""
@@ -423,7 +415,7 @@ class AddToJobModule(BaseModule):
                 if dest == 'blueprints':
                     bp_dest = customer_bp / file_name
                     try:
-                        shutil.copy2(file_path, bp_dest)
+                        fast_copy(file_path, bp_dest)
                         added += 1
                     except FileExistsError:
                         skipped += 1
@@ -431,7 +423,7 @@ class AddToJobModule(BaseModule):
                 elif dest == 'job':
                     job_dest = Path(job_path) / file_name
                     try:
-                        shutil.copy2(file_path, job_dest)
+                        fast_copy(file_path, job_dest)
                         added += 1
                     except FileExistsError:
                         skipped += 1
@@ -439,12 +431,12 @@ class AddToJobModule(BaseModule):
                 else:  # both
                     bp_dest = customer_bp / file_name
                     try:
-                        shutil.copy2(file_path, bp_dest)
+                        fast_copy(file_path, bp_dest)
                     except FileExistsError:
                         pass
 
                     job_dest = Path(job_path) / file_name
-                    if not job_dest.exists():
+                    if not os.path.lexists(job_dest):
                         create_file_link(bp_dest, job_dest, link_type)
                         added += 1
                     else:
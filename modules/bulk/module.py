@@ -9,16 +9,20 @@ Loaded as a support module (not a standalone tab); accessed via the
 import os
 import sys
 import csv
-from io import StringIO
+import time
+import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
 from PyQt6.QtWidgets import (
-    QWidget, QDialog, QVBoxLayout, QMessageBox, QTableWidgetItem,
-    QFileDialog, QApplication
+    QWidget, QDialog, QVBoxLayout, QMessageBox
 )
+from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6 import uic
 
 from core.base_module import BaseModule
+from shared.widgets import RowsModel, get_open_file_names
+
+logger = logging.getLogger(__name__)
 
 
 def _get_bulk_ui_path() -> Path:
@@ -32,6 +36,66 @@ def _get_bulk_ui_path() -> Path:
     return ui_file
 
 
+class BulkCreateWorker(QThread):
+    """Background worker that builds the job folders for a bulk create"""
+
+    # Signals
+    job_created = pyqtSignal(int, str)  # (job index, job folder path)
+    job_failed = pyqtSignal(int, str)  # (job index, error message)
+    progress = pyqtSignal(int)  # Jobs processed so far
+    finished = pyqtSignal(int, int)  # (created, skipped)
+
+    def __init__(self, jobs, is_itar, existing, job_module, allow_duplicates):
+        super().__init__()
+        self.jobs = jobs
+        self.is_itar = is_itar
+        self.existing = existing  # customer -> job numbers already on disk
+        self.job_module = job_module
+        self.allow_duplicates = allow_duplicates
+        self._is_cancelled = False
+
+    def cancel(self):
+        """Cancel the worker"""
+        self._is_cancelled = True
+
+    def run(self):
+        """Create the job folders; history and logging happen on the UI thread"""
+        created = 0
+        skipped = 0
+        last_update = 0.0
+        try:
+            for i, job in enumerate(self.jobs):
+                if self._is_cancelled:
+                    break
+
+                customer = job['customer']
+                job_number = job['job_number']
+                if not self.allow_duplicates and job_number in self.existing.get(customer, ()):
+                    skipped += 1
+                else:
+                    warnings: List[str] = []
+                    try:
+                        job_path = self.job_module.build_job_folder(
+                            customer, job_number, job['po_number'],
+                            job['description'], job['drawings'], self.is_itar, [], warnings
+                        )
+                    except (OSError, ValueError) as e:
+                        self.job_failed.emit(i, str(e))
+                    else:
+                        created += 1
+                        # Later rows repeating this job number are duplicates now
+                        self.existing.setdefault(customer, set()).add(job_number)
+                        self.job_created.emit(i, str(job_path))
+
+                # Report progress at most every 100ms instead of once per job
+                now = time.monotonic()
+                if now - last_update >= 0.1 or i + 1 == len(self.jobs):
+                    self.progress.emit(i + 1)
+                    last_update = now
+        finally:
+            self.finished.emit(created, skipped)
+
+
 class BulkCreateDialog(QDialog):
     """Dialog for bulk job creation from CSV data"""
 
@@ -52,21 +116,32 @@ class BulkCreateDialog(QDialog):
         self.bulk_itar_check = inner.bulk_itar_check
         self.bulk_text = inner.bulk_text
         self.bulk_table = inner.bulk_table
+        self.bulk_model = RowsModel(
+            ("Status", "Customer", "Job #", "PO #", "Description", "Drawings"), self
+        )
+        self.bulk_table.setModel(self.bulk_model)
         self.bulk_status_label = inner.bulk_status_label
         self.bulk_progress = inner.bulk_progress
+        self.create_bulk_btn = inner.create_bulk_btn
+        self._bulk_worker = None
+        # (parsed jobs, all valid) from the last Validate click; cleared when
+        # the text changes so Create can reuse it instead of re-validating
+        self._bulk_validation = None
 
+        self.bulk_table.horizontalHeader().setDefaultSectionSize(150)
         self.bulk_table.horizontalHeader().setStretchLastSection(True)
 
         inner.import_btn.clicked.connect(self.import_bulk_csv)
         inner.clear_bulk_btn.clicked.connect(lambda: self.bulk_text.clear())
         inner.validate_btn.clicked.connect(self.validate_bulk_data)
         inner.create_bulk_btn.clicked.connect(self.create_bulk_jobs)
+        self.bulk_text.textChanged.connect(self._clear_bulk_validation)
 
     # ==================== CSV Import ====================
 
     def import_bulk_csv(self):
-        file_path, _ = QFileDialog.getOpenFileNames(
-            self, "Select CSV File", "", "CSV Files (*.csv);;Text Files (*.txt);;All Files (*.*)"
+        file_path = get_open_file_names(
+            self, "Select CSV File", "CSV Files (*.csv);;Text Files (*.txt);;All Files (*.*)"
         )
         if file_path:
             try:
@@ -87,11 +162,15 @@ class BulkCreateDialog(QDialog):
             if not line or line.startswith('#'):
                 continue
 
-            try:
-                reader = csv.reader(StringIO(line))
-                parts = next(reader)
-            except (csv.Error, StopIteration):
-                parts = [p.strip() for p in line.split(',')]
+            if '"' not in line:
+                # Without quotes the csv module splits exactly like str.split,
+                # so skip building a reader for the common case
+                parts = line.split(',')
+            else:
+                try:
+                    parts = next(csv.reader((line,)))
+                except (csv.Error, StopIteration):
+                    parts = [p.strip() for p in line.split(',')]
 
             if len(parts) < 4:
                 jobs.append({'line': line_num, 'valid': False, 'error': 'Need customer, job#, PO#, description'})
@@ -129,19 +208,27 @@ class BulkCreateDialog(QDialog):
     # ==================== Validation ====================
 
     def validate_bulk_data(self) -> bool:
-        self.bulk_table.setRowCount(0)
         jobs = self.parse_bulk_data()
+        all_valid = self._show_validation(jobs)
+        self._bulk_validation = (jobs, all_valid)
+        return all_valid
 
+    def _clear_bulk_validation(self):
+        self._bulk_validation = None
+
+    def _show_validation(self, jobs: List[Dict[str, Any]]) -> bool:
+        """Fill the preview table with the status of each parsed row"""
         valid = 0
         invalid = 0
 
-        for job in jobs:
-            row = self.bulk_table.rowCount()
-            self.bulk_table.insertRow(row)
+        # Crawl the customer folders once for all rows, not once per row
+        existing = self.app_context.scan_existing_jobs() if any(job['valid'] for job in jobs) else {}
 
+        rows = []
+        for job in jobs:
             if job['valid']:
                 status = "✓ Valid"
-                dup, dup_location = self._check_duplicate_job(job['customer'], job['job_number'])
+                dup, dup_location = self._check_duplicate_job(job['job_number'], existing)
                 if dup:
                     status = f"⚠ Duplicate ({dup_location})"
                 valid += 1
@@ -149,62 +236,71 @@ class BulkCreateDialog(QDialog):
                 status = f"✗ {job.get('error', 'Invalid')}"
                 invalid += 1
 
-            self.bulk_table.setItem(row, 0, QTableWidgetItem(status))
-            self.bulk_table.setItem(row, 1, QTableWidgetItem(job.get('customer', '')))
-            self.bulk_table.setItem(row, 2, QTableWidgetItem(job.get('job_number', '')))
-            self.bulk_table.setItem(row, 3, QTableWidgetItem(job.get('po_number', '')))
-            self.bulk_table.setItem(row, 4, QTableWidgetItem(job.get('description', '')))
-            self.bulk_table.setItem(row, 5, QTableWidgetItem(', '.join(job.get('drawings', []))))
+            rows.append((
+                status,
+                job.get('customer', ''),
+                job.get('job_number', ''),
+                job.get('po_number', ''),
+                job.get('description', ''),
+                ', '.join(job.get('drawings', [])),
+            ))
+        self.bulk_model.set_rows(rows)
 
         self.bulk_status_label.setText(f"Valid: {valid} | Invalid: {invalid}")
         return invalid == 0
 
-    def _check_duplicate_job(self, customer: str, job_number: str):
-        job_number_lower = job_number.lower()
-
-        recent_jobs = self.app_context.history.get('recent_jobs', [])
-        for job in recent_jobs:
-            if job.get('job_number', '').lower() == job_number_lower:
-                return True, job.get('customer', 'Unknown')
+    def _check_duplicate_job(self, job_number: str, existing: dict):
+        job = self.app_context.find_history_job(job_number)
+        if job is not None:
+            return True, job.get('customer', 'Unknown')
 
-        for dir_key in ['customer_files_dir', 'itar_customer_files_dir']:
-            cf_dir = self.app_context.get_setting(dir_key, '')
-            if not cf_dir or not os.path.exists(cf_dir):
-                continue
-            try:
-                for customer_dir in os.listdir(cf_dir):
-                    customer_path = os.path.join(cf_dir, customer_dir)
-                    if not os.path.isdir(customer_path):
-                        continue
-                    jobs = self.app_context.find_job_folders(customer_path)
-                    for job_name, _ in jobs:
-                        parts = job_name.split('_', 1)
-                        if parts and parts[0].lower() == job_number_lower:
-                            return True, customer_dir
-            except OSError:
-                pass
+        found = existing.get(job_number.lower())
+        if found is not None:
+            return True, found[0]
 
         return False, None
 
-    def job_exists(self, customer: str, job_number: str, is_itar: bool) -> bool:
+    def job_exists(self, customer: str, job_number: str, is_itar: bool,
+                   index: Optional[Dict[str, Set[str]]] = None) -> bool:
         if self.app_context.get_setting('allow_duplicate_jobs', False):
             return False
+        if index is not None:
+            return job_number in index.get(customer, ())
         bp_dir, cf_dir = self.app_context.get_directories(is_itar)
         if not cf_dir:
             return False
         customer_path = Path(cf_dir) / customer
         if not customer_path.exists():
             return False
-        jobs = self.app_context.find_job_folders(str(customer_path))
-        for job_name, _ in jobs:
-            if job_name.startswith(f"{job_number}_") or job_name == job_number:
-                return True
-        return False
+        prefix = f"{job_number}_"
+        return any(
+            job_name.startswith(prefix) or job_name == job_number
+            for job_name, _ in self.app_context.iter_job_folders(str(customer_path))
+        )
+
+    def _build_existing_jobs_index(self, customers, is_itar: bool) -> Dict[str, Set[str]]:
+        """Map each customer to the job numbers already in its folder, one scan per customer"""
+        _, cf_dir = self.app_context.get_directories(is_itar)
+        index: Dict[str, Set[str]] = {}
+        if not cf_dir:
+            return index
+        customers = sorted(set(customers))
+        customer_paths = [os.path.join(cf_dir, customer) for customer in customers]
+        for customer, jobs in zip(customers, self.app_context.map_job_folders(customer_paths)):
+            index[customer] = {job_name.split('_', 1)[0] for job_name, _ in jobs}
+        return index
 
     # ==================== Bulk Job Creation ====================
 
     def create_bulk_jobs(self):
-        if not self.validate_bulk_data():
+        # The table already shows this text's validation; duplicates are
+        # re-checked against a fresh folder index below either way
+        if self._bulk_validation is not None:
+            parsed, all_valid = self._bulk_validation
+        else:
+            parsed = self.parse_bulk_data()
+            all_valid = self._show_validation(parsed)
+        if not all_valid:
             reply = QMessageBox.question(
                 self, "Warning",
                 "Some jobs have errors. Create only valid jobs?",
@@ -213,7 +309,7 @@ class BulkCreateDialog(QDialog):
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-        jobs = [j for j in self.parse_bulk_data() if j['valid']]
+        jobs = [j for j in parsed if j['valid']]
         if not jobs:
             QMessageBox.warning(self, "No Jobs", "No valid jobs to create")
             return
@@ -225,9 +321,10 @@ class BulkCreateDialog(QDialog):
             QMessageBox.critical(self, "Error", "Directories not configured")
             return
 
+        existing = self._build_existing_jobs_index((job['customer'] for job in jobs), is_itar)
         duplicates = []
         for job in jobs:
-            if self.job_exists(job['customer'], job['job_number'], is_itar):
+            if self.job_exists(job['customer'], job['job_number'], is_itar, existing):
                 duplicates.append(f"{job['customer']} - Job #{job['job_number']}")
 
         if duplicates:
@@ -242,10 +339,10 @@ class BulkCreateDialog(QDialog):
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-        # Find the job module (the one that has create_single_job)
+        # Find the job module (the one that has build_job_folder)
         job_module = None
         for module in self.app_context.main_window.modules:
-            if hasattr(module, 'create_single_job'):
+            if hasattr(module, 'build_job_folder'):
                 job_module = module
                 break
 
@@ -256,31 +353,47 @@ class BulkCreateDialog(QDialog):
         self.bulk_progress.setMaximum(len(jobs))
         self.bulk_progress.setValue(0)
         self.bulk_progress.show()
+        self.create_bulk_btn.setEnabled(False)
+
+        existing_customers = set(self.app_context.get_customer_list())
+        self._bulk_jobs = jobs
+        self._bulk_job_module = job_module
+        self._bulk_new_customers = {
+            job['customer'] for job in jobs if job['customer'] not in existing_customers
+        }
+
+        # The folder work runs on a worker thread so the dialog stays responsive
+        self._bulk_worker = BulkCreateWorker(
+            jobs, is_itar, existing, job_module,
+            self.app_context.get_setting('allow_duplicate_jobs', False)
+        )
+        self._bulk_worker.job_created.connect(self._on_bulk_job_created)
+        self._bulk_worker.job_failed.connect(self._on_bulk_job_failed)
+        self._bulk_worker.progress.connect(self.bulk_progress.setValue)
+        self._bulk_worker.finished.connect(self._on_bulk_finished)
+        self._bulk_worker.start()
+
+    def _on_bulk_job_created(self, index: int, job_path: str):
+        job = self._bulk_jobs[index]
+        self._bulk_job_module.record_created_job(
+            job['customer'], job['job_number'], job['po_number'],
+            job['description'], job['drawings'], job_path
+        )
 
-        existing_customers = self.app_context.get_customer_list()
-        new_customers = set()
-        created = 0
-        skipped = 0
-
-        for i, job in enumerate(jobs):
-            customer = job['customer']
-            if customer not in existing_customers and customer not in new_customers:
-                new_customers.add(customer)
-
-            if self.job_exists(customer, job['job_number'], is_itar):
-                skipped += 1
-            else:
-                if job_module.create_single_job(
-                    customer, job['job_number'], job['po_number'],
-                    job['description'], job['drawings'], is_itar, []
-                ):
-                    created += 1
-
-            self.bulk_progress.setValue(i + 1)
-            QApplication.processEvents()
+    def _on_bulk_job_failed(self, index: int, message: str):
+        job = self._bulk_jobs[index]
+        logger.warning("Bulk create failed for job %s: %s", job['job_number'], message)
+        self._bulk_job_module.log_message(f"Error: {message}")
 
+    def _on_bulk_finished(self, created: int, skipped: int):
         self.bulk_progress.hide()
-        msg = f"Created {created}/{len(jobs)} jobs"
+        self.create_bulk_btn.setEnabled(True)
+        # finished is emitted from inside run(), so the thread may not have
+        # returned yet; let it stop before dropping the last reference
+        self._bulk_worker.wait()
+        self._bulk_worker = None
+
+        msg = f"Created {created}/{len(self._bulk_jobs)} jobs"
         if skipped > 0:
             msg += f" (Skipped {skipped} duplicates)"
         QMessageBox.information(self, "Complete", msg)
@@ -288,9 +401,16 @@ class BulkCreateDialog(QDialog):
         main_window = self.app_context.main_window
         if main_window:
             main_window.refresh_history()
-            if new_customers:
+            if self._bulk_new_customers:
                 main_window.populate_customer_lists()
 
+    def done(self, result: int):
+        """Stop a running bulk create before the dialog closes"""
+        if self._bulk_worker is not None and self._bulk_worker.isRunning():
+            self._bulk_worker.cancel()
+            self._bulk_worker.wait()
+        super().done(result)
+
 
 class BulkModule(BaseModule):
     """Bulk job creation — loaded as a support module, not a standalone tab."""
@@ -7,13 +7,75 @@ This module displays recent job creation history with the ability to clear histo
 import sys
 from pathlib import Path
 from datetime import datetime
-from PyQt6.QtWidgets import QWidget, QMessageBox, QTableWidgetItem
-from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QWidget, QMessageBox
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6 import uic
 
 from core.base_module import BaseModule
 
 
+class HistoryTableModel(QAbstractTableModel):
+    """Read-only model over a snapshot of recent_jobs (already newest-first)"""
+
+    _HEADERS = ("Date", "Customer", "Job #", "PO #", "Description", "Drawings")
+    _KEYS = (None, 'customer', 'job_number', 'po_number', 'description', None)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = []
+        # id(job) -> (job, formatted cell strings), built on first paint and
+        # kept across refreshes; holding the job pins its id while cached
+        self._cells = {}
+
+    def set_jobs(self, jobs):
+        """Replace the rows with a snapshot of jobs; views only re-query visible cells"""
+        self.beginResetModel()
+        # A copy: history is edited in place (new jobs inserted, old ones
+        # trimmed) without telling the model, so it must not share the list
+        self._jobs = list(jobs)
+        # A refresh after a new job shifts every row but leaves the other job
+        # dicts untouched, so keep their cells rather than re-parsing dates
+        cached = self._cells
+        self._cells = {}
+        for job in jobs:
+            entry = cached.get(id(job))
+            if entry is not None and entry[0] is job:
+                self._cells[id(job)] = entry
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def _row(self, row):
+        """Format a job's cells once; repaints and refreshes reuse the strings"""
+        job = self._jobs[row]
+        entry = self._cells.get(id(job))
+        if entry is None or entry[0] is not job:
+            try:
+                date = datetime.fromisoformat(job['date']).strftime("%Y-%m-%d %H:%M")
+            except Exception:
+                date = "Unknown"
+            cells = (date,) + tuple(job.get(key, '') for key in self._KEYS[1:5]) + (
+                ', '.join(job.get('drawings', [])),
+            )
+            entry = (job, cells)
+            self._cells[id(job)] = entry
+        return entry[1]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._row(index.row())[index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class HistoryModule(BaseModule):
     """Module for viewing job history"""
 
@@ -22,6 +84,7 @@ class HistoryModule(BaseModule):
         self._widget = None
         # Widget references
         self.history_table = None
+        self.history_model = None
 
     def get_name(self) -> str:
         return "History"
@@ -47,16 +110,20 @@ class HistoryModule(BaseModule):
 
         # Store widget references
         self.history_table = widget.history_table
+        self.history_model = HistoryTableModel(widget)
+        self.history_table.setModel(self.history_model)
 
         # Setup table properties
+        self.history_table.horizontalHeader().setDefaultSectionSize(150)
         self.history_table.horizontalHeader().setStretchLastSection(True)
 
         # Connect signals
         widget.clear_btn.clicked.connect(self.clear_history)
         widget.refresh_btn.clicked.connect(self.refresh_history)
 
-        # Load history
-        QTimer.singleShot(100, self.refresh_history)
+        # The tab is only built on first show and the model reset is cheap,
+        # so load now rather than from a deferred timer
+        self.refresh_history()
 
         return widget
 
@@ -76,23 +143,7 @@ class HistoryModule(BaseModule):
 
     def refresh_history(self):
         """Refresh history table from history data"""
-        self.history_table.setRowCount(0)
-
-        for job in self.app_context.history.get('recent_jobs', []):
-            row = self.history_table.rowCount()
-            self.history_table.insertRow(row)
-
-            try:
-                date = datetime.fromisoformat(job['date']).strftime("%Y-%m-%d %H:%M")
-            except Exception:
-                date = "Unknown"
-
-            self.history_table.setItem(row, 0, QTableWidgetItem(date))
-            self.history_table.setItem(row, 1, QTableWidgetItem(job.get('customer', '')))
-            self.history_table.setItem(row, 2, QTableWidgetItem(job.get('job_number', '')))
-            self.history_table.setItem(row, 3, QTableWidgetItem(job.get('po_number', '')))
-            self.history_table.setItem(row, 4, QTableWidgetItem(job.get('description', '')))
-            self.history_table.setItem(row, 5, QTableWidgetItem(', '.join(job.get('drawings', []))))
+        self.history_model.set_jobs(self.app_context.history.get('recent_jobs', []))
 
     def clear_history(self):
         """Clear all job history after confirmation"""
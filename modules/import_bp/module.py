@@ -7,14 +7,73 @@ Supports both regular and ITAR blueprint directories.
 
 import os
 import sys
-import shutil
 from pathlib import Path
 from typing import List
 from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6 import uic
 
 from core.base_module import BaseModule
-from shared.widgets import DropZone, attach_file_preview
+from shared.widgets import DropZone, attach_file_preview, add_file_list_items
+from shared.utils import fast_copy
+
+
+class ImportWorker(QThread):
+    """Background worker that copies blueprint files into a customer folder"""
+
+    # Signal emitted with one log line per file
+    file_done = pyqtSignal(str)
+    # Signal emitted when copying is complete
+    finished = pyqtSignal(int, int)  # (imported, skipped)
+
+    def __init__(self, files: List[str], dest_dir: Path, link_type: str = 'hard'):
+        super().__init__()
+        self.files = files
+        self.dest_dir = dest_dir
+        self.link_type = link_type
+        self._is_cancelled = False
+
+    def cancel(self):
+        """Cancel the worker"""
+        self._is_cancelled = True
+
+    def run(self):
+        """Copy each file that does not already exist at the destination"""
+        imported = 0
+        skipped = 0
+
+        for file_path in self.files:
+            if self._is_cancelled:
+                break
+
+            file_name = os.path.basename(file_path)
+            dest = self.dest_dir / file_name
+
+            if dest.exists():
+                self.file_done.emit(f"Exists: {file_name}")
+                skipped += 1
+            else:
+                try:
+                    self._import_file(file_path, dest)
+                    self.file_done.emit(f"Imported: {file_name}")
+                    imported += 1
+                except Exception as e:
+                    self.file_done.emit(f"Error: {file_name} - {e}")
+
+        self.finished.emit(imported, skipped)
+
+    def _import_file(self, file_path: str, dest: Path):
+        """Hard-link the file in when configured to, else copy it"""
+        if self.link_type == 'hard':
+            # A hard link moves no data; it fails (e.g. EXDEV across
+            # devices, or no link support on the share) before touching
+            # dest, so fall back to a full copy
+            try:
+                os.link(file_path, dest)
+                return
+            except OSError:
+                pass
+        fast_copy(file_path, dest)
 
 
 class ImportModule(BaseModule):
@@ -31,6 +90,8 @@ class ImportModule(BaseModule):
         self.import_log = None
         self.import_drop_zone = None
         self.import_preview = None
+        self.import_btn = None
+        self._worker = None  # Background copy worker
 
     def get_name(self) -> str:
         return "Import Blueprints"
@@ -59,6 +120,9 @@ class ImportModule(BaseModule):
         self.import_itar_check = widget.import_itar_check
         self.import_files_list = widget.import_files_list
         self.import_log = widget.import_log
+        # Bounded ring buffer: large imports drop their oldest lines instead
+        # of growing the document without limit
+        self.import_log.setMaximumBlockCount(1000)
 
         # Replace DropZone placeholder
         placeholder = widget.import_drop_zone
@@ -73,7 +137,8 @@ class ImportModule(BaseModule):
         # Connect signals
         self.import_drop_zone.files_dropped.connect(self.handle_import_files)
         widget.clear_btn.clicked.connect(self.clear_import_list)
-        widget.import_btn.clicked.connect(self.check_and_import)
+        self.import_btn = widget.import_btn
+        self.import_btn.clicked.connect(self.check_and_import)
 
         # Attach file preview panel next to the file list
         self.import_preview = attach_file_preview(
@@ -101,10 +166,7 @@ class ImportModule(BaseModule):
 
     def handle_import_files(self, files: List[str]):
         """Add files to import list"""
-        for f in files:
-            if f not in self.import_files:
-                self.import_files.append(f)
-                self.import_files_list.addItem(os.path.basename(f))
+        add_file_list_items(self.import_files_list, files, self.import_files)
 
     def _on_import_file_selected(self, row: int):
         if self.import_preview is None:
@@ -126,8 +188,11 @@ class ImportModule(BaseModule):
     def populate_import_customer_list(self):
         """Populate customer combo box"""
         customers = self.app_context.get_customer_list()
+        # One silent repopulation instead of a signal per item
+        self.import_customer_combo.blockSignals(True)
         self.import_customer_combo.clear()
         self.import_customer_combo.addItems(sorted(customers))
+        self.import_customer_combo.blockSignals(False)
         self.import_customer_combo.setEditable(True)
 
     # ==================== Import Functionality ====================
@@ -159,24 +224,19 @@ class ImportModule(BaseModule):
 
         self.import_log.clear()
 
-        imported = 0
-        skipped = 0
-
-        for file_path in self.import_files:
-            file_name = os.path.basename(file_path)
-            dest = customer_bp / file_name
-
-            if dest.exists():
-                self.import_log.appendPlainText(f"Exists: {file_name}")
-                skipped += 1
-            else:
-                try:
-                    shutil.copy2(file_path, dest)
-                    self.import_log.appendPlainText(f"Imported: {file_name}")
-                    imported += 1
-                except Exception as e:
-                    self.import_log.appendPlainText(f"Error: {file_name} - {e}")
+        # Copy off the UI thread so large drops don't freeze the window
+        self.import_btn.setEnabled(False)
+        self._worker = ImportWorker(
+            list(self.import_files), customer_bp,
+            self.app_context.get_setting('link_type', 'hard')
+        )
+        self._worker.file_done.connect(self.import_log.appendPlainText)
+        self._worker.finished.connect(self._on_import_finished)
+        self._worker.start()
 
+    def _on_import_finished(self, imported: int, skipped: int):
+        """Slot called when the import worker completes"""
+        self.import_btn.setEnabled(True)
         self.import_log.appendPlainText(f"\nDone! Imported: {imported}, Skipped: {skipped}")
         self.show_info("Complete", f"Imported: {imported}, Skipped: {skipped}")
 
@@ -186,4 +246,7 @@ class ImportModule(BaseModule):
 
     def cleanup(self):
         """Cleanup resources"""
+        if self._worker and self._worker.isRunning():
+            self._worker.cancel()
+            self._worker.wait()
         self.import_files.clear()
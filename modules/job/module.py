@@ -9,25 +9,26 @@ This module handles:
 
 import os
 import sys
-import shutil
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from PyQt6.QtWidgets import (
-    QWidget, QTreeWidgetItem, QButtonGroup, QAbstractItemView
+    QWidget, QButtonGroup, QAbstractItemView
 )
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6 import uic
 from datetime import datetime
 
 from core.base_module import BaseModule
 from shared.widgets import (
     DropZone, JobSearchDialog, DrawingSearchDialog, FilePreviewWidget,
-    attach_file_preview, print_files_with_dialog
+    attach_file_preview, print_files_with_dialog, add_lazy_tree_item,
+    expand_lazy_tree_item, add_file_list_items
 )
 from shared.utils import (
-    is_blueprint_file, parse_job_numbers, create_file_link,
-    sanitize_filename, open_folder, get_next_number
+    is_blueprint_file, blueprint_extension_set, parse_job_numbers, create_file_link,
+    sanitize_filename, open_folder, get_next_number, copy_files
 )
 
 
@@ -39,18 +40,28 @@ class JobTreeWorker(QThread):
     # Signal emitted when loading is complete
     finished = pyqtSignal()
 
-    def __init__(self, dirs_to_search, selected_customer, show_all_customers, app_context):
+    def __init__(self, dirs_to_search, selected_customer, show_all_customers, app_context, search_term=''):
         super().__init__()
         self.dirs_to_search = dirs_to_search
         self.selected_customer = selected_customer
         self.show_all_customers = show_all_customers
         self.app_context = app_context
+        self.search_term = search_term  # lower-cased; empty loads every job
+        self.dir_mtimes = []  # (path, settled_mtime) of each directory listed, taken before listing it
         self._is_cancelled = False
 
     def cancel(self):
         """Cancel the worker"""
         self._is_cancelled = True
 
+    def is_cancelled(self) -> bool:
+        """Whether cancel() was called"""
+        return self._is_cancelled
+
+    def _note_mtime(self, path: str):
+        """Record a directory's mtime so a later reuse of this load can spot changes"""
+        self.dir_mtimes.append((path, self.app_context.settled_mtime(path)))
+
     def run(self):
         """Run the background job loading"""
         for prefix, cf_dir in self.dirs_to_search:
@@ -58,8 +69,9 @@ class JobTreeWorker(QThread):
                 break
 
             try:
+                self._note_mtime(cf_dir)
                 if self.show_all_customers:
-                    customers = [d for d in os.listdir(cf_dir) if os.path.isdir(os.path.join(cf_dir, d))]
+                    customers = self.app_context.list_subdirs(cf_dir)
                 else:
                     customers = (
                         [self.selected_customer]
@@ -67,16 +79,18 @@ class JobTreeWorker(QThread):
                         else []
                     )
 
-                for customer in sorted(customers):
+                customers = sorted(customers)
+                customer_paths = [os.path.join(cf_dir, customer) for customer in customers]
+                for customer_path in customer_paths:
+                    self._note_mtime(customer_path)
+                scans = self.app_context.map_job_folders(customer_paths)
+                for customer, customer_path, jobs in zip(customers, customer_paths, scans):
                     if self._is_cancelled:
                         break
 
-                    customer_path = os.path.join(cf_dir, customer)
-                    if not os.path.exists(customer_path):
-                        continue
-
                     display_name = f"[{prefix}] {customer}" if prefix else customer
-                    jobs = self.app_context.find_job_folders(customer_path)
+                    if self.search_term and self.search_term not in customer.lower():
+                        jobs = [job for job in jobs if self.search_term in job[0].lower()]
 
                     # Only emit if customer has jobs
                     if jobs:
@@ -98,6 +112,15 @@ class JobModule(BaseModule):
         self.add_files: List[str] = []  # For "Add to Existing" tab
         self._widget = None
         self._worker = None  # Background thread worker
+        self._search_results = 0  # Jobs matched by the running tree search
+        # (display_name, customer_path, jobs) per customer from the last full tree
+        # load, so searches under the same filters don't go back to disk while
+        # the directories it listed are unchanged
+        self._job_index = []
+        self._job_index_key = None  # Filters _job_index was loaded with, once complete
+        self._job_index_mtimes = ()  # (path, mtime_ns) of the directories _job_index listed
+        self._job_index_lower = None  # Lower-cased names for _job_index, built on first search
+        self._tree_refresh_timer = None  # Debounces filter-driven tree reloads
 
         # Create New tab widget references
         self.customer_combo = None
@@ -237,13 +260,20 @@ class JobModule(BaseModule):
         widget.addSplitter.setSizes([450, 450])
 
         # Connect Add to Existing tab signals
-        self.add_customer_combo.currentTextChanged.connect(self.refresh_job_tree)
-        self.add_all_radio.toggled.connect(self.refresh_job_tree)
-        self.add_standard_radio.toggled.connect(self.refresh_job_tree)
-        self.add_itar_radio.toggled.connect(self.refresh_job_tree)
+        # Filter changes arrive in bursts (combo repopulation, paired radio
+        # toggles), so coalesce them into a single background scan
+        self._tree_refresh_timer = QTimer(widget)
+        self._tree_refresh_timer.setSingleShot(True)
+        self._tree_refresh_timer.setInterval(200)
+        self._tree_refresh_timer.timeout.connect(self.refresh_job_tree)
+        self.add_customer_combo.currentTextChanged.connect(self._schedule_tree_refresh)
+        self.add_all_radio.toggled.connect(self._schedule_tree_refresh)
+        self.add_standard_radio.toggled.connect(self._schedule_tree_refresh)
+        self.add_itar_radio.toggled.connect(self._schedule_tree_refresh)
         self.add_search_edit.returnPressed.connect(self.search_jobs)
         widget.search_btn.clicked.connect(self.search_jobs)
         widget.clear_search_btn.clicked.connect(self.clear_job_search)
+        self.job_tree.itemExpanded.connect(expand_lazy_tree_item)
         self.job_tree.itemSelectionChanged.connect(self.on_job_tree_select)
         self.add_drop_zone.files_dropped.connect(lambda files: self.handle_add_files(files))
         widget.remove_add_btn.clicked.connect(self.remove_add_file)
@@ -268,27 +298,30 @@ class JobModule(BaseModule):
     def populate_job_customer_list(self):
         """Populate customer combo box for Create New tab"""
         customers = self.app_context.get_customer_list()
+        # One silent repopulation instead of a signal per item
+        self.customer_combo.blockSignals(True)
         self.customer_combo.clear()
         self.customer_combo.addItems(sorted(customers))
+        self.customer_combo.blockSignals(False)
 
     def populate_add_customer_list(self):
         """Populate customer combo box for Add to Existing tab"""
         customers = set()
         for dir_key in ['customer_files_dir', 'itar_customer_files_dir']:
             dir_path = self.app_context.get_setting(dir_key, '')
-            if dir_path and os.path.exists(dir_path):
+            if dir_path:
                 try:
-                    for d in os.listdir(dir_path):
-                        if os.path.isdir(os.path.join(dir_path, d)):
-                            customers.add(d)
+                    customers.update(self.app_context.list_subdirs(dir_path))
                 except OSError:
                     pass
 
+        # Repopulate silently; the tree reload below is the only reaction needed
+        self.add_customer_combo.blockSignals(True)
         self.add_customer_combo.clear()
-        self.add_customer_combo.addItem("(All Customers)")
-        self.add_customer_combo.addItems(sorted(customers))
+        self.add_customer_combo.addItems(["(All Customers)"] + sorted(customers))
+        self.add_customer_combo.blockSignals(False)
 
-        self.refresh_job_tree()
+        self._schedule_tree_refresh()
 
     # ==================== Create New Tab: File Management ====================
 
@@ -304,12 +337,7 @@ class JobModule(BaseModule):
 
     def handle_job_files(self, files: List[str]):
         """Add files to the job files list (Create New tab)"""
-        newly_added = []
-        for f in files:
-            if f not in self.job_files:
-                self.job_files.append(f)
-                self.job_files_list.addItem(os.path.basename(f))
-                newly_added.append(f)
+        newly_added = add_file_list_items(self.job_files_list, files, self.job_files)
         if newly_added:
             self._check_po_rfq_files(newly_added, self.job_files, self.job_files_list)
 
@@ -353,7 +381,11 @@ class JobModule(BaseModule):
             return
 
         drawings = [d.strip() for d in drawings_str.split(',') if d.strip()] if drawings_str else []
-        job_numbers = parse_job_numbers(job_input)
+        try:
+            job_numbers = parse_job_numbers(job_input)
+        except ValueError as e:
+            self.show_error("Error", f"Invalid job number format: {e}")
+            return
 
         if not job_numbers:
             self.show_error("Error", "Invalid job number format")
@@ -361,8 +393,9 @@ class JobModule(BaseModule):
 
         # Check for duplicate job numbers
         duplicates = []
+        existing = self.app_context.scan_existing_jobs()  # One scan for the whole range
         for job_num in job_numbers:
-            is_dup, dup_path = self._check_duplicate_job(customer, job_num)
+            is_dup, dup_path = self._check_duplicate_job(customer, job_num, existing)
             if is_dup:
                 duplicates.append(f"Job #{job_num} already exists at: {dup_path}")
 
@@ -402,120 +435,150 @@ class JobModule(BaseModule):
             drawings: List[str], is_itar: bool, files: List[str]) -> bool:
         """Create a single job folder"""
         try:
-            bp_dir, cf_dir = self.app_context.get_directories(is_itar)
+            warnings: List[str] = []
+            job_path = self.build_job_folder(
+                customer, job_number, po_number, description, drawings, is_itar, files, warnings
+            )
+            for warning in warnings:
+                self.log_message(warning)
+            self.record_created_job(customer, job_number, po_number, description, drawings, job_path)
+            return True
 
-            # Build job folder name with description and drawings
-            if drawings:
-                job_dir_name = f"{job_number}_{description}_{'-'.join(drawings)}"
-            else:
-                job_dir_name = f"{job_number}_{description}"
+        except Exception as e:
+            self.log_message(f"Error: {e}")
+            self.show_error("Error", f"Error creating job {job_number}: {e}")
+            return False
 
-            job_dir_name = sanitize_filename(job_dir_name)
+    def build_job_folder(
+            self, customer: str, job_number: str, po_number: str, description: str,
+            drawings: List[str], is_itar: bool, files: List[str], warnings: List[str]) -> Path:
+        """
+        Create one job's folder and copy or link its files and drawings into it.
 
-            # Build job path using configured structure
-            job_path = self.app_context.build_job_path(cf_dir, customer, job_dir_name, po_number)
-            job_path.mkdir(parents=True, exist_ok=True)
+        Only touches the filesystem (no dialogs, log or history), so it can
+        run on a worker thread; follow it with record_created_job on the UI
+        thread. Files that are in use are skipped with a note in warnings.
 
-            customer_bp = Path(bp_dir) / customer
-            customer_bp.mkdir(parents=True, exist_ok=True)
+        Returns:
+            The job folder path
 
-            # Get settings
-            blueprint_extensions = self.app_context.get_setting('blueprint_extensions', ['.pdf', '.dwg', '.dxf'])
-            link_type = self.app_context.get_setting('link_type', 'hard')
+        Raises:
+            OSError: If the folder or a file copy fails
+        """
+        bp_dir, cf_dir = self.app_context.get_directories(is_itar)
 
-            # Process files
-            for file_path in files:
-                file_name = os.path.basename(file_path)
+        # Build job folder name with description and drawings
+        if drawings:
+            job_dir_name = f"{job_number}_{description}_{'-'.join(drawings)}"
+        else:
+            job_dir_name = f"{job_number}_{description}"
 
-                if is_blueprint_file(file_name, blueprint_extensions):
-                    bp_dest = customer_bp / file_name
-                    if not bp_dest.exists():
-                        try:
-                            shutil.copy2(file_path, bp_dest)
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
+        job_dir_name = sanitize_filename(job_dir_name)
 
-                    job_dest = job_path / file_name
-                    if bp_dest.exists() and not job_dest.exists():
-                        create_file_link(bp_dest, job_dest, link_type)
-                else:
-                    job_dest = job_path / file_name
-                    if not job_dest.exists():
-                        try:
-                            shutil.copy2(file_path, job_dest)
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
-
-            # Link existing drawings
-            if drawings:
-                exts = blueprint_extensions
-                available_bps = {}
-                try:
-                    for bp_file in customer_bp.iterdir():
-                        if bp_file.is_file() and bp_file.suffix.lower() in [e.lower() for e in exts]:
-                            available_bps[bp_file.name.lower()] = bp_file
-                except OSError:
-                    pass
+        # Build job path using configured structure
+        job_path = self.app_context.build_job_path(cf_dir, customer, job_dir_name, po_number)
+        job_path.mkdir(parents=True, exist_ok=True)
 
-                for drawing in drawings:
-                    drawing_lower = drawing.lower()
-                    for ext in exts:
-                        for bp_name, bp_file in available_bps.items():
-                            if drawing_lower in bp_name and bp_name.endswith(ext.lower()):
-                                dest = job_path / bp_file.name
-                                if not dest.exists():
-                                    create_file_link(bp_file, dest, link_type)
-
-            # Add to history
-            self.app_context.add_to_history('job', {
-                'date': datetime.now().isoformat(),
-                'customer': customer,
-                'job_number': job_number,
-                'po_number': po_number,
-                'description': description,
-                'drawings': drawings,
-                'path': str(job_path)
-            })
-            self.app_context.save_history()
-
-            self.log_message(f"Created: {job_path}")
-            return True
+        customer_bp = Path(bp_dir) / customer
+        customer_bp.mkdir(parents=True, exist_ok=True)
 
-        except Exception as e:
-            self.log_message(f"Error: {e}")
-            self.show_error("Error", f"Error creating job {job_number}: {e}")
-            return False
+        # Get settings
+        blueprint_extensions = blueprint_extension_set(
+            self.app_context.get_setting('blueprint_extensions', ['.pdf', '.dwg', '.dxf'])
+        )
+        link_type = self.app_context.get_setting('link_type', 'hard')
+
+        # Process files: queue the copies so they run together, then link
+        # blueprints into the job once their copies have landed. Paths here
+        # are plain strings: os.path.join is much cheaper per file than Path
+        copies = []
+        queued = set()
+        bp_links = []
+        job_dir = str(job_path)
+        bp_customer_dir = str(customer_bp)
+        for file_path in files:
+            file_name = os.path.basename(file_path)
+
+            if is_blueprint_file(file_name, blueprint_extensions):
+                bp_dest = os.path.join(bp_customer_dir, file_name)
+                if bp_dest not in queued and not os.path.lexists(bp_dest):
+                    copies.append((file_path, bp_dest))
+                    queued.add(bp_dest)
+                bp_links.append((bp_dest, os.path.join(job_dir, file_name)))
+            else:
+                job_dest = os.path.join(job_dir, file_name)
+                if job_dest not in queued and not os.path.lexists(job_dest):
+                    copies.append((file_path, job_dest))
+                    queued.add(job_dest)
+
+        for (file_path, _), error in zip(copies, copy_files(copies)):
+            if isinstance(error, PermissionError):
+                warnings.append(f"Warning: Could not copy {os.path.basename(file_path)} (file in use)")
+            elif error is not None:
+                raise error
+
+        for bp_dest, job_dest in bp_links:
+            if os.path.exists(bp_dest) and not os.path.lexists(job_dest):
+                create_file_link(bp_dest, job_dest, link_type)
+
+        # Link existing drawings
+        if drawings:
+            available_bps = {}
+            try:
+                for bp_file in customer_bp.iterdir():
+                    if bp_file.is_file() and bp_file.suffix.lower() in blueprint_extensions:
+                        available_bps[bp_file.name.lower()] = bp_file
+            except OSError:
+                pass
+
+            # available_bps only holds blueprint extensions, so no per-extension
+            # pass; one sweep visits (and stats the destination of) each file once
+            # even when several drawing numbers match it
+            drawings_lower = [drawing.lower() for drawing in drawings]
+            for bp_name, bp_file in available_bps.items():
+                if any(drawing_lower in bp_name for drawing_lower in drawings_lower):
+                    dest = job_path / bp_file.name
+                    if not os.path.lexists(dest):
+                        create_file_link(bp_file, dest, link_type)
 
-    def _check_duplicate_job(self, customer: str, job_number: str):
-        """Check if a job number already exists"""
+        return job_path
+
+    def record_created_job(
+            self, customer: str, job_number: str, po_number: str, description: str,
+            drawings: List[str], job_path) -> None:
+        """Add a job made by build_job_folder to history and the log (UI thread)"""
+        self.app_context.add_to_history('job', {
+            'date': datetime.now().isoformat(),
+            'customer': customer,
+            'job_number': job_number,
+            'po_number': po_number,
+            'description': description,
+            'drawings': drawings,
+            'path': str(job_path)
+        })
+        self.app_context.save_history()
+
+        self.app_context.forget_job_folders(str(job_path))
+        self._job_index_key = None  # The loaded job list is missing this job now
+        self.log_message(f"Created: {job_path}")
+
+    def _check_duplicate_job(self, customer: str, job_number: str, existing: Optional[dict] = None):
+        """Check if a job number already exists (existing: a scan_existing_jobs result to reuse)"""
         job_number_lower = job_number.lower()
 
         # Check history first
-        recent_jobs = self.app_context.history.get('recent_jobs', [])
-        for job in recent_jobs:
-            if job.get('job_number', '').lower() == job_number_lower:
-                existing_customer = job.get('customer', 'Unknown')
-                return True, f"{existing_customer}: {job.get('path', 'Unknown')}"
+        job = self.app_context.find_history_job(job_number)
+        if job is not None:
+            existing_customer = job.get('customer', 'Unknown')
+            return True, f"{existing_customer}: {job.get('path', 'Unknown')}"
 
         # Check file system
-        for dir_key in ['customer_files_dir', 'itar_customer_files_dir']:
-            cf_dir = self.app_context.get_setting(dir_key, '')
-            if not cf_dir or not os.path.exists(cf_dir):
-                continue
-
-            try:
-                for customer_dir in os.listdir(cf_dir):
-                    customer_path = os.path.join(cf_dir, customer_dir)
-                    if not os.path.isdir(customer_path):
-                        continue
-
-                    jobs = self.app_context.find_job_folders(customer_path)
-                    for job_name, job_docs_path in jobs:
-                        parts = job_name.split('_', 1)
-                        if parts and parts[0].lower() == job_number_lower:
-                            return True, f"{customer_dir}: {job_name}"
-            except OSError:
-                pass
+        if existing is None:
+            existing = self.app_context.scan_existing_jobs()
+        found = existing.get(job_number_lower)
+        if found is not None:
+            customer_dir, job_name = found
+            return True, f"{customer_dir}: {job_name}"
 
         return False, None
 
@@ -625,14 +688,13 @@ class JobModule(BaseModule):
 
     # ==================== Add to Existing Tab: Job Tree Management ====================
 
+    def _schedule_tree_refresh(self, *_):
+        """Reload the job tree once the filter controls settle"""
+        self._tree_refresh_timer.start()
+
     def refresh_job_tree(self):
         """Refresh the job tree with current filter settings (async with background thread)"""
-        # Cancel any existing worker
-        if self._worker and self._worker.isRunning():
-            self._worker.cancel()
-            self._worker.wait()
-
-        self.job_tree.clear()
+        self._tree_refresh_timer.stop()
         self.add_status_label.setText("Loading jobs...")
 
         selected_customer = self.add_customer_combo.currentText()
@@ -652,26 +714,55 @@ class JobModule(BaseModule):
             if itar_cf_dir and os.path.exists(itar_cf_dir):
                 dirs_to_search.append(('ITAR', itar_cf_dir))
 
-        # Start background worker
-        self._worker = JobTreeWorker(dirs_to_search, selected_customer, show_all_customers, self.app_context)
-        self._worker.customer_loaded.connect(self._on_customer_loaded)
-        self._worker.finished.connect(self._on_loading_finished)
-        self._worker.start()
+        self._start_tree_worker(dirs_to_search, selected_customer, show_all_customers)
 
-    def _on_customer_loaded(self, display_name: str, customer_path: str, jobs: list):
-        """Slot called when a customer with jobs is loaded"""
-        customer_item = QTreeWidgetItem([display_name])
-        customer_item.setData(0, Qt.ItemDataRole.UserRole, customer_path)
+    def _start_tree_worker(self, dirs_to_search, selected_customer, show_all_customers, search_term=''):
+        """Clear the job tree and (re)fill it from a background worker"""
+        # Cancel any existing worker
+        if self._worker and self._worker.isRunning():
+            self._worker.cancel()
+            self._worker.wait()
+
+        self.job_tree.clear()
+        self._search_results = 0
+        if not search_term:
+            self._job_index = []
+            self._job_index_key = None
+            self._job_index_lower = None
 
-        for job_name, job_docs_path in sorted(jobs):
-            job_item = QTreeWidgetItem([job_name])
-            job_item.setData(0, Qt.ItemDataRole.UserRole, job_docs_path)
-            customer_item.addChild(job_item)
+        self._worker = JobTreeWorker(
+            dirs_to_search, selected_customer, show_all_customers, self.app_context, search_term
+        )
+        self._worker.customer_loaded.connect(partial(self._on_customer_loaded, self._worker))
+        self._worker.finished.connect(partial(self._on_loading_finished, self._worker))
+        self._worker.start()
 
-        self.job_tree.addTopLevelItem(customer_item)
+    def _on_customer_loaded(self, worker, display_name: str, customer_path: str, jobs: list):
+        """Slot called when a customer with jobs is loaded"""
+        if worker is not self._worker:
+            return  # Queued by a worker that has since been replaced
+        # Job items are only created when the customer is expanded
+        item = add_lazy_tree_item(self.job_tree, display_name, customer_path, jobs)
+        if self._worker.search_term:
+            self._search_results += len(jobs)
+            item.setExpanded(True)
+        else:
+            self._job_index.append((display_name, customer_path, jobs))
 
-    def _on_loading_finished(self):
+    def _on_loading_finished(self, worker):
         """Slot called when loading is complete"""
+        if worker is not self._worker:
+            return
+        if self._worker.search_term:
+            results = self._search_results
+            self.add_status_label.setText("")
+            self.selected_job_label.setText(f"Found {results} job(s)" if results else "No matches")
+            return
+        if not worker.is_cancelled():
+            self._job_index_key = (
+                tuple(worker.dirs_to_search), worker.selected_customer, worker.show_all_customers
+            )
+            self._job_index_mtimes = tuple(worker.dir_mtimes)
         total_items = self.job_tree.topLevelItemCount()
         self.add_status_label.setText(f"Loaded {total_items} customer(s) with jobs")
 
@@ -683,12 +774,6 @@ class JobModule(BaseModule):
             self.refresh_job_tree()
             return
 
-        if self._worker and self._worker.isRunning():
-            self._worker.cancel()
-            self._worker.wait()
-
-        self.job_tree.clear()
-
         # Mirror the filter logic from refresh_job_tree so search respects the UI controls
         dirs_to_search = []
         if self.add_all_radio.isChecked():
@@ -705,43 +790,43 @@ class JobModule(BaseModule):
         selected_customer = self.add_customer_combo.currentText()
         show_all = selected_customer == "(All Customers)" or not selected_customer
 
-        results = 0
-
-        for prefix, cf_dir in dirs_to_search:
-            try:
-                if show_all:
-                    customers = [d for d in os.listdir(cf_dir) if os.path.isdir(os.path.join(cf_dir, d))]
-                else:
-                    customers = [selected_customer] if os.path.isdir(os.path.join(cf_dir, selected_customer)) else []
-
-                for customer in sorted(customers):
-                    customer_path = os.path.join(cf_dir, customer)
-                    if not os.path.exists(customer_path):
-                        continue
-
-                    matching_jobs = []
-                    jobs = self.app_context.find_job_folders(customer_path)
-                    for job_name, job_docs_path in jobs:
-                        if search_term in job_name.lower() or search_term in customer.lower():
-                            matching_jobs.append((job_name, job_docs_path))
-
-                    if matching_jobs:
-                        display_name = f"[{prefix}] {customer}" if prefix else customer
-                        customer_item = QTreeWidgetItem([display_name])
-                        customer_item.setData(0, Qt.ItemDataRole.UserRole, customer_path)
+        # Folders added on the share by other users bump a listed directory's mtime
+        if ((tuple(dirs_to_search), selected_customer, show_all) == self._job_index_key
+                and self.app_context.dirs_unchanged(self._job_index_mtimes)):
+            self._search_job_index(search_term)
+            return
 
-                        for job, job_path in sorted(matching_jobs):
-                            job_item = QTreeWidgetItem([job])
-                            job_item.setData(0, Qt.ItemDataRole.UserRole, job_path)
-                            customer_item.addChild(job_item)
-                            results += 1
+        self.add_status_label.setText("Searching jobs...")
+        self._start_tree_worker(dirs_to_search, selected_customer, show_all, search_term)
 
-                        self.job_tree.addTopLevelItem(customer_item)
-                        customer_item.setExpanded(True)
+    def _search_job_index(self, search_term: str):
+        """Filter the jobs from the last full tree load, without touching the disk"""
+        if self._worker and self._worker.isRunning():
+            self._worker.cancel()
+            self._worker.wait()
+        self._worker = None  # Drop signals still queued by the old worker
 
-            except OSError:
-                pass
+        if self._job_index_lower is None:
+            self._job_index_lower = [
+                (os.path.basename(customer_path).lower(), [job_name.lower() for job_name, _ in jobs])
+                for _, customer_path, jobs in self._job_index
+            ]
 
+        self.job_tree.clear()
+        results = 0
+        self.job_tree.setUpdatesEnabled(False)
+        try:
+            for (display_name, customer_path, jobs), (customer_lower, names_lower) in zip(
+                    self._job_index, self._job_index_lower):
+                if search_term not in customer_lower:
+                    jobs = [job for job, name_lower in zip(jobs, names_lower) if search_term in name_lower]
+                if jobs:
+                    add_lazy_tree_item(self.job_tree, display_name, customer_path, jobs).setExpanded(True)
+                    results += len(jobs)
+        finally:
+            self.job_tree.setUpdatesEnabled(True)
+
+        self.add_status_label.setText("")
         self.selected_job_label.setText(f"Found {results} job(s)" if results else "No matches")
 
     def clear_job_search(self):
@@ -779,12 +864,7 @@ class JobModule(BaseModule):
 
     def handle_add_files(self, files: List[str]):
         """Add files to the add files list (Add to Existing tab)"""
-        newly_added = []
-        for f in files:
-            if f not in self.add_files:
-                self.add_files.append(f)
-                self.add_files_list.addItem(os.path.basename(f))
-                newly_added.append(f)
+        newly_added = add_file_list_items(self.add_files_list, files, self.add_files)
         if newly_added:
             self._check_po_rfq_files(newly_added, self.add_files, self.add_files_list)
 
@@ -844,7 +924,7 @@ class JobModule(BaseModule):
             self.show_error("Error", "Blueprints directory not configured")
             return
 
-        customer_bp = Path(bp_dir) / customer
+        customer_bp = os.path.join(bp_dir, customer)
 
         if self.dest_blueprints_radio.isChecked():
             dest = 'blueprints'
@@ -858,54 +938,44 @@ class JobModule(BaseModule):
 
         # Ensure blueprint directory exists if needed
         if dest in ('blueprints', 'both'):
-            customer_bp.mkdir(parents=True, exist_ok=True)
+            os.makedirs(customer_bp, exist_ok=True)
 
         link_type = self.app_context.get_setting('link_type', 'hard')
 
+        # Queue every copy first so they can run together
+        plans = []
+        copies = []
+        queued = set()
         for file_path in self.add_files:
             file_name = os.path.basename(file_path)
-
+            job_dest = os.path.join(job_path, file_name)
+            target = job_dest if dest == 'job' else os.path.join(customer_bp, file_name)
+            copied = target not in queued and not os.path.lexists(target)
+            if copied:
+                copies.append((file_path, target))
+                queued.add(target)
+            plans.append((file_name, target, job_dest, copied))
+
+        errors = dict(zip([target for _, target in copies], copy_files(copies)))
+
+        for file_name, target, job_dest, copied in plans:
+            error = errors[target] if copied else None
             try:
-                if dest == 'blueprints':
-                    bp_dest = customer_bp / file_name
-                    if not bp_dest.exists():
-                        try:
-                            shutil.copy2(file_path, bp_dest)
-                            added += 1
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
-                            skipped += 1
-                    else:
-                        skipped += 1
-
-                elif dest == 'job':
-                    job_dest = Path(job_path) / file_name
-                    if not job_dest.exists():
-                        try:
-                            shutil.copy2(file_path, job_dest)
-                            added += 1
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
-                            skipped += 1
-                    else:
-                        skipped += 1
+                if isinstance(error, PermissionError):
+                    self.log_message(f"Warning: Could not copy {file_name} (file in use)")
+                elif error is not None:
+                    raise error
 
-                else:  # both
-                    bp_dest = customer_bp / file_name
-                    bp_ready = bp_dest.exists()
-                    if not bp_ready:
-                        try:
-                            shutil.copy2(file_path, bp_dest)
-                            bp_ready = True
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
-
-                    job_dest = Path(job_path) / file_name
-                    if bp_ready and not job_dest.exists():
-                        create_file_link(bp_dest, job_dest, link_type)
+                if dest != 'both':
+                    if copied and error is None:
                         added += 1
                     else:
                         skipped += 1
+                elif error is None and os.path.exists(target) and not os.path.lexists(job_dest):
+                    create_file_link(target, job_dest, link_type)
+                    added += 1
+                else:
+                    skipped += 1
 
             except Exception as e:
                 self.log_message(f"Error adding {file_name}: {e}")
@@ -9,24 +9,24 @@ This module handles:
 
 import os
 import sys
-import shutil
 from pathlib import Path
 from typing import List
 from PyQt6.QtWidgets import (
     QWidget, QTreeWidgetItem, QButtonGroup, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6 import uic
 from datetime import datetime
 
 from core.base_module import BaseModule
 from shared.widgets import (
     DropZone, JobSearchDialog, DrawingSearchDialog, FilePreviewWidget,
-    attach_file_preview, print_files_with_dialog
+    attach_file_preview, print_files_with_dialog, add_lazy_tree_item,
+    expand_lazy_tree_item, add_file_list_items
 )
 from shared.utils import (
-    is_blueprint_file, parse_job_numbers, create_file_link, sanitize_filename,
-    open_folder, get_next_number
+    is_blueprint_file, blueprint_extension_set, parse_job_numbers, create_file_link,
+    sanitize_filename, open_folder, get_next_number, copy_files
 )
 
 
@@ -58,7 +58,7 @@ class QuoteTreeWorker(QThread):
 
             try:
                 if self.show_all_customers:
-                    customers = [d for d in os.listdir(cf_dir) if os.path.isdir(os.path.join(cf_dir, d))]
+                    customers = self.app_context.list_subdirs(cf_dir)
                 else:
                     customers = (
                         [self.selected_customer]
@@ -71,8 +71,6 @@ class QuoteTreeWorker(QThread):
                         break
 
                     customer_path = os.path.join(cf_dir, customer)
-                    if not os.path.exists(customer_path):
-                        continue
 
                     display_name = f"[{prefix}] {customer}" if prefix else customer
                     quotes = self.app_context.find_quote_folders(customer_path)
@@ -97,6 +95,7 @@ class QuoteModule(BaseModule):
         self.add_files: List[str] = []  # For "Add to Existing" tab
         self._widget = None
         self._worker = None  # Background thread worker
+        self._tree_refresh_timer = None  # Debounces filter-driven tree reloads
 
         # Preview panels
         self.quote_preview: FilePreviewWidget | None = None
@@ -232,13 +231,20 @@ class QuoteModule(BaseModule):
         widget.addSplitter.setSizes([450, 450])
 
         # Connect Add to Existing tab signals
-        self.add_customer_combo.currentTextChanged.connect(self.refresh_quote_tree)
-        self.add_all_radio.toggled.connect(self.refresh_quote_tree)
-        self.add_standard_radio.toggled.connect(self.refresh_quote_tree)
-        self.add_itar_radio.toggled.connect(self.refresh_quote_tree)
+        # Filter changes arrive in bursts (combo repopulation, paired radio
+        # toggles), so coalesce them into a single background scan
+        self._tree_refresh_timer = QTimer(widget)
+        self._tree_refresh_timer.setSingleShot(True)
+        self._tree_refresh_timer.setInterval(200)
+        self._tree_refresh_timer.timeout.connect(self.refresh_quote_tree)
+        self.add_customer_combo.currentTextChanged.connect(self._schedule_tree_refresh)
+        self.add_all_radio.toggled.connect(self._schedule_tree_refresh)
+        self.add_standard_radio.toggled.connect(self._schedule_tree_refresh)
+        self.add_itar_radio.toggled.connect(self._schedule_tree_refresh)
         self.add_search_edit.returnPressed.connect(self.search_quotes)
         widget.search_btn.clicked.connect(self.search_quotes)
         widget.clear_search_btn.clicked.connect(self.clear_quote_search)
+        self.quote_tree.itemExpanded.connect(expand_lazy_tree_item)
         self.quote_tree.itemSelectionChanged.connect(self.on_quote_tree_select)
         self.add_drop_zone.files_dropped.connect(lambda files: self.handle_add_files(files))
         widget.remove_add_btn.clicked.connect(self.remove_add_file)
@@ -271,8 +277,11 @@ class QuoteModule(BaseModule):
         try:
             customers = self.app_context.get_customer_list()
 
+            # One silent repopulation instead of a signal per item
+            self.quote_customer_combo.blockSignals(True)
             self.quote_customer_combo.clear()
             self.quote_customer_combo.addItems(sorted(customers))
+            self.quote_customer_combo.blockSignals(False)
             self.app_context.log_message(f"Quote module: Populated {len(customers)} customers")
         except Exception as e:
             self.app_context.log_message(f"Quote module error populating customers: {e}")
@@ -282,19 +291,19 @@ class QuoteModule(BaseModule):
         customers = set()
         for dir_key in ['customer_files_dir', 'itar_customer_files_dir']:
             dir_path = self.app_context.get_setting(dir_key, '')
-            if dir_path and os.path.exists(dir_path):
+            if dir_path:
                 try:
-                    for d in os.listdir(dir_path):
-                        if os.path.isdir(os.path.join(dir_path, d)):
-                            customers.add(d)
+                    customers.update(self.app_context.list_subdirs(dir_path))
                 except OSError:
                     pass
 
+        # Repopulate silently; the tree reload below is the only reaction needed
+        self.add_customer_combo.blockSignals(True)
         self.add_customer_combo.clear()
-        self.add_customer_combo.addItem("(All Customers)")
-        self.add_customer_combo.addItems(sorted(customers))
+        self.add_customer_combo.addItems(["(All Customers)"] + sorted(customers))
+        self.add_customer_combo.blockSignals(False)
 
-        self.refresh_quote_tree()
+        self._schedule_tree_refresh()
 
     # ==================== Create New Tab: File Management ====================
 
@@ -303,12 +312,7 @@ class QuoteModule(BaseModule):
         if self.quote_files_list is None:
             return
 
-        newly_added = []
-        for file in files:
-            if file not in self.quote_files:
-                self.quote_files.append(file)
-                self.quote_files_list.addItem(os.path.basename(file))
-                newly_added.append(file)
+        newly_added = add_file_list_items(self.quote_files_list, files, self.quote_files)
         if newly_added:
             self._check_po_rfq_files(newly_added, self.quote_files, self.quote_files_list)
 
@@ -369,7 +373,11 @@ class QuoteModule(BaseModule):
             return
 
         # Parse quote numbers
-        quote_numbers = parse_job_numbers(quote_numbers_text)
+        try:
+            quote_numbers = parse_job_numbers(quote_numbers_text)
+        except ValueError as e:
+            self.show_error("Error", f"Invalid quote number format: {e}")
+            return
         if not quote_numbers:
             self.show_error("Error", "Invalid quote number format")
             return
@@ -420,51 +428,63 @@ class QuoteModule(BaseModule):
             customer_bp.mkdir(parents=True, exist_ok=True)
 
             # Get settings
-            blueprint_extensions = self.app_context.get_setting('blueprint_extensions', ['.pdf', '.dwg', '.dxf'])
+            blueprint_extensions = blueprint_extension_set(
+                self.app_context.get_setting('blueprint_extensions', ['.pdf', '.dwg', '.dxf'])
+            )
             link_type = self.app_context.get_setting('link_type', 'hard')
 
-            # Process files
+            # Process files: queue the copies so they run together, then link
+            # blueprints into the quote once their copies have landed. Paths here
+            # are plain strings: os.path.join is much cheaper per file than Path
+            copies = []
+            queued = set()
+            bp_links = []
+            quote_dir = str(quote_path)
+            bp_customer_dir = str(customer_bp)
             for file_path in files:
                 file_name = os.path.basename(file_path)
 
                 if is_blueprint_file(file_name, blueprint_extensions):
-                    bp_dest = customer_bp / file_name
-                    if not bp_dest.exists():
-                        try:
-                            shutil.copy2(file_path, bp_dest)
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
-
-                    quote_dest = quote_path / file_name
-                    if not quote_dest.exists():
-                        create_file_link(bp_dest, quote_dest, link_type)
+                    bp_dest = os.path.join(bp_customer_dir, file_name)
+                    if bp_dest not in queued and not os.path.lexists(bp_dest):
+                        copies.append((file_path, bp_dest))
+                        queued.add(bp_dest)
+                    bp_links.append((bp_dest, os.path.join(quote_dir, file_name)))
                 else:
-                    quote_dest = quote_path / file_name
-                    if not quote_dest.exists():
-                        try:
-                            shutil.copy2(file_path, quote_dest)
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
+                    quote_dest = os.path.join(quote_dir, file_name)
+                    if quote_dest not in queued and not os.path.lexists(quote_dest):
+                        copies.append((file_path, quote_dest))
+                        queued.add(quote_dest)
+
+            for (file_path, _), error in zip(copies, copy_files(copies)):
+                if isinstance(error, PermissionError):
+                    self.log_message(f"Warning: Could not copy {os.path.basename(file_path)} (file in use)")
+                elif error is not None:
+                    raise error
+
+            for bp_dest, quote_dest in bp_links:
+                if not os.path.lexists(quote_dest):
+                    create_file_link(bp_dest, quote_dest, link_type)
 
             # Link existing drawings
             if drawings:
-                exts = blueprint_extensions
                 available_bps = {}
                 try:
                     for bp_file in customer_bp.iterdir():
-                        if bp_file.is_file() and bp_file.suffix.lower() in [e.lower() for e in exts]:
+                        if bp_file.is_file() and bp_file.suffix.lower() in blueprint_extensions:
                             available_bps[bp_file.name.lower()] = bp_file
                 except OSError:
                     pass
 
-                for drawing in drawings:
-                    drawing_lower = drawing.lower()
-                    for ext in exts:
-                        for bp_name, bp_file in available_bps.items():
-                            if drawing_lower in bp_name and bp_name.endswith(ext.lower()):
-                                dest = quote_path / bp_file.name
-                                if not dest.exists():
-                                    create_file_link(bp_file, dest, link_type)
+                # available_bps only holds blueprint extensions, so no per-extension
+                # pass; one sweep visits (and stats the destination of) each file once
+                # even when several drawing numbers match it
+                drawings_lower = [drawing.lower() for drawing in drawings]
+                for bp_name, bp_file in available_bps.items():
+                    if any(drawing_lower in bp_name for drawing_lower in drawings_lower):
+                        dest = quote_path / bp_file.name
+                        if not os.path.lexists(dest):
+                            create_file_link(bp_file, dest, link_type)
 
             # Add to history
             self.app_context.add_to_history('quote', {
@@ -581,8 +601,13 @@ class QuoteModule(BaseModule):
 
     # ==================== Add to Existing Tab: Quote Tree Management ====================
 
+    def _schedule_tree_refresh(self, *_):
+        """Reload the quote tree once the filter controls settle"""
+        self._tree_refresh_timer.start()
+
     def refresh_quote_tree(self):
         """Refresh the quote tree with current filter settings (async with background thread)"""
+        self._tree_refresh_timer.stop()
         # Cancel any existing worker
         if self._worker and self._worker.isRunning():
             self._worker.cancel()
@@ -616,15 +641,8 @@ class QuoteModule(BaseModule):
 
     def _on_customer_loaded(self, display_name: str, customer_path: str, quotes: list):
         """Slot called when a customer with quotes is loaded"""
-        customer_item = QTreeWidgetItem([display_name])
-        customer_item.setData(0, Qt.ItemDataRole.UserRole, customer_path)
-
-        for quote_name, quote_path in sorted(quotes):
-            quote_item = QTreeWidgetItem([quote_name])
-            quote_item.setData(0, Qt.ItemDataRole.UserRole, quote_path)
-            customer_item.addChild(quote_item)
-
-        self.quote_tree.addTopLevelItem(customer_item)
+        # Quote items are only created when the customer is expanded
+        add_lazy_tree_item(self.quote_tree, display_name, customer_path, quotes)
 
     def _on_loading_finished(self):
         """Slot called when loading is complete"""
@@ -662,18 +680,17 @@ class QuoteModule(BaseModule):
         show_all = selected_customer == "(All Customers)" or not selected_customer
 
         results = 0
+        customer_items = []
 
         for prefix, cf_dir in dirs_to_search:
             try:
                 if show_all:
-                    customers = [d for d in os.listdir(cf_dir) if os.path.isdir(os.path.join(cf_dir, d))]
+                    customers = self.app_context.list_subdirs(cf_dir)
                 else:
                     customers = [selected_customer] if os.path.isdir(os.path.join(cf_dir, selected_customer)) else []
 
                 for customer in sorted(customers):
                     customer_path = os.path.join(cf_dir, customer)
-                    if not os.path.exists(customer_path):
-                        continue
 
                     matching_quotes = []
                     quotes = self.app_context.find_quote_folders(customer_path)
@@ -686,18 +703,29 @@ class QuoteModule(BaseModule):
                         customer_item = QTreeWidgetItem([display_name])
                         customer_item.setData(0, Qt.ItemDataRole.UserRole, customer_path)
 
+                        quote_items = []
                         for quote, quote_path in sorted(matching_quotes):
                             quote_item = QTreeWidgetItem([quote])
                             quote_item.setData(0, Qt.ItemDataRole.UserRole, quote_path)
-                            customer_item.addChild(quote_item)
-                            results += 1
-
-                        self.quote_tree.addTopLevelItem(customer_item)
-                        customer_item.setExpanded(True)
+                            quote_items.append(quote_item)
+                        customer_item.addChildren(quote_items)
+                        customer_items.append(customer_item)
+                        results += len(quote_items)
 
             except OSError:
                 pass
 
+        # Insert everything in one go so the tree lays out once, not per customer
+        self.quote_tree.setUpdatesEnabled(False)
+        self.quote_tree.blockSignals(True)
+        try:
+            self.quote_tree.addTopLevelItems(customer_items)
+            for customer_item in customer_items:
+                customer_item.setExpanded(True)
+        finally:
+            self.quote_tree.blockSignals(False)
+            self.quote_tree.setUpdatesEnabled(True)
+
         self.selected_quote_label.setText(f"Found {results} quote(s)" if results else "No matches")
 
     def clear_quote_search(self):
@@ -735,12 +763,7 @@ class QuoteModule(BaseModule):
 
     def handle_add_files(self, files: List[str]):
         """Add files to the add files list (Add to Existing tab)"""
-        newly_added = []
-        for f in files:
-            if f not in self.add_files:
-                self.add_files.append(f)
-                self.add_files_list.addItem(os.path.basename(f))
-                newly_added.append(f)
+        newly_added = add_file_list_items(self.add_files_list, files, self.add_files)
         if newly_added:
             self._check_po_rfq_files(newly_added, self.add_files, self.add_files_list)
 
@@ -800,7 +823,7 @@ class QuoteModule(BaseModule):
             self.show_error("Error", "Blueprints directory not configured")
             return
 
-        customer_bp = Path(bp_dir) / customer
+        customer_bp = os.path.join(bp_dir, customer)
 
         if self.dest_blueprints_radio.isChecked():
             dest = 'blueprints'
@@ -814,54 +837,44 @@ class QuoteModule(BaseModule):
 
         # Ensure blueprint directory exists if needed
         if dest in ('blueprints', 'both'):
-            customer_bp.mkdir(parents=True, exist_ok=True)
+            os.makedirs(customer_bp, exist_ok=True)
 
         link_type = self.app_context.get_setting('link_type', 'hard')
 
+        # Queue every copy first so they can run together
+        plans = []
+        copies = []
+        queued = set()
         for file_path in self.add_files:
             file_name = os.path.basename(file_path)
-
+            quote_dest = os.path.join(quote_path, file_name)
+            target = quote_dest if dest == 'quote' else os.path.join(customer_bp, file_name)
+            copied = target not in queued and not os.path.lexists(target)
+            if copied:
+                copies.append((file_path, target))
+                queued.add(target)
+            plans.append((file_name, target, quote_dest, copied))
+
+        errors = dict(zip([target for _, target in copies], copy_files(copies)))
+
+        for file_name, target, quote_dest, copied in plans:
+            error = errors[target] if copied else None
             try:
-                if dest == 'blueprints':
-                    bp_dest = customer_bp / file_name
-                    if not bp_dest.exists():
-                        try:
-                            shutil.copy2(file_path, bp_dest)
-                            added += 1
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
-                            skipped += 1
-                    else:
-                        skipped += 1
+                if isinstance(error, PermissionError):
+                    self.log_message(f"Warning: Could not copy {file_name} (file in use)")
+                elif error is not None:
+                    raise error
 
-                elif dest == 'quote':
-                    quote_dest = Path(quote_path) / file_name
-                    if not quote_dest.exists():
-                        try:
-                            shutil.copy2(file_path, quote_dest)
-                            added += 1
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
-                            skipped += 1
-                    else:
-                        skipped += 1
-
-                else:  # both
-                    bp_dest = customer_bp / file_name
-                    bp_ready = bp_dest.exists()
-                    if not bp_ready:
-                        try:
-                            shutil.copy2(file_path, bp_dest)
-                            bp_ready = True
-                        except PermissionError:
-                            self.log_message(f"Warning: Could not copy {file_name} (file in use)")
-
-                    quote_dest = Path(quote_path) / file_name
-                    if bp_ready and not quote_dest.exists():
-                        create_file_link(bp_dest, quote_dest, link_type)
+                if dest != 'both':
+                    if copied and error is None:
                         added += 1
                     else:
                         skipped += 1
+                elif error is None and os.path.exists(target) and not os.path.lexists(quote_dest):
+                    create_file_link(target, quote_dest, link_type)
+                    added += 1
+                else:
+                    skipped += 1
 
             except Exception as e:
                 self.log_message(f"Error adding {file_name}: {e}")
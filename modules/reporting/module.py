@@ -5,16 +5,23 @@ This module provides experimental reporting functionality with sample data.
 Future implementation will connect to database for actual reporting.
 """
 
+import io
 import sys
 import csv
+import time
 from pathlib import Path
-from datetime import datetime
 from PyQt6.QtWidgets import (
-    QWidget, QTableWidgetItem, QFileDialog, QHeaderView, QAbstractItemView
+    QWidget, QFileDialog, QHeaderView, QAbstractItemView
 )
+from PyQt6.QtCore import Qt
 from PyQt6 import uic
 
 from core.base_module import BaseModule
+from shared.widgets import RowsModel
+
+# Report rows rendered per write when exporting; small reports go out in
+# one write, large ones without holding the whole CSV text in memory
+_EXPORT_CHUNK_ROWS = 10_000
 
 
 class ReportingModule(BaseModule):
@@ -26,6 +33,7 @@ class ReportingModule(BaseModule):
         # Widget references
         self.report_type_combo = None
         self.report_table = None
+        self.report_model = None
         self.report_status_label = None
 
     def get_name(self) -> str:
@@ -56,6 +64,8 @@ class ReportingModule(BaseModule):
         # Store widget references
         self.report_type_combo = widget.report_type_combo
         self.report_table = widget.report_table
+        self.report_model = RowsModel(("Date", "Customer", "Job #", "Description", "Status"), widget)
+        self.report_table.setModel(self.report_model)
         self.report_status_label = widget.report_status_label
 
         # Setup table properties
@@ -86,9 +96,6 @@ class ReportingModule(BaseModule):
         """Generate report from database (placeholder with sample data)"""
         report_type = self.report_type_combo.currentText()
 
-        # Clear existing data
-        self.report_table.setRowCount(0)
-
         # Placeholder data
         sample_data = [
             ["2025-01-15", "Acme Corporation", "12345", "Widget Assembly", "Active"],
@@ -97,13 +104,8 @@ class ReportingModule(BaseModule):
             ["2025-01-12", "Gamma Systems", "99999", "Shaft Assembly", "Active"],
         ]
 
-        # Populate table with sample data
-        for row_data in sample_data:
-            row = self.report_table.rowCount()
-            self.report_table.insertRow(row)
-            for col, value in enumerate(row_data):
-                item = QTableWidgetItem(value)
-                self.report_table.setItem(row, col, item)
+        # One model reset for the whole report rather than an item per cell
+        self.report_model.set_rows(tuple(row) for row in sample_data)
 
         self.report_status_label.setText(
             f"Showing {len(sample_data)} sample records for '{report_type}' (placeholder)\n"
@@ -113,35 +115,36 @@ class ReportingModule(BaseModule):
 
     def export_report(self):
         """Export report to CSV"""
-        if self.report_table.rowCount() == 0:
+        if self.report_model.rowCount() == 0:
             self.show_error("No Data", "Generate a report first before exporting")
             return
 
         file_path, _ = QFileDialog.getSaveFileName(
             self._widget,
             "Export Report",
-            f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            f"report_{time.strftime('%Y%m%d_%H%M%S')}.csv",
             "CSV Files (*.csv)"
         )
 
         if file_path:
             try:
-                with open(file_path, 'w', newline='') as f:
-                    writer = csv.writer(f)
-
-                    # Write headers
-                    headers = []
-                    for col in range(self.report_table.columnCount()):
-                        headers.append(self.report_table.horizontalHeaderItem(col).text())
-                    writer.writerow(headers)
-
-                    # Write data
-                    for row in range(self.report_table.rowCount()):
-                        row_data = []
-                        for col in range(self.report_table.columnCount()):
-                            item = self.report_table.item(row, col)
-                            row_data.append(item.text() if item else "")
-                        writer.writerow(row_data)
+                model = self.report_model
+                header_data = model.headerData
+                horizontal = Qt.Orientation.Horizontal
+                # Every row, not just those fetched into the view
+                rows = model.rows()
+
+                # The CSV is assembled in memory and written one chunk of rows
+                # at a time, instead of as a stream of small csv fragments
+                buf = io.StringIO()
+                writer = csv.writer(buf)
+                writer.writerow([header_data(col, horizontal) for col in range(model.columnCount())])
+                with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                    for start in range(0, len(rows), _EXPORT_CHUNK_ROWS):
+                        writer.writerows(rows[start:start + _EXPORT_CHUNK_ROWS])
+                        f.write(buf.getvalue())
+                        buf.seek(0)
+                        buf.truncate()
 
                 self.show_info("Export Successful", f"Report exported to:\n{file_path}")
                 self.log_message(f"Exported report to: {file_path}")
@@ -9,27 +9,40 @@ Uses background threading to prevent UI lockup during searches.
 import logging
 import os
 import sys
-import re
+import time
 import ctypes
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from PyQt6.QtWidgets import (
-    QWidget, QMessageBox, QTableWidgetItem, QApplication, QMenu,
+    QWidget, QMessageBox, QApplication, QMenu,
     QListWidgetItem, QListWidget, QSplitter, QGroupBox, QVBoxLayout, QCheckBox
 )
-from shared.widgets import FilePreviewWidget
+from shared.widgets import FilePreviewWidget, RowsModel
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QUrl
 from PyQt6.QtGui import QDesktopServices
 from PyQt6 import uic
 
 from core.base_module import BaseModule
-from core.search_index import SearchIndex, _parse_job_folder
+from core.search_index import SearchIndex, _parse_job_folder, leading_job_number
 from shared.utils import open_folder, get_config_dir
 from shared.widgets import print_files_with_dialog
 
 logger = logging.getLogger(__name__)
 
+# Customer folders a strict search scans at once; the scans mostly wait on
+# the disk or share and release the GIL while they do
+_SEARCH_WORKERS = 8
+
+# Results are sent to the UI in batches of up to this many, or whatever has
+# been found once this many seconds have passed, so first hits still show
+# quickly without one queued signal per result
+_RESULT_BATCH = 200
+_RESULT_FLUSH_SECS = 0.1
+
 
 def _is_hidden_file(full_path: str, name: str) -> bool:
     """Return True if the file/folder should be treated as hidden."""
@@ -44,11 +57,34 @@ def _is_hidden_file(full_path: str, name: str) -> bool:
     return False
 
 
+def _walk_dirs(base_dir: str):
+    """
+    Yield (path, rel_path, name, entry) for base_dir and every folder below it.
+
+    Like os.walk without following symlinked folders, but folder-only and
+    with the DirEntry at hand (entry is None for base_dir itself). Folders
+    that can't be listed are skipped.
+    """
+    yield base_dir, '.', os.path.basename(base_dir), None
+    stack = [(base_dir, '')]
+    while stack:
+        path, rel_path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                subdirs = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            continue
+        for entry in subdirs:
+            entry_rel = f"{rel_path}{os.sep}{entry.name}" if rel_path else entry.name
+            yield entry.path, entry_rel, entry.name, entry
+            stack.append((entry.path, entry_rel))
+
+
 class SearchWorker(QThread):
     """Background worker for performing searches without blocking UI"""
 
     # Signals
-    result_found = pyqtSignal(dict)  # Emitted for each search result
+    results_found = pyqtSignal(list)  # Emitted with each batch of search results
     progress_update = pyqtSignal(str)  # Emitted with status updates
     finished = pyqtSignal(int)  # Emitted when search completes with result count
 
@@ -65,11 +101,27 @@ class SearchWorker(QThread):
         self.app_context = app_context
         self._is_cancelled = False
         self.result_count = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._last_flush = 0.0
 
     def cancel(self):
         """Cancel the search"""
         self._is_cancelled = True
 
+    def _add_results(self, results: List[Dict[str, Any]]):
+        """Queue results for the UI, sending them once a batch is due"""
+        self._pending.extend(results)
+        self.result_count += len(results)
+        if len(self._pending) >= _RESULT_BATCH or time.monotonic() - self._last_flush >= _RESULT_FLUSH_SECS:
+            self._flush_results()
+
+    def _flush_results(self):
+        """Send any queued results to the UI"""
+        if self._pending:
+            self.results_found.emit(self._pending)
+            self._pending = []
+        self._last_flush = time.monotonic()
+
     def run(self):
         """Run the search in background"""
         try:
@@ -80,8 +132,24 @@ class SearchWorker(QThread):
         except Exception as e:
             self.progress_update.emit(f"Error: {e}")
 
+        self._flush_results()
         self.finished.emit(self.result_count)
 
+    def _job_fields_match(self, job_num: str, desc: str, drawings: List[str]) -> bool:
+        """Test the enabled job fields against the search term in one pass.
+
+        The fields are joined with a unit separator so the term can't match
+        across the boundary between two fields.
+        """
+        fields = []
+        if self.search_job:
+            fields.append(job_num)
+        if self.search_desc:
+            fields.append(desc)
+        if self.search_drawing:
+            fields.extend(drawings)
+        return bool(fields) and self.search_term in '\x1f'.join(fields).lower()
+
     def _strict_search(self):
         """Structured search using parsed folder names"""
         for prefix, base_dir in self.dirs_to_search:
@@ -96,107 +164,103 @@ class SearchWorker(QThread):
                 continue
 
             try:
-                customers = [
-                    d for d in os.listdir(base_dir)
-                    if os.path.isdir(os.path.join(base_dir, d))
-                ]
+                customers = self.app_context.list_subdirs(base_dir)
             except OSError:
                 continue
+            if not customers:
+                continue
 
-            for customer in customers:
-                if self._is_cancelled:
-                    break
-
-                customer_path = os.path.join(base_dir, customer)
-                display_customer = f"[ITAR] {customer}" if prefix == 'ITAR' else customer
-
-                # Check if searching by customer name
-                customer_match = self.search_customer and self.search_term in customer.lower()
+            # Customer folders are scanned a few at a time so their listing
+            # waits overlap; results are still emitted in customer order
+            with ThreadPoolExecutor(max_workers=min(_SEARCH_WORKERS, len(customers))) as pool:
+                for results in pool.map(partial(self._scan_customer, prefix, base_dir), customers):
+                    if self._is_cancelled:
+                        break
+                    if results:
+                        self._add_results(results)
+
+    def _scan_customer(self, prefix: str, base_dir: str, customer: str) -> List[Dict[str, Any]]:
+        """Matching jobs in one customer folder; runs on a pool thread, so no Qt calls"""
+        results: List[Dict[str, Any]] = []
+        if self._is_cancelled:
+            return results
+
+        # Bound once: the loops below run per job folder
+        search_term = self.search_term
+        fields_match = self._job_fields_match
+
+        customer_path = os.path.join(base_dir, customer)
+        display_customer = f"[ITAR] {customer}" if prefix == 'ITAR' else customer
+
+        # Check if searching by customer name
+        customer_match = self.search_customer and search_term in customer.lower()
+        if not customer_match and not (self.search_job or self.search_desc or self.search_drawing):
+            return results  # Only the customer name is searched, so skip listing its jobs
+
+        # Find job folders
+        scan_errors: List[OSError] = []
+        found_jobs = False
+        for dir_name, job_docs_path in self.app_context.iter_job_folders(customer_path, errors=scan_errors):
+            found_jobs = True
+            if self._is_cancelled:
+                break
 
-                # Find job folders
-                scan_errors: List[OSError] = []
-                jobs = self.app_context.find_job_folders(customer_path, errors=scan_errors)
+            # Apply strict mode filter
+            if not dir_name or not dir_name[0].isdigit():
+                continue
 
-                for dir_name, job_docs_path in jobs:
+            # Parse folder name — shared parser keeps strict-mode results
+            # consistent whether the index is ready or not.
+            job_num, desc, drawings = _parse_job_folder(dir_name)
+
+            # Check for matches
+            match = customer_match or fields_match(job_num, desc, drawings)
+
+            if match:
+                try:
+                    mtime = os.stat(job_docs_path).st_mtime
+                except OSError:
+                    mtime = time.time()
+
+                results.append({
+                    'mtime': mtime,
+                    'customer': display_customer,
+                    'job_number': job_num,
+                    'description': desc,
+                    'drawings': drawings,
+                    'path': job_docs_path
+                })
+
+        # find_job_folders requires a specific subfolder (e.g. "job documents")
+        # that may not exist.  Fall back to a plain digit-prefixed directory scan
+        # whenever no structured jobs were returned, applying the same match logic
+        # so searches by job number or description still work on flat layouts.
+        if not found_jobs and not scan_errors:
+            try:
+                with os.scandir(customer_path) as it:
+                    subdirs = sorted((e.name, e.path) for e in it if e.name[:1].isdigit() and e.is_dir())
+                for item, item_path in subdirs:
                     if self._is_cancelled:
                         break
-
-                    # Apply strict mode filter
-                    if not dir_name or not dir_name[0].isdigit():
+                    job_num, desc, drawings = _parse_job_folder(item)
+                    if not (customer_match or fields_match(job_num, desc, drawings)):
                         continue
-
-                    # Parse folder name — shared parser keeps strict-mode results
-                    # consistent whether the index is ready or not.
-                    job_num, desc, drawings = _parse_job_folder(dir_name)
-
-                    # Check for matches
-                    match = customer_match
-                    if not match and self.search_job and self.search_term in job_num.lower():
-                        match = True
-                    if not match and self.search_desc and self.search_term in desc.lower():
-                        match = True
-                    if not match and self.search_drawing:
-                        for drawing in drawings:
-                            if self.search_term in drawing.lower():
-                                match = True
-                                break
-
-                    if match:
-                        try:
-                            mod_time = datetime.fromtimestamp(Path(job_docs_path).stat().st_mtime)
-                        except OSError:
-                            mod_time = datetime.now()
-
-                        result = {
-                            'date': mod_time,
-                            'customer': display_customer,
-                            'job_number': job_num,
-                            'description': desc,
-                            'drawings': drawings,
-                            'path': job_docs_path
-                        }
-                        self.result_found.emit(result)
-                        self.result_count += 1
-
-                # find_job_folders requires a specific subfolder (e.g. "job documents")
-                # that may not exist.  Fall back to a plain digit-prefixed directory scan
-                # whenever no structured jobs were returned, applying the same match logic
-                # so searches by job number or description still work on flat layouts.
-                if not jobs and not scan_errors:
                     try:
-                        for item in sorted(os.listdir(customer_path)):
-                            if self._is_cancelled:
-                                break
-                            item_path = os.path.join(customer_path, item)
-                            if not os.path.isdir(item_path) or not item or not item[0].isdigit():
-                                continue
-                            job_num, desc, drawings = _parse_job_folder(item)
-                            match = customer_match
-                            if not match and self.search_job and self.search_term in job_num.lower():
-                                match = True
-                            if not match and self.search_desc and self.search_term in desc.lower():
-                                match = True
-                            if not match and self.search_drawing and any(
-                                self.search_term in d.lower() for d in drawings
-                            ):
-                                match = True
-                            if not match:
-                                continue
-                            try:
-                                mod_time = datetime.fromtimestamp(Path(item_path).stat().st_mtime)
-                            except OSError:
-                                mod_time = datetime.now()
-                            self.result_found.emit({
-                                'date': mod_time,
-                                'customer': display_customer,
-                                'job_number': job_num,
-                                'description': desc,
-                                'drawings': drawings,
-                                'path': item_path,
-                            })
-                            self.result_count += 1
+                        mtime = os.stat(item_path).st_mtime
                     except OSError:
-                        pass
+                        mtime = time.time()
+                    results.append({
+                        'mtime': mtime,
+                        'customer': display_customer,
+                        'job_number': job_num,
+                        'description': desc,
+                        'drawings': drawings,
+                        'path': item_path,
+                    })
+            except OSError:
+                pass
+
+        return results
 
     def _legacy_search(self):
         """Recursive search through all directories"""
@@ -226,35 +290,31 @@ class SearchWorker(QThread):
                         customer = path_parts[0] if path_parts and path_parts[0] != '.' else ''
 
                         try:
-                            mod_time = datetime.fromtimestamp(Path(file_path).stat().st_mtime)
+                            mtime = os.stat(file_path).st_mtime
                         except OSError:
-                            mod_time = datetime.now()
+                            mtime = time.time()
 
                         name_no_ext = os.path.splitext(filename)[0]
                         result = {
-                            'date': mod_time,
+                            'mtime': mtime,
                             'customer': f"[{prefix}] {customer}" if customer else f"[{prefix}]",
                             'job_number': name_no_ext,
                             'description': rel_path if rel_path != '.' else '',
                             'drawings': [],
                             'path': root
                         }
-                        self.result_found.emit(result)
-                        self.result_count += 1
+                        self._add_results([result])
         except Exception:
             pass
 
     def _legacy_recursive_search(self, base_dir: str, prefix: str):
         """Recursively search all folders in legacy mode"""
         try:
-            for root, dirs, files in os.walk(base_dir):
+            for root, rel_path, folder_name, entry in _walk_dirs(base_dir):
                 if self._is_cancelled:
                     break
 
-                folder_name = os.path.basename(root)
-
                 # Try to extract customer from path
-                rel_path = os.path.relpath(root, base_dir)
                 path_parts = rel_path.split(os.sep)
                 customer = path_parts[0] if path_parts and path_parts[0] != '.' else "Unknown"
 
@@ -274,9 +334,8 @@ class SearchWorker(QThread):
 
                     # If no structured format, use folder name as description
                     if not job_num:
-                        match = re.match(r'^(\d+)', folder_name)
-                        if match:
-                            job_num = match.group(1)
+                        job_num = leading_job_number(folder_name)
+                        if job_num:
                             desc = folder_name[len(job_num):].strip(' -_')
                         else:
                             desc = folder_name
@@ -293,20 +352,20 @@ class SearchWorker(QThread):
                     display_customer = f"[{prefix}] {customer}" if prefix else customer
 
                     try:
-                        mod_time = datetime.fromtimestamp(Path(root).stat().st_mtime)
+                        st = entry.stat(follow_symlinks=False) if entry is not None else os.stat(root)
+                        mtime = st.st_mtime
                     except OSError:
-                        mod_time = datetime.now()
+                        mtime = time.time()
 
                     result = {
-                        'date': mod_time,
+                        'mtime': mtime,
                         'customer': display_customer,
                         'job_number': job_num if job_num else "(no job #)",
                         'description': desc,
                         'drawings': drawings,
                         'path': root
                     }
-                    self.result_found.emit(result)
-                    self.result_count += 1
+                    self._add_results([result])
         except Exception:
             # Skip directories that cause errors
             pass
@@ -345,7 +404,9 @@ class SearchModule(BaseModule):
     def __init__(self):
         super().__init__()
         self._widget = None
-        self.search_results: List[Dict[str, Any]] = []
+        # Negated mtimes of the rows in search_model, ascending (newest first);
+        # the result dicts themselves live only as the model's row payloads
+        self._result_sort_keys: List[float] = []
         self._worker = None       # Background search worker
         self._index_worker = None # Background index builder
         self._index: Optional[SearchIndex] = None
@@ -431,6 +492,10 @@ class SearchModule(BaseModule):
         # Store widget references
         self.search_edit = widget.search_edit
         self.search_table = widget.search_table
+        self.search_model = RowsModel(
+            ("Date", "Customer", "Job #", "Description", "Drawings"), widget
+        )
+        self.search_table.setModel(self.search_model)
         self.search_status_label = widget.search_status_label
         self.search_progress = widget.search_progress
         self.search_customer_check = widget.search_customer_check
@@ -480,6 +545,7 @@ class SearchModule(BaseModule):
         results_layout.setStretchFactor(splitter, 1)
 
         # Setup table properties
+        self.search_table.horizontalHeader().setDefaultSectionSize(150)
         self.search_table.horizontalHeader().setStretchLastSection(True)
         self.search_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
 
@@ -499,8 +565,8 @@ class SearchModule(BaseModule):
         self.search_strict_radio.toggled.connect(self.update_search_field_checkboxes)
         self.search_table.customContextMenuRequested.connect(self.show_search_context_menu)
         self.search_table.doubleClicked.connect(self.open_selected_search_job)
-        self.search_table.itemSelectionChanged.connect(
-            lambda: self._on_result_selected(self.search_table.currentRow())
+        self.search_table.selectionModel().currentRowChanged.connect(
+            lambda current, _previous: self._on_result_selected(current.row())
         )
         self.folder_contents_list.doubleClicked.connect(self._open_folder_file)
         self.folder_contents_list.customContextMenuRequested.connect(self._show_file_context_menu)
@@ -565,8 +631,8 @@ class SearchModule(BaseModule):
             self.cancel_search()
             return
 
-        self.search_table.setRowCount(0)
-        self.search_results.clear()
+        self.search_model.clear()
+        self._result_sort_keys.clear()
 
         strict_mode = self.search_strict_radio.isChecked()
         include_blueprints = self.search_blueprints_check.isChecked()
@@ -632,7 +698,7 @@ class SearchModule(BaseModule):
             search_customer, search_job, search_desc, search_drawing,
             self.app_context,
         )
-        self._worker.result_found.connect(self._on_result_found)
+        self._worker.results_found.connect(self._on_results_found)
         self._worker.progress_update.connect(self._on_progress_update)
         self._worker.finished.connect(self._on_search_finished)
         self._worker.start()
@@ -665,20 +731,10 @@ class SearchModule(BaseModule):
         if not results:
             return False
 
-        results.sort(key=lambda x: x['date'], reverse=True)
-        self.search_results = results
+        results.sort(key=lambda x: x['mtime'], reverse=True)
+        self._result_sort_keys = [-r['mtime'] for r in results]
 
-        self.search_table.blockSignals(True)
-        self.search_table.setRowCount(0)
-        for result in results:
-            row = self.search_table.rowCount()
-            self.search_table.insertRow(row)
-            self.search_table.setItem(row, 0, QTableWidgetItem(result['date'].strftime("%Y-%m-%d %H:%M")))
-            self.search_table.setItem(row, 1, QTableWidgetItem(result['customer']))
-            self.search_table.setItem(row, 2, QTableWidgetItem(result['job_number']))
-            self.search_table.setItem(row, 3, QTableWidgetItem(result['description']))
-            self.search_table.setItem(row, 4, QTableWidgetItem(', '.join(result['drawings'])))
-        self.search_table.blockSignals(False)
+        self.search_model.set_rows([self._result_row(r) for r in results], results)
 
         self.search_status_label.setText(f"Found {len(results)} result(s)")
         return True
@@ -689,18 +745,26 @@ class SearchModule(BaseModule):
             self._worker.cancel()
             self.search_status_label.setText("Cancelling search...")
 
-    def _on_result_found(self, result: dict):
-        """Slot called when a search result is found"""
-        self.search_results.append(result)
-
-        # Add to table immediately
-        row = self.search_table.rowCount()
-        self.search_table.insertRow(row)
-        self.search_table.setItem(row, 0, QTableWidgetItem(result['date'].strftime("%Y-%m-%d %H:%M")))
-        self.search_table.setItem(row, 1, QTableWidgetItem(result['customer']))
-        self.search_table.setItem(row, 2, QTableWidgetItem(result['job_number']))
-        self.search_table.setItem(row, 3, QTableWidgetItem(result['description']))
-        self.search_table.setItem(row, 4, QTableWidgetItem(', '.join(result['drawings'])))
+    def _on_results_found(self, results: list):
+        """Slot called with each batch of search results"""
+        # Insert at the newest-first position so the table never needs a
+        # full rebuild when the search finishes
+        for result in results:
+            key = -result['mtime']
+            position = bisect_right(self._result_sort_keys, key)
+            self._result_sort_keys.insert(position, key)
+            self.search_model.insert_row(position, self._result_row(result), result)
+
+    @staticmethod
+    def _result_row(result: dict) -> tuple:
+        """Display strings for one result row"""
+        return (
+            datetime.fromtimestamp(result['mtime']).strftime("%Y-%m-%d %H:%M"),
+            result['customer'],
+            result['job_number'],
+            result['description'],
+            ', '.join(result['drawings']),
+        )
 
     def _on_progress_update(self, status: str):
         """Slot called with progress updates"""
@@ -708,38 +772,8 @@ class SearchModule(BaseModule):
 
     def _on_search_finished(self, result_count: int):
         """Slot called when search completes"""
-        # Remember selected path so we can restore it after the table is rebuilt
-        selected_row = self.search_table.currentRow()
-        selected_path = (
-            self.search_results[selected_row]['path']
-            if 0 <= selected_row < len(self.search_results)
-            else None
-        )
-
-        # Sort results by date (newest first)
-        self.search_results.sort(key=lambda x: x['date'], reverse=True)
-
-        # Rebuild table with sorted results; block signals so clearing rows
-        # doesn't wipe the folder-contents panel via itemSelectionChanged
-        self.search_table.blockSignals(True)
-        self.search_table.setRowCount(0)
-        for result in self.search_results:
-            row = self.search_table.rowCount()
-            self.search_table.insertRow(row)
-            self.search_table.setItem(row, 0, QTableWidgetItem(result['date'].strftime("%Y-%m-%d %H:%M")))
-            self.search_table.setItem(row, 1, QTableWidgetItem(result['customer']))
-            self.search_table.setItem(row, 2, QTableWidgetItem(result['job_number']))
-            self.search_table.setItem(row, 3, QTableWidgetItem(result['description']))
-            self.search_table.setItem(row, 4, QTableWidgetItem(', '.join(result['drawings'])))
-        self.search_table.blockSignals(False)
-
-        # Restore the previously selected row (fires itemSelectionChanged once)
-        if selected_path is not None:
-            for i, result in enumerate(self.search_results):
-                if result['path'] == selected_path:
-                    self.search_table.selectRow(i)
-                    break
-
+        # Rows were inserted in sorted order as they arrived, so the table
+        # (and the current selection) is already final
         self.search_status_label.setText(f"Found {result_count} result(s)")
         self.search_progress.hide()
         self.search_btn.setEnabled(True)
@@ -753,8 +787,8 @@ class SearchModule(BaseModule):
             self._worker.wait()
 
         self.search_edit.clear()
-        self.search_table.setRowCount(0)
-        self.search_results.clear()
+        self.search_model.clear()
+        self._result_sort_keys.clear()
         self.folder_contents_list.clear()
         if self.file_preview is not None:
             self.file_preview.clear()
@@ -780,7 +814,7 @@ class SearchModule(BaseModule):
 
     def show_search_context_menu(self, pos):
         """Show context menu on right-click"""
-        row = self.search_table.currentRow()
+        row = self.search_table.currentIndex().row()
         if row < 0:
             return
 
@@ -799,11 +833,16 @@ class SearchModule(BaseModule):
 
         menu.exec(self.search_table.viewport().mapToGlobal(pos))
 
+    def _result_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """Return the search result shown in the given table row, if any"""
+        # Each row carries its own result, so lookups don't depend on row order
+        return self.search_model.payload(row)
+
     def open_selected_search_job(self):
         """Open the selected job folder"""
-        row = self.search_table.currentRow()
-        if 0 <= row < len(self.search_results):
-            path = self.search_results[row]['path']
+        result = self._result_at(self.search_table.currentIndex().row())
+        if result is not None:
+            path = result['path']
             if os.path.exists(path):
                 open_folder(path)
             else:
@@ -811,9 +850,9 @@ class SearchModule(BaseModule):
 
     def open_selected_blueprints(self):
         """Open the blueprints folder for the selected job's customer"""
-        row = self.search_table.currentRow()
-        if 0 <= row < len(self.search_results):
-            raw_customer = self.search_results[row]['customer']
+        result = self._result_at(self.search_table.currentIndex().row())
+        if result is not None:
+            raw_customer = result['customer']
             # Strip all known prefixes to get the bare customer name
             for prefix in ('[ITAR] ', '[ITAR-BP] ', '[BP] ', '[IR] '):
                 raw_customer = raw_customer.replace(prefix, '')
@@ -823,7 +862,7 @@ class SearchModule(BaseModule):
                 self.show_error("Not Found", "Could not determine customer for this result")
                 return
 
-            customer_label = self.search_results[row]['customer']
+            customer_label = result['customer']
             is_itar = customer_label.startswith(('[ITAR] ', '[ITAR-BP] '))
             bp_dir = self.app_context.get_setting('itar_blueprints_dir' if is_itar else 'blueprints_dir', '')
             if bp_dir:
@@ -835,9 +874,9 @@ class SearchModule(BaseModule):
 
     def copy_search_path(self):
         """Copy the selected result's path to clipboard"""
-        row = self.search_table.currentRow()
-        if 0 <= row < len(self.search_results):
-            path = self.search_results[row]['path']
+        result = self._result_at(self.search_table.currentIndex().row())
+        if result is not None:
+            path = result['path']
             QApplication.clipboard().setText(path)
             self.search_status_label.setText("Path copied to clipboard")
 
@@ -861,10 +900,11 @@ class SearchModule(BaseModule):
         self.folder_contents_list.clear()
         if self.file_preview is not None:
             self.file_preview.clear()
-        if row < 0 or row >= len(self.search_results):
+        result = self._result_at(row)
+        if result is None:
             return
 
-        path = self.search_results[row]['path']
+        path = result['path']
         if not os.path.exists(path):
             item = QListWidgetItem("(folder not found)")
             item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
@@ -937,18 +977,18 @@ class SearchModule(BaseModule):
 
     def _get_customer_bp_info(self):
         """Return (customer_name, blueprints_dir) for the currently selected search result."""
-        row = self.search_table.currentRow()
-        if row < 0 or row >= len(self.search_results):
+        result = self._result_at(self.search_table.currentIndex().row())
+        if result is None:
             return None, None
 
-        raw_customer = self.search_results[row]['customer']
+        raw_customer = result['customer']
         for prefix in ('[ITAR] ', '[ITAR-BP] ', '[BP] ', '[IR] '):
             raw_customer = raw_customer.replace(prefix, '')
         customer = raw_customer.strip()
         if not customer:
             return None, None
 
-        customer_label = self.search_results[row]['customer']
+        customer_label = result['customer']
         is_itar = customer_label.startswith(('[ITAR] ', '[ITAR-BP] '))
         bp_dir = self.app_context.get_setting(
             'itar_blueprints_dir' if is_itar else 'blueprints_dir', ''
@@ -1028,4 +1068,4 @@ class SearchModule(BaseModule):
         if self._index_worker and self._index_worker.isRunning():
             self._index_worker.cancel()
             self._index_worker.wait()
-        self.search_results.clear()
+        self._result_sort_keys.clear()
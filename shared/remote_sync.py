@@ -9,6 +9,8 @@ import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from shared.utils import load_json, dump_json
+
 
 class RemoteSyncManager:
     """Manages synchronization of settings and history files with remote server"""
@@ -51,20 +53,20 @@ class RemoteSyncManager:
 
         try:
             if remote_file.exists():
-                with open(remote_file, 'r') as f:
-                    return json.load(f)
+                return load_json(remote_file)
         except (json.JSONDecodeError, IOError, PermissionError) as e:
             print(f"Warning: Could not load {filename} from remote: {e}")
 
         return None
 
-    def save_json_to_remote(self, filename: str, data: Dict[str, Any]) -> bool:
+    def save_json_to_remote(self, filename: str, data: Dict[str, Any], compact: bool = False) -> bool:
         """
         Save a JSON file to the remote server
 
         Args:
             filename: Name of the JSON file (e.g., 'settings.json')
             data: Dictionary to save as JSON
+            compact: Write without indentation
 
         Returns:
             True if successful, False otherwise
@@ -79,8 +81,7 @@ class RemoteSyncManager:
             self.remote_path.mkdir(parents=True, exist_ok=True)
 
             # Write the JSON file
-            with open(remote_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            dump_json(remote_file, data, compact=compact)
 
             return True
         except (IOError, PermissionError) as e:
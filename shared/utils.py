@@ -4,6 +4,7 @@ Shared utility functions for JobDocs
 Common helper functions used across multiple modules.
 """
 
+import json
 import logging
 import os
 import platform
@@ -11,8 +12,14 @@ import shutil
 import re
 import subprocess
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Iterable, List, Tuple, Optional, Union
+
+try:
+    import orjson  # optional: much faster settings/history (de)serialization
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -35,62 +42,113 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize sets (e.g. the blueprint_extensions frozenset) as sorted lists."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def load_json(path) -> Any:
+    """
+    Read a JSON file, using orjson when it is installed.
+
+    The file is read as bytes in one call either way; json.loads detects
+    UTF-8/16/32 itself, so the locale's text encoding never comes into it.
+
+    Raises OSError or json.JSONDecodeError (orjson's decode error subclasses it).
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(path, data: Any, compact: bool = False) -> None:
+    """
+    Write data to a JSON file, using orjson when installed.
+
+    Output is indented by 2 spaces unless compact is True, which drops all
+    optional whitespace for files that are rewritten often.
+
+    The data is written to a sibling temp file and moved into place with
+    os.replace, so a crash or a dropped network share never leaves a
+    half-written file behind.
+    """
+    tmp_path = f"{os.fspath(path)}.tmp"
+    try:
+        if orjson is not None:
+            option = 0 if compact else orjson.OPT_INDENT_2
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, default=_json_default, option=option))
+        else:
+            with open(tmp_path, 'w', buffering=65536) as f:
+                if compact:
+                    json.dump(data, f, separators=(',', ':'), default=_json_default)
+                else:
+                    json.dump(data, f, indent=2, default=_json_default)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+_OS_TYPE = {"Windows": "windows", "Darwin": "macos"}.get(platform.system(), "linux")
+
+_TEXT_MAP = {
+    # Terminology
+    'folder_term': {
+        'windows': 'folder',
+        'macos': 'folder',
+        'linux': 'directory'
+    },
+    'file_browser': {
+        'windows': 'File Explorer',
+        'macos': 'Finder',
+        'linux': 'file manager'
+    },
+
+    # Link type info (FILES only - no admin needed!)
+    'hard_link_note': {
+        'windows': 'Hard Link (recommended - files must be on same volume)',
+        'macos': 'Hard Link (recommended)',
+        'linux': 'Hard Link (recommended)'
+    },
+    'symlink_note': {
+        'windows': 'Symbolic Link (requires admin/Developer Mode)',
+        'macos': 'Symbolic Link',
+        'linux': 'Symbolic Link'
+    },
+
+    # Path separators
+    'path_sep': {
+        'windows': '\\',
+        'macos': '/',
+        'linux': '/'
+    },
+    'path_example': {
+        'windows': '{customer}\\{job_folder}\\job documents',
+        'macos': '{customer}/{job_folder}/job documents',
+        'linux': '{customer}/{job_folder}/job documents'
+    }
+}
+
+# Flattened to the current OS once at import; the OS can't change at runtime.
+_OS_TEXT = {key: texts.get(_OS_TYPE, texts['linux']) for key, texts in _TEXT_MAP.items()}
+
+
 def get_os_type() -> str:
     """Get simplified OS type"""
-    system = platform.system()
-    if system == "Windows":
-        return "windows"
-    elif system == "Darwin":
-        return "macos"
-    else:
-        return "linux"
+    return _OS_TYPE
 
 
 def get_os_text(key: str) -> str:
     """Get OS-specific text for various UI elements"""
-    os_type = get_os_type()
-
-    text_map = {
-        # Terminology
-        'folder_term': {
-            'windows': 'folder',
-            'macos': 'folder',
-            'linux': 'directory'
-        },
-        'file_browser': {
-            'windows': 'File Explorer',
-            'macos': 'Finder',
-            'linux': 'file manager'
-        },
-
-        # Link type info (FILES only - no admin needed!)
-        'hard_link_note': {
-            'windows': 'Hard Link (recommended - files must be on same volume)',
-            'macos': 'Hard Link (recommended)',
-            'linux': 'Hard Link (recommended)'
-        },
-        'symlink_note': {
-            'windows': 'Symbolic Link (requires admin/Developer Mode)',
-            'macos': 'Symbolic Link',
-            'linux': 'Symbolic Link'
-        },
-
-        # Path separators
-        'path_sep': {
-            'windows': '\\',
-            'macos': '/',
-            'linux': '/'
-        },
-        'path_example': {
-            'windows': '{customer}\\{job_folder}\\job documents',
-            'macos': '{customer}/{job_folder}/job documents',
-            'linux': '{customer}/{job_folder}/job documents'
-        }
-    }
-
-    if key in text_map:
-        return text_map[key].get(os_type, text_map[key]['linux'])
-    return ""
+    return _OS_TEXT.get(key, "")
 
 
 _PO_RFQ_NAME_RE = re.compile(
@@ -107,6 +165,13 @@ _PO_RFQ_TEXT_RE = re.compile(
     re.IGNORECASE,
 )
 
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_LEADING_NUMBER_RE = re.compile(r'^[A-Za-z]?(\d+)')
+_JOB_RANGE_RE = re.compile(r'(\d+)\s*-\s*(\d+)')
+# Widest range parse_job_numbers expands; anything larger is a typo that
+# would otherwise build (and then try to create) millions of job numbers
+_MAX_JOB_RANGE = 100_000
+
 
 _MAX_CLASSIFY_CACHE = 500
 _classify_cache: OrderedDict[str, Tuple[float, bool, str]] = OrderedDict()  # path -> (mtime, flagged, reason)
@@ -158,19 +223,37 @@ def _classify_document_uncached(filepath: str) -> Tuple[bool, str]:
     return False, ""
 
 
-def is_blueprint_file(filename: str, blueprint_extensions: List[str]) -> bool:
+def blueprint_extension_set(blueprint_extensions: Iterable[str]) -> frozenset:
+    """
+    Normalize blueprint extensions to a lower-cased frozenset.
+
+    Settings already hold one (see JobDocsMainWindow._merge_settings), and it
+    is returned as-is, so hot paths can call this without rebuilding the set.
+
+    Args:
+        blueprint_extensions: Extensions such as ['.pdf', '.dwg', '.dxf']
+
+    Returns:
+        Frozenset of lower-cased extensions
+    """
+    if isinstance(blueprint_extensions, frozenset):
+        return blueprint_extensions
+    return frozenset(e.lower() for e in blueprint_extensions)
+
+
+def is_blueprint_file(filename: str, blueprint_extensions: Iterable[str]) -> bool:
     """
     Check if a file is a blueprint based on its extension.
 
     Args:
         filename: The filename to check
-        blueprint_extensions: List of valid blueprint extensions (e.g., ['.pdf', '.dwg', '.dxf'])
+        blueprint_extensions: Valid blueprint extensions (e.g., ['.pdf', '.dwg', '.dxf']).
+            A frozenset is assumed to be lower-cased already (as stored in settings).
 
     Returns:
         True if the file is a blueprint, False otherwise
     """
-    ext = Path(filename).suffix.lower()
-    return ext in [e.lower() for e in blueprint_extensions]
+    return os.path.splitext(filename)[1].lower() in blueprint_extension_set(blueprint_extensions)
 
 
 def parse_job_numbers(job_input: str) -> List[str]:
@@ -187,28 +270,78 @@ def parse_job_numbers(job_input: str) -> List[str]:
 
     Returns:
         List of parsed job numbers
+
+    Raises:
+        ValueError: If a range spans more than 100,000 numbers
     """
     job_numbers = []
     for part in job_input.split(','):
         part = part.strip()
         if not part:
             continue
-        if '-' in part:
-            try:
-                range_parts = part.split('-')
-                if len(range_parts) == 2:
-                    start = int(range_parts[0].strip())
-                    end = int(range_parts[1].strip())
-                    if start <= end:
-                        job_numbers.extend(str(n) for n in range(start, end + 1))
-                        continue
-            except ValueError:
-                pass
+        match = _JOB_RANGE_RE.fullmatch(part)
+        if match:
+            start, end = int(match.group(1)), int(match.group(2))
+            if end - start >= _MAX_JOB_RANGE:
+                raise ValueError(
+                    f"Range {part} is too large (more than {_MAX_JOB_RANGE:,} numbers)"
+                )
+            if start <= end:
+                job_numbers.extend(map(str, range(start, end + 1)))
+                continue
         job_numbers.append(part)
     return job_numbers
 
 
-def create_file_link(source: Path, dest: Path, link_type: str = 'hard') -> bool:
+# Largest chunk handed to one copy_file_range call (the kernel caps it anyway)
+_COPY_RANGE_CHUNK = 1 << 30
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Copy src's data into dst in the kernel; False if the OS can't do it here"""
+    with open(src, 'rb') as fsrc:
+        size = os.fstat(fsrc.fileno()).st_size
+        with open(dst, 'wb') as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            copied = 0
+            while copied < size:
+                try:
+                    sent = os.copy_file_range(in_fd, out_fd, min(size - copied, _COPY_RANGE_CHUNK))
+                except OSError:
+                    # Cross-filesystem on old kernels, unsupported filesystem, ...
+                    if copied:
+                        raise
+                    return False
+                if sent == 0:
+                    # Some filesystems report 0 rather than an error (or the
+                    # source shrank); dst is short, so have the caller redo
+                    # the copy with shutil.copyfile, which truncates it
+                    return False
+                copied += sent
+    return True
+
+
+def fast_copy(src, dst) -> None:
+    """
+    Copy a file with its metadata, like shutil.copy2, to a file path.
+
+    On Linux the data is copied with os.copy_file_range, which stays in the
+    kernel and lets Btrfs/XFS share extents (reflink) instead of duplicating
+    them. Elsewhere, or when the filesystem refuses, shutil.copyfile is used.
+
+    Args:
+        src: Source file path
+        dst: Destination file path (not a directory)
+
+    Raises:
+        OSError: If the copy fails
+    """
+    if not (hasattr(os, 'copy_file_range') and _copy_file_range(src, dst)):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def create_file_link(source: Union[str, Path], dest: Union[str, Path], link_type: str = 'hard') -> bool:
     """
     Create a file link (hard link, symbolic link, or copy).
 
@@ -226,12 +359,45 @@ def create_file_link(source: Path, dest: Path, link_type: str = 'hard') -> bool:
         elif link_type == 'symbolic':
             os.symlink(source, dest)
         else:
-            shutil.copy2(source, dest)
+            fast_copy(source, dest)
         return True
     except OSError:
         return False
 
 
+# Copies copy_files runs at once; each is IO-bound, and shares/disks stop
+# gaining from more parallel streams beyond a handful
+_COPY_WORKERS = 4
+
+
+def _copy_one(pair: Tuple[str, Union[str, Path]]) -> Optional[OSError]:
+    try:
+        fast_copy(pair[0], pair[1])
+    except OSError as e:
+        return e
+    return None
+
+
+def copy_files(pairs: List[Tuple[str, Union[str, Path]]]) -> List[Optional[OSError]]:
+    """
+    Copy files with fast_copy, several at a time.
+
+    The copies are independent and spend most of their time waiting on the
+    disk or network share, so running a few together overlaps that wait.
+
+    Args:
+        pairs: (source, destination) pairs; destinations must be distinct
+
+    Returns:
+        One entry per pair, in order: None if the copy succeeded, otherwise
+        the OSError it raised
+    """
+    if len(pairs) <= 1:
+        return [_copy_one(pair) for pair in pairs]
+    with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(pairs))) as pool:
+        return list(pool.map(_copy_one, pairs))
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Remove invalid characters from a filename.
@@ -242,7 +408,7 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    return re.sub(r'[<>:"/\\|?*]', '_', filename)
+    return _INVALID_FILENAME_CHARS_RE.sub('_', filename)
 
 
 def open_folder(path: str) -> Tuple[bool, Optional[str]]:
@@ -301,8 +467,6 @@ def get_next_number(history: Dict[str, Any], entry_type: str, start_number: int
     quote_folder: name of the quotes sub-directory (matches quote_folder_path
                   setting, defaults to 'Quotes').
     """
-    _leading_num = re.compile(r'^[A-Za-z]?(\d+)')
-
     max_number = start_number - 1
 
     if entry_type == 'job':
@@ -332,7 +496,7 @@ def get_next_number(history: Dict[str, Any], entry_type: str, start_number: int
     if scan_dirs:
         def _check(name: str) -> None:
             nonlocal max_number
-            m = _leading_num.match(name)
+            m = _LEADING_NUMBER_RE.match(name)
             if m:
                 n = int(m.group(1))
                 if n > max_number:
@@ -5,20 +5,25 @@ Common UI widgets used across multiple modules.
 """
 
 from PyQt6.QtWidgets import (
-    QFrame, QDialog, QVBoxLayout, QScrollArea, QLabel, QDialogButtonBox,
+    QFrame, QDialog, QVBoxLayout, QLabel, QDialogButtonBox,
     QPushButton, QFileDialog, QLineEdit, QListWidget, QHBoxLayout,
-    QTreeWidget, QTreeWidgetItem, QHeaderView,
+    QTreeWidget, QTreeWidgetItem, QHeaderView, QTextBrowser,
     QWidget, QSplitter, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, pyqtSlot, QSize, QThread
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, pyqtSlot, QSize, QThread, QTimer,
+    QAbstractTableModel, QModelIndex
+)
 from PyQt6.QtGui import QBrush, QColor, QDragEnterEvent, QDropEvent, QImage, QPixmap
 from pathlib import Path
 import atexit
+import itertools
 import logging
 import os
 import shutil
 import struct
 import tempfile
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +41,65 @@ def _cleanup_dropzone_tmp_dirs() -> None:
 atexit.register(_cleanup_dropzone_tmp_dirs)
 
 
+# File dialogs are kept per top-level window and reused. Qt's own dialog
+# otherwise stats and icon-resolves every entry of large directories each
+# time it is built.
+_file_dialogs: "weakref.WeakKeyDictionary[QWidget, dict]" = weakref.WeakKeyDictionary()
+_native_file_dialogs = True
+
+
+def set_native_file_dialogs(enabled: bool) -> None:
+    """Use the OS file picker (True) or Qt's built-in dialog (False) for shared file dialogs.
+
+    The native picker lists large folders lazily; Qt's own dialog is the
+    fallback for platforms where the native one misbehaves.
+    """
+    global _native_file_dialogs
+    _native_file_dialogs = enabled
+    for dialogs in _file_dialogs.values():
+        for dlg in dialogs.values():
+            dlg.setOption(QFileDialog.Option.DontUseNativeDialog, not enabled)
+
+
+def _shared_file_dialog(parent: QWidget, key: str) -> QFileDialog:
+    """Return the cached QFileDialog for this purpose on parent's window, creating it once."""
+    window = parent.window() or parent
+    dialogs = _file_dialogs.setdefault(window, {})
+    dlg = dialogs.get(key)
+    if dlg is None:
+        dlg = QFileDialog(window)
+        dlg.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
+        dlg.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+        dlg.setOption(QFileDialog.Option.DontUseNativeDialog, not _native_file_dialogs)
+        dialogs[key] = dlg
+    return dlg
+
+
+def get_open_file_names(parent: QWidget, caption: str = "Select Files",
+                        name_filter: str = "All Files (*.*)") -> list:
+    """Shared-dialog replacement for QFileDialog.getOpenFileNames; returns the chosen paths."""
+    dlg = _shared_file_dialog(parent, f"open:{name_filter}")
+    dlg.setWindowTitle(caption)
+    dlg.setFileMode(QFileDialog.FileMode.ExistingFiles)
+    dlg.setOption(QFileDialog.Option.ReadOnly, True)
+    dlg.setNameFilter(name_filter)
+    if dlg.exec():
+        return dlg.selectedFiles()
+    return []
+
+
+def get_existing_directory(parent: QWidget, caption: str = "Select Directory") -> str:
+    """Shared-dialog replacement for QFileDialog.getExistingDirectory; returns '' on cancel."""
+    dlg = _shared_file_dialog(parent, "dir")
+    dlg.setWindowTitle(caption)
+    dlg.setFileMode(QFileDialog.FileMode.Directory)
+    dlg.setOption(QFileDialog.Option.ShowDirsOnly, True)
+    if dlg.exec():
+        selected = dlg.selectedFiles()
+        return selected[0] if selected else ''
+    return ''
+
+
 class DropZone(QFrame):
     """A widget that accepts file drops"""
     files_dropped = pyqtSignal(list)
@@ -47,6 +111,25 @@ class DropZone(QFrame):
         '.tiff', '.tif', '.webp', '.ico', '.svg',
     })
 
+    # One stylesheet for every state; drag events flip the dropState property
+    # instead of handing Qt a new stylesheet to parse on each event.
+    _STYLE = """
+        DropZone {
+            background-color: #f5f5f5;
+            border: 2px dashed #ccc;
+            border-radius: 6px;
+        }
+        DropZone:hover {
+            border-color: #999;
+            background-color: #e8e8e8;
+        }
+        DropZone[dropState="hover"] {
+            background-color: #e3f2fd;
+            border: 2px dashed #2196f3;
+            border-radius: 8px;
+        }
+    """
+
     @classmethod
     def set_skip_image_attachments(cls, enabled: bool) -> None:
         """Enable or disable automatic skipping of image attachments from emails."""
@@ -58,17 +141,8 @@ class DropZone(QFrame):
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Sunken)
         self.setMinimumHeight(60)
         self.setMaximumHeight(100)
-        self.setStyleSheet("""
-            DropZone {
-                background-color: #f5f5f5;
-                border: 2px dashed #ccc;
-                border-radius: 6px;
-            }
-            DropZone:hover {
-                border-color: #999;
-                background-color: #e8e8e8;
-            }
-        """)
+        self.setProperty("dropState", "idle")
+        self.setStyleSheet(self._STYLE)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(3, 3, 3, 3)
@@ -108,45 +182,28 @@ class DropZone(QFrame):
         except Exception:
             return False
 
+    def _set_drop_state(self, state: str):
+        """Switch between the idle and drag-hover looks by re-polishing."""
+        if self.property("dropState") == state:
+            return
+        self.setProperty("dropState", state)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         mime = event.mimeData()
         print(f"[DropZone] dragEnter formats: {mime.formats()}", flush=True)
         if (mime.hasUrls() or self._outlook_descriptor_format(mime)
                 or self._is_classic_outlook(mime) or self._is_new_outlook(mime)):
             event.acceptProposedAction()
-            self.setStyleSheet("""
-                DropZone {
-                    background-color: #e3f2fd;
-                    border: 2px dashed #2196f3;
-                    border-radius: 8px;
-                }
-            """)
+            self._set_drop_state("hover")
 
     def dragLeaveEvent(self, event):
-        self.setStyleSheet("""
-            DropZone {
-                background-color: #f5f5f5;
-                border: 2px dashed #ccc;
-                border-radius: 6px;
-            }
-            DropZone:hover {
-                border-color: #999;
-                background-color: #e8e8e8;
-            }
-        """)
+        self._set_drop_state("idle")
 
     def dropEvent(self, event: QDropEvent):
-        self.setStyleSheet("""
-            DropZone {
-                background-color: #f5f5f5;
-                border: 2px dashed #ccc;
-                border-radius: 6px;
-            }
-            DropZone:hover {
-                border-color: #999;
-                background-color: #e8e8e8;
-            }
-        """)
+        self._set_drop_state("idle")
         mime = event.mimeData()
         print(f"[DropZone] dropEvent formats: {mime.formats()}", flush=True)
 
@@ -776,12 +833,7 @@ class DropZone(QFrame):
         return [msg_path]
 
     def browse_files(self):
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "Select Files",
-            "",
-            "All Files (*.*)"
-        )
+        files = get_open_file_names(self, "Select Files", "All Files (*.*)")
         if files:
             self.files_dropped.emit(files)
 
@@ -797,22 +849,13 @@ class ScrollableMessageDialog(QDialog):
         # Create layout
         layout = QVBoxLayout(self)
 
-        # Create scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-
-        # Create content label
-        content_label = QLabel(content)
-        content_label.setWordWrap(True)
-        content_label.setTextFormat(Qt.TextFormat.RichText)
-        content_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        content_label.setStyleSheet("padding: 10px;")
-
-        # Set label as scroll area widget
-        scroll_area.setWidget(content_label)
-
-        # Add scroll area to layout
-        layout.addWidget(scroll_area)
+        # QTextBrowser lays the document out incrementally and scrolls itself,
+        # unlike a RichText QLabel inside a QScrollArea
+        browser = QTextBrowser()
+        browser.setOpenExternalLinks(True)
+        browser.document().setDocumentMargin(10)  # pyright: ignore[reportOptionalMemberAccess]
+        browser.setHtml(content)
+        layout.addWidget(browser)
 
         # Add OK button
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
@@ -820,6 +863,10 @@ class ScrollableMessageDialog(QDialog):
         layout.addWidget(button_box)
 
 
+# Directory entries JobSearchDialog checks per event-loop pass
+_SEARCH_CHUNK = 200
+
+
 class JobSearchDialog(QDialog):
     """A search dialog for finding and copying job/quote information"""
 
@@ -862,36 +909,60 @@ class JobSearchDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+        # Incremental search state, advanced by _pump_search
+        self._search_iter = None
+        self._search_hits = []
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(0)
+        self._search_timer.timeout.connect(self._pump_search)
+
         # Focus search input
         self.search_input.setFocus()
 
     def perform_search(self):
-        """Search for jobs/quotes matching the search term"""
-        search_term = self.search_input.text().strip().lower()
+        """Search for jobs/quotes matching the search term.
+
+        The scan runs in slices of _SEARCH_CHUNK directory entries on a
+        zero-interval timer so typing stays responsive and partial results
+        paint while a large tree is still being walked.
+        """
+        self._search_timer.stop()
+        self._search_iter = None
+        self._search_hits = []
         self.results_list.clear()
 
+        search_term = self.search_input.text().strip().lower()
         if len(search_term) < 2:
             self.status_label.setText("Enter at least 2 characters...")
             return
 
+        self._search_iter = self._search_candidates(search_term)
+        self.status_label.setText("Searching...")
+        self._search_timer.start()
+
+    def _search_candidates(self, search_term: str):
+        """Walk the customer directories, yielding (display, path) for each
+        match and None for each entry checked without a match."""
         # Get directories to search
         cf_dir = self.app_context.get_setting('customer_files_dir', '')
         itar_cf_dir = self.app_context.get_setting('itar_customer_files_dir', '')
-        quote_folder_path = self.app_context.get_setting('quote_folder_path', 'Quotes')
-
-        results = []
+        quote_folder_lower = self.app_context.get_setting('quote_folder_path', 'Quotes').lower()
 
         # Search both directories
         for base_dir, is_itar in [(cf_dir, False), (itar_cf_dir, True)]:
             if not base_dir or not os.path.exists(base_dir):
                 continue
+            prefix = '[ITAR] ' if is_itar else ''
 
             # Walk through customer directories
             try:
                 for customer_name in os.listdir(base_dir):
                     customer_path = os.path.join(base_dir, customer_name)
                     if not os.path.isdir(customer_path):
+                        yield None
                         continue
+                    customer_match = search_term in customer_name.lower()
 
                     # Search for job folders (in customer root)
                     for item in os.listdir(customer_path):
@@ -901,35 +972,62 @@ class JobSearchDialog(QDialog):
                         job_docs_path = os.path.join(item_path, "job documents")
                         if os.path.isdir(job_docs_path):
                             # This is a job folder
-                            if search_term in item.lower() or search_term in customer_name.lower():
-                                prefix = '[ITAR] ' if is_itar else ''
-                                display = f"{prefix}{customer_name}/{item}"
-                                results.append((display, item_path))
+                            if customer_match or search_term in item.lower():
+                                yield f"{prefix}{customer_name}/{item}", item_path
+                                continue
 
                         # Check if it's the Quotes folder
-                        elif item.lower() == quote_folder_path.lower():
+                        elif item.lower() == quote_folder_lower and os.path.isdir(item_path):
                             # Search inside Quotes folder
-                            quotes_path = item_path
-                            if os.path.isdir(quotes_path):
-                                for quote_item in os.listdir(quotes_path):
-                                    quote_item_path = os.path.join(quotes_path, quote_item)
-                                    if os.path.isdir(quote_item_path):
-                                        # This is a quote folder
-                                        if search_term in quote_item.lower() or search_term in customer_name.lower():
-                                            prefix = '[ITAR] ' if is_itar else ''
-                                            display = f"{prefix}{customer_name}/Quotes/{quote_item}"
-                                            results.append((display, quote_item_path))
+                            for quote_item in os.listdir(item_path):
+                                quote_item_path = os.path.join(item_path, quote_item)
+                                if os.path.isdir(quote_item_path) and (
+                                    customer_match or search_term in quote_item.lower()
+                                ):
+                                    # This is a quote folder
+                                    yield f"{prefix}{customer_name}/Quotes/{quote_item}", quote_item_path
+                                else:
+                                    yield None
+                        yield None
             except OSError:
                 pass
 
-        # Add to list (limit to 100 results)
-        for display_name, full_path in sorted(results)[:100]:
-            item = self.results_list.addItem(display_name)
-            self.results_list.item(self.results_list.count() - 1).setData(
-                Qt.ItemDataRole.UserRole, full_path
-            )
+    def _pump_search(self):
+        """Consume the next slice of the running search and refresh the list."""
+        if self._search_iter is None:
+            return
+        hits = self._search_hits
+        found_before = len(hits)
+        consumed = 0
+        for candidate in itertools.islice(self._search_iter, _SEARCH_CHUNK):
+            consumed += 1
+            if candidate is not None:
+                hits.append(candidate)
+        done = consumed < _SEARCH_CHUNK
+        if done:
+            self._search_iter = None
+        else:
+            self._search_timer.start()
+
+        if len(hits) != found_before:
+            self._show_search_hits()
+        if done:
+            self.status_label.setText(f"Found {len(hits)} result(s)" if hits else "No matches found")
+        else:
+            self.status_label.setText(f"Searching... {len(hits)} found")
 
-        self.status_label.setText(f"Found {len(results)} result(s)" if results else "No matches found")
+    def _show_search_hits(self):
+        """Show the first 100 matches found so far, sorted."""
+        self.results_list.setUpdatesEnabled(False)
+        try:
+            self.results_list.clear()
+            for display_name, full_path in sorted(self._search_hits)[:100]:
+                self.results_list.addItem(display_name)
+                self.results_list.item(self.results_list.count() - 1).setData(
+                    Qt.ItemDataRole.UserRole, full_path
+                )
+        finally:
+            self.results_list.setUpdatesEnabled(True)
 
     def on_item_double_clicked(self, item):
         """Handle double-click on an item"""
@@ -966,9 +1064,12 @@ class FileCopyDialog(QDialog):
         self.file_tree = QTreeWidget()
         self.file_tree.setHeaderLabels(["File", "Size", "Type"])
         self.file_tree.setRootIsDecorated(False)
+        # Fixed widths for the short columns: ResizeToContents re-measures
+        # every row whenever the tree changes
+        self.file_tree.header().setStretchLastSection(False)
         self.file_tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.file_tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        self.file_tree.header().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        self.file_tree.header().resizeSection(1, 90)
+        self.file_tree.header().resizeSection(2, 80)
         layout.addWidget(self.file_tree)
 
         # Populate files
@@ -1022,6 +1123,7 @@ class FileCopyDialog(QDialog):
         # Sort by name
         files_to_show.sort(key=lambda f: f.name.lower())
 
+        items = []
         for file_path in files_to_show:
             item = QTreeWidgetItem()
 
@@ -1055,7 +1157,13 @@ class FileCopyDialog(QDialog):
             # Store full path in data
             item.setData(0, Qt.ItemDataRole.UserRole, str(file_path))
 
-            self.file_tree.addTopLevelItem(item)
+            items.append(item)
+
+        self.file_tree.setUpdatesEnabled(False)
+        try:
+            self.file_tree.addTopLevelItems(items)
+        finally:
+            self.file_tree.setUpdatesEnabled(True)
 
         # Connect check state changes to update status
         self.file_tree.itemChanged.connect(self._update_status)
@@ -1125,9 +1233,10 @@ class DrawingSearchDialog(QDialog):
         self.results_tree = QTreeWidget()
         self.results_tree.setHeaderLabels(["File", "Location", "Type"])
         self.results_tree.setRootIsDecorated(False)
+        self.results_tree.header().setStretchLastSection(False)
         self.results_tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.results_tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.results_tree.header().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        self.results_tree.header().resizeSection(2, 80)
         layout.addWidget(self.results_tree)
 
         # Select All / Select None buttons
@@ -1208,6 +1317,7 @@ class DrawingSearchDialog(QDialog):
         # Add results to tree (limit to 200)
         from shared.utils import classify_document
         _orange = QColor(200, 120, 0)
+        items = []
         for filename, location, file_type, full_path in sorted(results)[:200]:
             is_po_rfq, flag_reason = classify_document(full_path)
             item = QTreeWidgetItem()
@@ -1223,7 +1333,13 @@ class DrawingSearchDialog(QDialog):
                     item.setForeground(col, brush)
                 item.setToolTip(0, f"Flagged as PO/RFQ: {flag_reason}")
                 item.setData(0, Qt.ItemDataRole.UserRole + 1, True)  # flagged_po_rfq
-            self.results_tree.addTopLevelItem(item)
+            items.append(item)
+
+        self.results_tree.setUpdatesEnabled(False)
+        try:
+            self.results_tree.addTopLevelItems(items)
+        finally:
+            self.results_tree.setUpdatesEnabled(True)
 
         if results:
             self.status_label.setText(f"Found {len(results)} file(s)")
@@ -1255,6 +1371,156 @@ class DrawingSearchDialog(QDialog):
         return selected
 
 
+def add_file_list_items(list_widget: QListWidget, files: list, known: list) -> list:
+    """Append files not already in known to known and list_widget.
+
+    The new basenames go in with one addItems call while repaints are off,
+    so dropping a large batch doesn't repaint the list once per file.
+
+    Returns:
+        The newly added paths, in order.
+    """
+    seen = set(known)
+    newly_added = []
+    for f in files:
+        if f not in seen:
+            seen.add(f)
+            newly_added.append(f)
+    if newly_added:
+        known.extend(newly_added)
+        list_widget.setUpdatesEnabled(False)
+        try:
+            list_widget.addItems([os.path.basename(f) for f in newly_added])
+        finally:
+            list_widget.setUpdatesEnabled(True)
+    return newly_added
+
+
+# Item data role holding (name, path) children that haven't been created yet
+_LAZY_CHILDREN_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def add_lazy_tree_item(tree: QTreeWidget, text: str, path: str, children: list) -> QTreeWidgetItem:
+    """Add a top-level item whose (name, path) children are created on first expand.
+
+    Connect the tree's itemExpanded signal to expand_lazy_tree_item. Loading
+    a tree with many customers then creates one item per customer instead of
+    one per job.
+    """
+    item = QTreeWidgetItem([text])
+    item.setData(0, Qt.ItemDataRole.UserRole, path)
+    item.setData(0, _LAZY_CHILDREN_ROLE, children)
+    item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+    tree.addTopLevelItem(item)
+    return item
+
+
+def expand_lazy_tree_item(item: QTreeWidgetItem) -> None:
+    """Create the pending children of an item added by add_lazy_tree_item"""
+    children = item.data(0, _LAZY_CHILDREN_ROLE)
+    if children is None:
+        return
+    item.setData(0, _LAZY_CHILDREN_ROLE, None)
+    child_items = []
+    for name, path in sorted(children):
+        child = QTreeWidgetItem([name])
+        child.setData(0, Qt.ItemDataRole.UserRole, path)
+        child_items.append(child)
+    item.addChildren(child_items)
+    item.setChildIndicatorPolicy(
+        QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
+    )
+
+
+class RowsModel(QAbstractTableModel):
+    """Read-only table model over a list of display-string tuples.
+
+    Rows are plain tuples rather than a QTableWidgetItem per cell, so large
+    result sets cost one tuple per row and the view only asks for visible
+    cells. Each row may carry an arbitrary payload (e.g. the source record),
+    returned for Qt.ItemDataRole.UserRole.
+
+    Rows are handed to the view in batches (canFetchMore/fetchMore), so a
+    reset with thousands of rows only lays out the first batch; the view
+    fetches the rest as it is scrolled to the bottom.
+    """
+
+    # Rows exposed to the view per fetch
+    _FETCH_BATCH = 200
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._rows: list = []
+        self._payloads: list = []
+        self._loaded = 0  # Leading rows the view has been told about
+
+    def set_rows(self, rows, payloads=None):
+        """Replace all rows (payloads, if given, must be the same length)"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._payloads = list(payloads) if payloads is not None else [None] * len(self._rows)
+        self._loaded = min(len(self._rows), self._FETCH_BATCH)
+        self.endResetModel()
+
+    def insert_row(self, position: int, row, payload=None):
+        """Insert a single row at the given position"""
+        self._rows.insert(position, tuple(row))
+        self._payloads.insert(position, payload)
+        # Rows landing past the fetched ones wait for fetchMore; the first
+        # batch fills in directly
+        if position < self._loaded or (position == self._loaded and self._loaded < self._FETCH_BATCH):
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._loaded += 1
+            self.endInsertRows()
+
+    def clear(self):
+        self.set_rows([])
+
+    def rows(self) -> list:
+        """Return every row, including any not fetched into the view yet"""
+        return list(self._rows)
+
+    def payload(self, row: int):
+        """Return the payload stored with a row, or None if out of range"""
+        if 0 <= row < len(self._payloads):
+            return self._payloads[row]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self._FETCH_BATCH, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._payloads[index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
 class FilePreviewWidget(QWidget):
     """Preview panel shown beside a drop-zone file list.
 
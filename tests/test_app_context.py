@@ -0,0 +1,332 @@
+"""Tests for core/app_context.py — directory caches and lookups, run in pytest's tmp_path."""
+
+import os
+import time
+
+import pytest
+
+import core.app_context as app_context
+from core.app_context import (
+    AppContext, dirs_unchanged, forget_job_dirs, list_subdirs, settled_mtime, _list_job_dirs,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches(monkeypatch):
+    """Give each test its own module-level directory caches."""
+    monkeypatch.setattr(app_context, '_subdir_cache', {})
+    monkeypatch.setattr(app_context, '_job_dir_cache', {})
+
+
+def _age(path, seconds=100):
+    """Backdate a directory's mtime so it is outside the settle window."""
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+# ---------------------------------------------------------------------------
+# list_subdirs
+# ---------------------------------------------------------------------------
+
+class TestListSubdirs:
+    def test_lists_only_directories(self, tmp_path):
+        (tmp_path / 'ACME').mkdir()
+        (tmp_path / 'notes.txt').write_text('x')
+        assert list_subdirs(str(tmp_path)) == ('ACME',)
+
+    def test_settled_listing_is_cached(self, tmp_path):
+        (tmp_path / 'ACME').mkdir()
+        _age(tmp_path)
+        assert list_subdirs(str(tmp_path)) == ('ACME',)
+        assert str(tmp_path) in app_context._subdir_cache
+
+    def test_added_subdir_invalidates(self, tmp_path):
+        (tmp_path / 'ACME').mkdir()
+        _age(tmp_path)
+        list_subdirs(str(tmp_path))
+        (tmp_path / 'Beta').mkdir()
+        assert sorted(list_subdirs(str(tmp_path))) == ['ACME', 'Beta']
+
+    def test_removed_subdir_invalidates(self, tmp_path):
+        (tmp_path / 'ACME').mkdir()
+        (tmp_path / 'Beta').mkdir()
+        _age(tmp_path)
+        list_subdirs(str(tmp_path))
+        (tmp_path / 'Beta').rmdir()
+        assert list_subdirs(str(tmp_path)) == ('ACME',)
+
+    def test_recent_listing_not_cached(self, tmp_path):
+        # Within the settle window a second change may not move a coarse
+        # mtime, so the listing must not be trusted yet
+        (tmp_path / 'ACME').mkdir()
+        mtime = os.stat(tmp_path).st_mtime_ns
+        assert list_subdirs(str(tmp_path)) == ('ACME',)
+        assert str(tmp_path) not in app_context._subdir_cache
+
+        (tmp_path / 'Beta').mkdir()
+        os.utime(tmp_path, ns=(mtime, mtime))  # The mtime didn't tick
+        assert sorted(list_subdirs(str(tmp_path))) == ['ACME', 'Beta']
+
+    def test_missing_directory_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            list_subdirs(str(tmp_path / 'missing'))
+
+
+# ---------------------------------------------------------------------------
+# settled_mtime / dirs_unchanged
+# ---------------------------------------------------------------------------
+
+class TestSettledMtime:
+    def test_unchanged_settled_dir(self, tmp_path):
+        _age(tmp_path)
+        assert dirs_unchanged([(str(tmp_path), settled_mtime(str(tmp_path)))])
+
+    def test_change_detected(self, tmp_path):
+        _age(tmp_path)
+        mtimes = [(str(tmp_path), settled_mtime(str(tmp_path)))]
+        (tmp_path / 'ACME').mkdir()
+        assert not dirs_unchanged(mtimes)
+
+    def test_recent_dir_never_unchanged(self, tmp_path):
+        assert settled_mtime(str(tmp_path)) is None
+        assert not dirs_unchanged([(str(tmp_path), None)])
+
+    def test_missing_dir(self, tmp_path):
+        assert settled_mtime(str(tmp_path / 'missing')) is None
+        assert dirs_unchanged([])
+
+
+# ---------------------------------------------------------------------------
+# _list_job_dirs
+# ---------------------------------------------------------------------------
+
+class TestListJobDirs:
+    SUFFIX = 'job documents'
+
+    def _job(self, customer, name, with_docs=True):
+        path = customer / name
+        (path / self.SUFFIX if with_docs else path).mkdir(parents=True)
+        _age(path)
+        return path
+
+    def test_only_jobs_with_suffix(self, tmp_path):
+        self._job(tmp_path, '100_a')
+        self._job(tmp_path, '101_b', with_docs=False)
+        _age(tmp_path)
+        jobs = _list_job_dirs(str(tmp_path), self.SUFFIX)
+        assert jobs == (('100_a', str(tmp_path / '100_a' / self.SUFFIX)),)
+
+    def test_empty_suffix_accepts_every_subdir(self, tmp_path):
+        self._job(tmp_path, '100_a', with_docs=False)
+        _age(tmp_path)
+        assert _list_job_dirs(str(tmp_path), '') == (('100_a', str(tmp_path / '100_a')),)
+
+    def test_settled_listing_is_cached(self, tmp_path):
+        self._job(tmp_path, '100_a')
+        _age(tmp_path)
+        _list_job_dirs(str(tmp_path), self.SUFFIX)
+        assert (str(tmp_path), self.SUFFIX) in app_context._job_dir_cache
+
+    def test_new_job_folder_invalidates(self, tmp_path):
+        self._job(tmp_path, '100_a')
+        _age(tmp_path)
+        _list_job_dirs(str(tmp_path), self.SUFFIX)
+        (tmp_path / '101_b' / self.SUFFIX).mkdir(parents=True)
+        names = sorted(name for name, _ in _list_job_dirs(str(tmp_path), self.SUFFIX))
+        assert names == ['100_a', '101_b']
+
+    def test_removed_job_folder_invalidates(self, tmp_path):
+        self._job(tmp_path, '100_a')
+        self._job(tmp_path, '101_b')
+        _age(tmp_path)
+        _list_job_dirs(str(tmp_path), self.SUFFIX)
+        (tmp_path / '101_b' / self.SUFFIX).rmdir()
+        (tmp_path / '101_b').rmdir()
+        assert [name for name, _ in _list_job_dirs(str(tmp_path), self.SUFFIX)] == ['100_a']
+
+    def test_suffix_added_to_pending_folder_invalidates(self, tmp_path):
+        # Creating the suffix inside an existing folder leaves the customer
+        # folder's mtime alone; the pending folder's own mtime catches it
+        self._job(tmp_path, '100_a')
+        self._job(tmp_path, '101_b', with_docs=False)
+        _age(tmp_path)
+        _list_job_dirs(str(tmp_path), self.SUFFIX)
+        assert (str(tmp_path), self.SUFFIX) in app_context._job_dir_cache
+
+        customer_mtime = os.stat(tmp_path).st_mtime_ns
+        (tmp_path / '101_b' / self.SUFFIX).mkdir()
+        assert os.stat(tmp_path).st_mtime_ns == customer_mtime
+        names = sorted(name for name, _ in _list_job_dirs(str(tmp_path), self.SUFFIX))
+        assert names == ['100_a', '101_b']
+
+    def test_suffix_removed_from_job_folder_invalidates(self, tmp_path):
+        self._job(tmp_path, '100_a')
+        job = self._job(tmp_path, '101_b')
+        _age(tmp_path)
+        _list_job_dirs(str(tmp_path), self.SUFFIX)
+        assert (str(tmp_path), self.SUFFIX) in app_context._job_dir_cache
+
+        customer_mtime = os.stat(tmp_path).st_mtime_ns
+        (job / self.SUFFIX).rmdir()
+        assert os.stat(tmp_path).st_mtime_ns == customer_mtime
+        assert [name for name, _ in _list_job_dirs(str(tmp_path), self.SUFFIX)] == ['100_a']
+
+    def test_recent_pending_folder_not_cached(self, tmp_path):
+        self._job(tmp_path, '100_a')
+        (tmp_path / '101_b').mkdir()  # Fresh mtime, still in the settle window
+        _age(tmp_path)
+        _list_job_dirs(str(tmp_path), self.SUFFIX)
+        assert (str(tmp_path), self.SUFFIX) not in app_context._job_dir_cache
+
+    def test_recent_customer_folder_not_cached(self, tmp_path):
+        self._job(tmp_path, '100_a')
+        mtime = os.stat(tmp_path).st_mtime_ns
+        _list_job_dirs(str(tmp_path), self.SUFFIX)
+        assert (str(tmp_path), self.SUFFIX) not in app_context._job_dir_cache
+
+        (tmp_path / '101_b' / self.SUFFIX).mkdir(parents=True)
+        os.utime(tmp_path, ns=(mtime, mtime))  # The mtime didn't tick
+        assert len(_list_job_dirs(str(tmp_path), self.SUFFIX)) == 2
+
+
+class TestForgetJobDirs:
+    def test_drops_listings_above_the_path(self, tmp_path):
+        other = tmp_path / 'Beta'
+        for customer in (tmp_path / 'Acme', other):
+            (customer / '100_a' / 'job documents').mkdir(parents=True)
+            _age(customer / '100_a')
+            _age(customer)
+            _list_job_dirs(str(customer), 'job documents')
+        forget_job_dirs(str(tmp_path / 'Acme' / '101_b' / 'job documents'))
+        assert list(app_context._job_dir_cache) == [(str(other), 'job documents')]
+
+    def test_sibling_with_shared_prefix_kept(self, tmp_path):
+        (tmp_path / 'Acme' / '100_a').mkdir(parents=True)
+        _age(tmp_path / 'Acme' / '100_a')
+        _age(tmp_path / 'Acme')
+        _list_job_dirs(str(tmp_path / 'Acme'), '')
+        forget_job_dirs(str(tmp_path / 'Acme2' / '100_a'))
+        assert (str(tmp_path / 'Acme'), '') in app_context._job_dir_cache
+
+
+# ---------------------------------------------------------------------------
+# AppContext.find_history_job / scan_existing_jobs
+# ---------------------------------------------------------------------------
+
+def _make_context(settings=None, history=None):
+    """AppContext whose add_to_history inserts newest-first, like the main window."""
+    history = history if history is not None else {'recent_jobs': []}
+
+    def add_to_history(entry_type, data):
+        history.setdefault('recent_jobs', []).insert(0, data)
+
+    noop = lambda *args: None  # noqa: E731
+    return AppContext(
+        settings or {}, history, None, noop, noop, noop, noop, noop,
+        lambda: [], add_to_history,
+    )
+
+
+class TestFindHistoryJob:
+    def test_hit_is_case_insensitive(self):
+        ctx = _make_context(history={'recent_jobs': [{'job_number': 'A100', 'customer': 'Acme'}]})
+        assert ctx.find_history_job('a100')['customer'] == 'Acme'
+
+    def test_miss(self):
+        ctx = _make_context(history={'recent_jobs': [{'job_number': '100'}]})
+        assert ctx.find_history_job('101') is None
+
+    def test_newest_entry_wins(self):
+        ctx = _make_context(history={'recent_jobs': [
+            {'job_number': '100', 'customer': 'New'},
+            {'job_number': '100', 'customer': 'Old'},
+        ]})
+        assert ctx.find_history_job('100')['customer'] == 'New'
+
+    def test_rebuilt_after_add_to_history(self):
+        ctx = _make_context(history={'recent_jobs': [{'job_number': '100'}]})
+        assert ctx.find_history_job('101') is None
+        ctx.add_to_history('job', {'job_number': '101', 'customer': 'Beta'})
+        assert ctx.find_history_job('101')['customer'] == 'Beta'
+
+    def test_rebuilt_when_capped_list_keeps_its_length(self):
+        # At the history cap a new job is inserted and the oldest trimmed,
+        # so only the first entry changes
+        jobs = [{'job_number': str(n)} for n in range(3)]
+        ctx = _make_context(history={'recent_jobs': jobs})
+        assert ctx.find_history_job('2') is not None
+        jobs.insert(0, {'job_number': '9'})
+        del jobs[3:]
+        assert ctx.find_history_job('9') is not None
+        assert ctx.find_history_job('2') is None
+
+    def test_rebuilt_after_clear_history(self):
+        history = {'recent_jobs': [{'job_number': '100'}]}
+        ctx = _make_context(history=history)
+        assert ctx.find_history_job('100') is not None
+        # The history tab clears by replacing the list
+        history['recent_jobs'] = []
+        assert ctx.find_history_job('100') is None
+        ctx.add_to_history('job', {'job_number': '100', 'customer': 'Again'})
+        assert ctx.find_history_job('100')['customer'] == 'Again'
+
+
+class TestShutdown:
+    def test_stops_scan_threads_and_restarts_on_demand(self, tmp_path):
+        (tmp_path / 'Acme' / '100_x' / 'job documents').mkdir(parents=True)
+        ctx = _make_context()
+        assert [len(jobs) for jobs in ctx.map_job_folders([str(tmp_path / 'Acme')])] == [1]
+        pool = ctx._scan_pool
+        ctx.shutdown()
+        assert ctx._scan_pool is None
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
+        assert [len(jobs) for jobs in ctx.map_job_folders([str(tmp_path / 'Acme')])] == [1]
+        ctx.shutdown()
+
+    def test_without_scans(self):
+        _make_context().shutdown()
+
+
+class TestScanExistingJobs:
+    @staticmethod
+    def _job(cf_dir, customer, name):
+        (cf_dir / customer / name / 'job documents').mkdir(parents=True)
+
+    def test_maps_job_numbers_to_customer_and_folder(self, tmp_path):
+        self._job(tmp_path, 'Acme', 'A100_Bracket')
+        self._job(tmp_path, 'Beta', '200')
+        ctx = _make_context(settings={'customer_files_dir': str(tmp_path)})
+        existing = ctx.scan_existing_jobs()
+        assert existing == {'a100': ('Acme', 'A100_Bracket'), '200': ('Beta', '200')}
+
+    def test_miss_and_folders_without_docs(self, tmp_path):
+        self._job(tmp_path, 'Acme', '100_x')
+        (tmp_path / 'Acme' / '101_no_docs').mkdir()
+        ctx = _make_context(settings={'customer_files_dir': str(tmp_path)})
+        existing = ctx.scan_existing_jobs()
+        assert '100' in existing
+        assert '101' not in existing
+        assert '999' not in existing
+
+    def test_includes_itar_dir(self, tmp_path):
+        standard, itar = tmp_path / 'cf', tmp_path / 'itar'
+        self._job(standard, 'Acme', '100_x')
+        self._job(itar, 'Secret', '300_y')
+        ctx = _make_context(settings={
+            'customer_files_dir': str(standard),
+            'itar_customer_files_dir': str(itar),
+        })
+        assert ctx.scan_existing_jobs() == {'100': ('Acme', '100_x'), '300': ('Secret', '300_y')}
+
+    def test_unconfigured_or_missing_dirs(self, tmp_path):
+        assert _make_context().scan_existing_jobs() == {}
+        ctx = _make_context(settings={'customer_files_dir': str(tmp_path / 'missing')})
+        assert ctx.scan_existing_jobs() == {}
+
+    def test_sees_job_created_after_previous_scan(self, tmp_path):
+        self._job(tmp_path, 'Acme', '100_x')
+        ctx = _make_context(settings={'customer_files_dir': str(tmp_path)})
+        assert '101' not in ctx.scan_existing_jobs()
+        self._job(tmp_path, 'Acme', '101_y')
+        assert ctx.scan_existing_jobs()['101'] == ('Acme', '101_y')
@@ -0,0 +1,52 @@
+"""Tests for core/search_index.py — folder-name parsing (pure functions only)."""
+
+import pytest
+
+from core.search_index import leading_job_number, _parse_job_folder
+
+
+# ---------------------------------------------------------------------------
+# _parse_job_folder
+# ---------------------------------------------------------------------------
+
+class TestParseJobFolder:
+    @pytest.mark.parametrize('name, expected', [
+        # Plain job number
+        ('12345', ('12345', '', [])),
+        ('12345_', ('12345', '', [])),
+        # Number plus description
+        ('12345_Bracket', ('12345', 'Bracket', [])),
+        ('12345_Widget Assembly', ('12345', 'Widget Assembly', [])),
+        # Multiple underscores: joined with spaces unless the last part has drawings
+        ('12345_Bracket_Assembly', ('12345', 'Bracket Assembly', [])),
+        ('12345_Bracket_Left_A-B', ('12345', 'Bracket Left', ['A', 'B'])),
+        ('12345_Bracket_DWG-100-DWG-200', ('12345', 'Bracket', ['DWG', '100', 'DWG', '200'])),
+        ('12345_Bracket_ - A - ', ('12345', 'Bracket', ['A'])),
+        # A dash with no underscore before it is description, not drawings
+        ('12345_DWG-1', ('12345', 'DWG-1', [])),
+        # Free-form separators after the number
+        ('12345 Bracket Assembly', ('12345', 'Bracket Assembly', [])),
+        ('12345-Shaft', ('12345', 'Shaft', [])),
+        # No leading digits: the whole name is the description
+        ('Bracket Assembly', ('', 'Bracket Assembly', [])),
+        ('Q100_x', ('', 'Q100_x', [])),
+        ('_12345', ('', '_12345', [])),
+    ])
+    def test_parse(self, name, expected):
+        assert _parse_job_folder(name) == expected
+
+
+# ---------------------------------------------------------------------------
+# leading_job_number
+# ---------------------------------------------------------------------------
+
+class TestLeadingJobNumber:
+    @pytest.mark.parametrize('name, expected', [
+        ('12345 Bracket', '12345'),
+        ('12345-Shaft', '12345'),
+        ('007', '007'),
+        ('Q100_x', ''),
+        ('', ''),
+    ])
+    def test_leading_job_number(self, name, expected):
+        assert leading_job_number(name) == expected
@@ -1,11 +1,20 @@
-"""Tests for shared/utils.py — pure functions only (no Qt, no filesystem side-effects)."""
+"""Tests for shared/utils.py — no Qt; file helpers only touch pytest's tmp_path."""
 
+import json
+import os
+
+import pytest
+
+import shared.utils as utils
 from shared.utils import (
     is_blueprint_file,
     parse_job_numbers,
     sanitize_filename,
     get_os_text,
     get_next_number,
+    fast_copy,
+    dump_json,
+    load_json,
 )
 
 
@@ -31,6 +40,10 @@ class TestIsBlueprintFile:
     def test_empty_extensions_list(self):
         assert is_blueprint_file('drawing.pdf', []) is False
 
+    def test_frozenset_extensions(self):
+        assert is_blueprint_file('DRAWING.DWG', frozenset(self.EXTS)) is True
+        assert is_blueprint_file('photo.jpg', frozenset(self.EXTS)) is False
+
 
 # ---------------------------------------------------------------------------
 # parse_job_numbers
@@ -60,6 +73,13 @@ class TestParseJobNumbers:
         result = parse_job_numbers('ABC')
         assert result == ['ABC']
 
+    def test_huge_range_rejected(self):
+        with pytest.raises(ValueError, match='1-1000000'):
+            parse_job_numbers('1-1000000,7')
+
+    def test_range_at_limit_expands(self):
+        assert len(parse_job_numbers('1-100000')) == 100_000
+
 
 # ---------------------------------------------------------------------------
 # sanitize_filename
@@ -124,3 +144,100 @@ class TestGetNextNumber:
 
     def test_unknown_type_returns_start(self):
         assert get_next_number({}, 'unknown') == '10000'
+
+
+# ---------------------------------------------------------------------------
+# fast_copy
+# ---------------------------------------------------------------------------
+
+class TestFastCopy:
+    def test_copies_data(self, tmp_path):
+        src = tmp_path / 'a.pdf'
+        src.write_bytes(b'drawing data')
+        dst = tmp_path / 'b.pdf'
+        fast_copy(str(src), str(dst))
+        assert dst.read_bytes() == b'drawing data'
+
+    def test_zero_copy_file_range_falls_back(self, tmp_path, monkeypatch):
+        # Some filesystems answer copy_file_range with 0 instead of an error
+        calls = []
+
+        def no_progress(in_fd, out_fd, count):
+            calls.append(count)
+            return 0
+
+        monkeypatch.setattr(os, 'copy_file_range', no_progress, raising=False)
+        src = tmp_path / 'a.pdf'
+        src.write_bytes(b'x' * 1000)
+        dst = tmp_path / 'b.pdf'
+        fast_copy(str(src), str(dst))
+        assert calls
+        assert dst.read_bytes() == b'x' * 1000
+
+    def test_partial_copy_file_range_is_redone(self, tmp_path, monkeypatch):
+        def stalls_after_first_chunk(in_fd, out_fd, count):
+            if os.fstat(out_fd).st_size:
+                return 0
+            return os.write(out_fd, os.read(in_fd, 10))
+
+        monkeypatch.setattr(os, 'copy_file_range', stalls_after_first_chunk, raising=False)
+        src = tmp_path / 'a.pdf'
+        src.write_bytes(bytes(range(256)) * 4)
+        dst = tmp_path / 'b.pdf'
+        fast_copy(str(src), str(dst))
+        assert dst.read_bytes() == bytes(range(256)) * 4
+
+
+# ---------------------------------------------------------------------------
+# dump_json / load_json
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(params=['orjson', 'json'])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(utils, 'orjson', None)
+    return request.param
+
+
+class TestJsonRoundTrip:
+    def test_round_trip(self, tmp_path, json_backend):
+        path = tmp_path / 'history.json'
+        data = {'recent_jobs': [{'job_number': '10001', 'customer': 'Acme Café'}], 'count': 3}
+        dump_json(path, data)
+        assert load_json(path) == data
+
+    def test_compact_round_trip(self, tmp_path, json_backend):
+        path = tmp_path / 'history.json'
+        data = {'a': [1, 2], 'b': None}
+        dump_json(path, data, compact=True)
+        assert b' ' not in path.read_bytes()
+        assert load_json(path) == data
+
+    def test_frozenset_written_as_sorted_list(self, tmp_path, json_backend):
+        path = tmp_path / 'settings.json'
+        dump_json(path, {'blueprint_extensions': frozenset({'.pdf', '.dxf', '.dwg'})})
+        assert load_json(path) == {'blueprint_extensions': ['.dwg', '.dxf', '.pdf']}
+
+    def test_overwrite_leaves_no_tmp_file(self, tmp_path, json_backend):
+        path = tmp_path / 'settings.json'
+        dump_json(path, {'v': 1})
+        dump_json(path, {'v': 2})
+        assert load_json(path) == {'v': 2}
+        assert os.listdir(tmp_path) == ['settings.json']
+
+    def test_failed_write_keeps_old_file(self, tmp_path, json_backend):
+        path = tmp_path / 'settings.json'
+        dump_json(path, {'v': 1})
+        with pytest.raises(TypeError):
+            dump_json(path, {'v': object()})
+        assert load_json(path) == {'v': 1}
+        assert os.listdir(tmp_path) == ['settings.json']
+
+    def test_invalid_json_raises_decode_error(self, tmp_path, json_backend):
+        path = tmp_path / 'settings.json'
+        path.write_text('{not json')
+        with pytest.raises(json.JSONDecodeError):
+            load_json(path)